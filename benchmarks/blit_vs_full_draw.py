@@ -0,0 +1,132 @@
+"""Порівняння часу кадру: перебудова фігури, повне перемальовування та blit.
+
+Запуск з кореня репозиторію:  python benchmarks/blit_vs_full_draw.py [кадрів]
+
+Сцена повторює тренажер додавання (main.py): три круги з роздільниками й заголовками
+з mathtext. Малювання йде на Agg-полотні без вікна, тому цифри показують лише витрати
+matplotlib; у Tk до повного малювання ще додається копіювання всього зображення у вікно.
+"""
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fraction_ui.blit import BlitManager
+from fraction_ui.layout import reset_subplot_layout
+from fraction_ui.pies import PieArtist, pie_sizes, prepare_pie_axes, reset_pie_limits
+
+COLORS = ['deepskyblue', 'salmon']
+EMPTY = '#E0E0E0'
+
+
+def random_states(count, seed=0):
+    """Як при перетягуванні повзунка: за кадр змінюється лише один чисельник."""
+    rng = random.Random(seed)
+    n1, n2, den = 1, 1, 12
+    states = []
+    for i in range(count):
+        if i % 20 == 19:
+            den = rng.choice([4, 6, 8, 12, 20, 30])
+            n1, n2 = min(n1, den), min(n2, den)
+        elif rng.random() < 0.5:
+            n1 = min(max(n1 + rng.choice([-1, 1]), 0), den)
+        else:
+            n2 = min(max(n2 + rng.choice([-1, 1]), 0), den)
+        states.append((n1, n2, den))
+    return states
+
+
+def pies_for(state):
+    n1, n2, den = state
+    return [([n1], COLORS[:1], den, f"Перший дріб\n$\\frac{{{n1}}}{{{den}}}$"),
+            ([n2], COLORS[1:], den, f"Другий дріб\n$\\frac{{{n2}}}{{{den}}}$"),
+            ([n1, n2], COLORS, den, f"Сума\n$\\frac{{{n1 + n2}}}{{{den}}}$")]
+
+
+def make_canvas():
+    return FigureCanvasAgg(Figure(figsize=(14, 6), dpi=90))
+
+
+def run_rebuild(states):
+    """Як було до retained mode: figure.clear() і ax.pie на кожен кадр."""
+    canvas = make_canvas()
+    figure = canvas.figure
+    times = []
+    for state in states:
+        start = time.perf_counter()
+        figure.clear()
+        for i, (numerators, colors, den, title) in enumerate(pies_for(state)):
+            ax = figure.add_subplot(1, 3, i + 1)
+            ax.set_title(title, pad=25, fontsize=26)
+            ax.axis('equal')
+            sizes, final_colors = pie_sizes(numerators, colors, den, EMPTY)
+            ax.pie(sizes, colors=final_colors, startangle=90, counterclock=False,
+                   wedgeprops={'edgecolor': 'black', 'linewidth': 1})
+            for k in range(den):
+                angle = np.deg2rad(90 - k * (360.0 / den))
+                ax.plot([0, np.cos(angle)], [0, np.sin(angle)], color='black', lw=0.7, alpha=0.6)
+        figure.tight_layout(pad=2.0)
+        canvas.draw()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_retained(states, blit):
+    canvas = make_canvas()
+    figure = canvas.figure
+    blitter = BlitManager(canvas, enabled=blit)
+    axes, pies = [], []
+    for i in range(3):
+        ax = figure.add_subplot(1, 3, i + 1)
+        prepare_pie_axes(ax)
+        ax.set_title("", pad=25, fontsize=26)
+        axes.append(ax)
+        pies.append(PieArtist(ax, empty_color=EMPTY, divider_limit=40))
+        blitter.register(ax)
+
+    times = []
+    for state in states:
+        start = time.perf_counter()
+        for ax, pie, (numerators, colors, den, title) in zip(axes, pies, pies_for(state)):
+            ax.title.set_text(title)
+            pie.update(numerators, colors, den)
+            reset_pie_limits(ax)
+        reset_subplot_layout(figure)
+        figure.tight_layout(pad=2.0)
+        blitter.update()
+        times.append(time.perf_counter() - start)
+    return times, blitter
+
+
+def report(name, times):
+    ms = sorted(t * 1000 for t in times)
+    p95 = ms[int(0.95 * (len(ms) - 1))]
+    print(f"{name:<28} середнє {statistics.mean(ms):7.1f} мс   медіана {statistics.median(ms):7.1f} мс   "
+          f"p95 {p95:7.1f} мс")
+
+
+def main():
+    # ax.axis('equal') з фіксованими межами щокадру попереджає про datalim, як і в самих тренажерах
+    logging.getLogger('matplotlib.axes._base').setLevel(logging.ERROR)
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    states = random_states(frames)
+
+    report("перебудова (figure.clear)", run_rebuild(states))
+    times, _ = run_retained(states, blit=False)
+    report("retained + canvas.draw", times)
+    times, blitter = run_retained(states, blit=True)
+    report("retained + blit", times)
+    print(f"  повних малювань: {blitter.full_draws}, кадрів через blit: {blitter.blits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Фігури для бенчмарків малювання: ті самі осі, круги й кадри, що й у тренажерах, але на Agg без вікна."""
+import logging
+from types import SimpleNamespace
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from fraction_ui.atlas import make_pie
+from fraction_ui.blit import BlitManager
+from fraction_ui.frame import FrameManager
+from fraction_ui.layout import LayoutCache
+from fraction_ui.pies import PiePool, prepare_pie_axes
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_plotting():
+    """Без повідомлень matplotlib про межі осей, які круги виставляють свідомо."""
+    logging.getLogger("matplotlib").setLevel(logging.ERROR)
+
+
+def _frames(figure, **tight_kwargs):
+    canvas = FigureCanvasAgg(figure)
+    blitter = BlitManager(canvas)
+    layout = LayoutCache(figure, **tight_kwargs)
+    return canvas, blitter, layout, FrameManager(blitter, layout)
+
+
+@pytest.fixture
+def pair_figure():
+    """Фігура тренажерів на два дроби (main.py): три осі з кругом, заголовком і підписом значення."""
+    figure = Figure(figsize=(14, 6), dpi=90)
+    canvas, blitter, layout, frames = _frames(figure, pad=2.0, h_pad=4.0)
+    axes, pies, values = [], [], []
+    for spec in figure.add_gridspec(1, 3):
+        ax = figure.add_subplot(spec)
+        prepare_pie_axes(ax)
+        ax.set_title("", pad=25, fontsize=26)
+        blitter.register(ax)
+        axes.append(ax)
+        pies.append(make_pie(ax, divider_limit=40))
+        values.append(ax.text(0, -1.4, "", ha='center', va='center', fontsize=18, color='gray'))
+    return SimpleNamespace(figure=figure, canvas=canvas, blitter=blitter, layout=layout, frames=frames,
+                           axes=axes, pies=pies, values=values)
+
+
+@pytest.fixture
+def mixed_figure():
+    """Фігура тренажерів мішаних чисел (dodav drob 2lvl.py): рядок заголовків і три осі з рядами кіл."""
+    figure = Figure(figsize=(14, 6), dpi=90)
+    canvas, blitter, layout, frames = _frames(figure, pad=2.0)
+    grid = figure.add_gridspec(2, 3, height_ratios=[1, 9], hspace=0.1)
+    title_axes = [figure.add_subplot(grid[0, i], facecolor='none') for i in range(3)]
+    for ax in title_axes:
+        ax.axis('off')
+        ax.set_title("", fontsize=18)
+    circle_axes = [figure.add_subplot(grid[1, i]) for i in range(3)]
+    pools = []
+    for ax in circle_axes:
+        ax.axis('off')
+        ax.set_aspect('equal', adjustable='box')
+        pools.append(PiePool(ax, factory=make_pie, max_wedges=2, wedgeprops={'linewidth': 0.8}))
+    for ax in (*title_axes, *circle_axes):
+        blitter.register(ax)
+    return SimpleNamespace(figure=figure, canvas=canvas, blitter=blitter, layout=layout, frames=frames,
+                           title_axes=title_axes, circle_axes=circle_axes, pools=pools)
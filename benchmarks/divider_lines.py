@@ -0,0 +1,85 @@
+"""Роздільники секторів: окремі ax.plot проти однієї LineCollection на круг.
+
+Запуск з кореня репозиторію:  python benchmarks/divider_lines.py [повторів]
+
+Дві сцени: три круги зі знаменником 40 (як у main.py) і перетворювач мішаних чисел
+з шістьма кругами зі знаменником 20 на одних осях (як у "mix to neprav drib.py").
+Для кожної сцени друкується кількість художників на осях і час побудови та малювання кадру.
+"""
+import os
+import statistics
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fraction_ui.pies import PiePool
+
+SCENES = {
+    # назва: (кількість осей, кругів на осях, знаменник, радіус)
+    "main.py, 3 x 1/40": (3, 1, 40, 1.0),
+    "конвертер, 6 кругів 1/20": (2, 6, 20, 0.9 / 12),
+}
+
+
+def pie_layout(pies, den, radius):
+    if pies == 1:
+        return [((0, 0), radius)]
+    return [(((2 * i + 1) / (2 * pies), 0.5), radius) for i in range(pies)]
+
+
+def draw_loop(ax, layout, den):
+    """Колишній спосіб: по одному Line2D на кожен роздільник."""
+    for (cx, cy), radius in layout:
+        for i in range(den):
+            angle = np.deg2rad(90 - i * (360.0 / den))
+            ax.plot([cx, cx + radius * np.cos(angle)], [cy, cy + radius * np.sin(angle)],
+                    color='black', lw=0.7, alpha=0.6)
+
+
+def run(scene, mode, repeats):
+    n_axes, pies, den, radius = SCENES[scene]
+    layout = pie_layout(pies, den, radius)
+    canvas = FigureCanvasAgg(Figure(figsize=(12, 6), dpi=90))
+    figure = canvas.figure
+    axes = [figure.add_subplot(1, n_axes, i + 1) for i in range(n_axes)]
+    # Сектори однакові в обох режимах, різняться лише роздільники
+    divider_limit = None if mode == "ax.plot" else 40
+    pools = [PiePool(ax, max_wedges=2, divider_limit=divider_limit) for ax in axes]
+
+    times = []
+    for frame in range(repeats):
+        # Чисельник змінюється щокадру, знаменник — через кадр, щоб роздільники перебудовувалися
+        frame_den = den if frame % 2 else den // 2
+        start = time.perf_counter()
+        for ax, pool in zip(axes, pools):
+            pool.show(([frame % frame_den + 1], ['salmon'], frame_den, center, r) for center, r in layout)
+            if mode == "ax.plot":
+                for line in list(ax.lines):
+                    line.remove()
+                draw_loop(ax, layout, frame_den)
+        canvas.draw()
+        times.append(time.perf_counter() - start)
+
+    artists = sum(len(ax.lines) + len(ax.collections) for ax in axes)
+    return artists, times
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    for scene in SCENES:
+        print(scene)
+        for mode in ("ax.plot", "LineCollection"):
+            artists, times = run(scene, mode, repeats)
+            ms = [t * 1000 for t in times]
+            print(f"  {mode:<15} художників-роздільників: {artists:4d}   "
+                  f"кадр: медіана {statistics.median(ms):6.1f} мс, середнє {statistics.mean(ms):6.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Пам'ять: усі тренажери в одному процесі (launcher.py) проти окремого процесу на кожен.
+
+Запуск з кореня репозиторію (потрібен дисплей):  python benchmarks/launcher_memory.py
+
+Кожне вимірювання — окремий процес Python, який відкриває тренажери, чекає, поки в кожного
+з'явиться фігура й пройде перший кадр, і друкує свою резидентну пам'ять. Для окремих процесів
+пам'ять сумується, як її бачить учитель із кількома відкритими темами.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from launcher import TRAINERS
+
+SETTLE_MS = 500
+
+CHILD = r"""
+import sys
+sys.path.insert(0, sys.argv[1])
+from fraction_ui.host import resident_memory_mb
+from launcher import LauncherApp, trainer_class
+
+indexes = [int(i) for i in sys.argv[2].split(",")]
+if len(indexes) == 1:
+    windows = [trainer_class(indexes[0])()]
+    root = windows[0].master
+else:
+    root = LauncherApp()
+    windows = [root.open_trainer(i) for i in indexes]
+
+def report():
+    print(resident_memory_mb())
+    root.destroy()
+
+def wait():
+    if all(window.figure is not None for window in windows):
+        root.after(int(sys.argv[3]), report)
+    else:
+        root.after(20, wait)
+
+root.after(20, wait)
+root.mainloop()
+"""
+
+
+def measure(indexes):
+    result = subprocess.run([sys.executable, "-c", CHILD, ROOT, ",".join(map(str, indexes)), str(SETTLE_MS)],
+                            capture_output=True, text=True, cwd=ROOT)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode or not lines:
+        raise RuntimeError(result.stderr.strip() or "дочірній процес нічого не надрукував")
+    return float(lines[-1])
+
+
+def main():
+    separate = []
+    for index, (title, _, _) in enumerate(TRAINERS):
+        separate.append(measure([index]))
+        print(f"  {title:<34} {separate[-1]:7.0f} МБ")
+    shared = measure(list(range(len(TRAINERS))))
+    total = sum(separate)
+    print(f"Окремі процеси разом:  {total:7.0f} МБ")
+    print(f"Один процес launcher:  {shared:7.0f} МБ  ({shared / total:.0%} від окремих)")
+
+
+if __name__ == "__main__":
+    main()
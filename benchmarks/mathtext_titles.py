@@ -0,0 +1,68 @@
+"""Заголовки з mathtext через TitleCache: скільки заголовків справді змінюється і час кадру.
+
+Запуск з кореня репозиторію:  python benchmarks/mathtext_titles.py [кадрів]
+
+Сцена — три заголовки тренажера додавання (main.py), повзунки ходять туди-сюди, як у
+blit_vs_full_draw.py: за кадр змінюється один чисельник, тож здебільшого змінюються два
+заголовки з трьох. Кожен кадр — title_cache.set трьох заголовків, tight_layout і показ
+через BlitManager, з blit і без нього.
+"""
+import os
+import statistics
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blit_vs_full_draw import random_states
+from fraction_ui.blit import BlitManager
+from fraction_ui.layout import reset_subplot_layout
+from fraction_ui.mathtext import TitleCache
+
+
+def titles_for(state):
+    n1, n2, den = state
+    return [f"Перший дріб\n$\\frac{{{n1}}}{{{den}}}$",
+            f"Другий дріб\n$\\frac{{{n2}}}{{{den}}}$",
+            f"Сума\n$\\frac{{{n1}}}{{{den}}} + \\frac{{{n2}}}{{{den}}} = \\frac{{{n1 + n2}}}{{{den}}}$"]
+
+
+def run(states, blit):
+    canvas = FigureCanvasAgg(Figure(figsize=(14, 6), dpi=90))
+    figure = canvas.figure
+    blitter = BlitManager(canvas, enabled=blit)
+    cache = TitleCache()
+    axes = [figure.add_subplot(1, 3, i + 1) for i in range(3)]
+    for ax in axes:
+        ax.set_axis_off()
+        ax.set_title("", pad=25, fontsize=26)
+        blitter.register(ax)
+
+    times = []
+    for state in states:
+        start = time.perf_counter()
+        for ax, title in zip(axes, titles_for(state)):
+            cache.set(ax.title, title)
+        reset_subplot_layout(figure)
+        figure.tight_layout(pad=2.0)
+        blitter.update()
+        times.append((time.perf_counter() - start) * 1000)
+    return times, cache
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    states = random_states(frames)
+    print(f"{frames} кадрів, {len({t for s in states for t in titles_for(s)})} різних заголовків")
+    for name, blit in (("повне малювання", False), ("blit", True)):
+        times, cache = run(states, blit)
+        print(f"  {name + ':':<17} кадр медіана {statistics.median(times):6.1f} мс, "
+              f"середнє {statistics.mean(times):6.1f} мс; {cache.summary()}")
+
+
+if __name__ == "__main__":
+    main()
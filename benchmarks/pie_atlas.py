@@ -0,0 +1,94 @@
+"""Атлас спрайтів кругів: холодні та теплі часи, пам'ять і час кадру.
+
+Запуск з кореня репозиторію:  python benchmarks/pie_atlas.py [розмір спрайта в пікселях]
+
+Холодний — перша растеризація круга, диск — читання .npz з теки кешу (як при наступному
+запуску з FRACTIONS_ATLAS_DIR), теплий — спрайт уже в пам'яті. Далі порівнюється час кадру
+сцени з main.py (три круги, лише оновлення + canvas.draw) з векторними секторами та з атласом.
+"""
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fraction_ui.atlas import AtlasPie, PieAtlas
+from fraction_ui.pies import PieArtist, prepare_pie_axes, reset_pie_limits
+
+COLOR = 'deepskyblue'
+EMPTY = '#E0E0E0'
+
+
+def all_fractions():
+    return [((n,), (COLOR,), d) for d in range(2, 41) for n in range(d + 1)]
+
+
+def per_sprite_ms(atlas, fractions):
+    start = time.perf_counter()
+    for key in fractions:
+        atlas.sprite(*key)
+    return (time.perf_counter() - start) * 1000 / len(fractions)
+
+
+def frame_times(use_atlas, atlas, frames=60):
+    canvas = FigureCanvasAgg(Figure(figsize=(14, 6), dpi=90))
+    pies = []
+    for i in range(3):
+        ax = canvas.figure.add_subplot(1, 3, i + 1)
+        prepare_pie_axes(ax)
+        if use_atlas:
+            pies.append((ax, AtlasPie(ax, atlas, empty_color=EMPTY, divider_limit=40)))
+        else:
+            pies.append((ax, PieArtist(ax, empty_color=EMPTY, divider_limit=40)))
+
+    rng = random.Random(0)
+    times = []
+    for _ in range(frames):
+        den = rng.randint(2, 40)
+        start = time.perf_counter()
+        for ax, pie in pies:
+            pie.update([rng.randint(0, den)], [COLOR], den)
+            reset_pie_limits(ax)
+        canvas.draw()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    # ax.axis('equal') з фіксованими межами щокадру попереджає про datalim, як і в самих тренажерах
+    logging.getLogger('matplotlib.axes._base').setLevel(logging.ERROR)
+    size_px = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    fractions = all_fractions()
+    print(f"спрайти {size_px}x{size_px}, {len(fractions)} дробів n/d для d = 2..40, один колір")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        atlas = PieAtlas(empty_color=EMPTY, divider_limit=40, size_px=size_px, max_sprites=len(fractions),
+                         cache_dir=cache_dir)
+        cold = per_sprite_ms(atlas, fractions)
+        warm = per_sprite_ms(atlas, fractions)
+        disk_size = sum(entry.stat().st_size for entry in os.scandir(cache_dir))
+
+        from_disk = PieAtlas(empty_color=EMPTY, divider_limit=40, size_px=size_px, max_sprites=len(fractions),
+                             cache_dir=cache_dir)
+        disk = per_sprite_ms(from_disk, fractions)
+
+    print(f"  холодний: {cold:7.2f} мс/спрайт, увесь атлас {cold * len(fractions) / 1000:5.1f} с")
+    print(f"  з диска:  {disk:7.2f} мс/спрайт, увесь атлас {disk * len(fractions) / 1000:5.1f} с")
+    print(f"  теплий:   {warm * 1000:7.2f} мкс/спрайт")
+    print(f"  пам'ять: {atlas.nbytes() / 2 ** 20:.0f} МБ, на диску: {disk_size / 2 ** 20:.1f} МБ")
+
+    print("кадр з трьома кругами (медіана):")
+    print(f"  сектори:          {frame_times(False, atlas):6.1f} мс")
+    print(f"  атлас (теплий):   {frame_times(True, atlas):6.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Шкільний день на одній дошці: десятки тисяч подій у кожному тренажері й перевірка, що пам'ять не росте.
+
+Запуск з кореня репозиторію:  python benchmarks/soak.py [--events 20000] [--trainer 0 --trainer 3 ...]
+
+Кожен тренажер запускається в окремому процесі Python. Процес відкриває вікно, дочікується
+фігури й подає синтетичні події, як учень біля дошки: перетягування повзунків (значення
+повзунка плюс його command), кнопки «+»/«-», нове завдання кожні TASK_EVERY подій, зміну
+розміру вікна кожні RESIZE_EVERY і відкриття та закриття вікна рішення кожні SOLUTION_EVERY.
+Після кожної події Tk обробляє чергу, тож кожна подія малюється.
+
+Кожні --sample-every подій записуються резидентна пам'ять, кількість об'єктів Python (gc) і
+пам'ять, виділена Python (tracemalloc). Перші --warmup подій заповнюють кеші (рішень, шрифтів,
+компонування) і не рахуються: ріст міряється від першого запису після них до останнього.
+Наприкінці друкуються місця в коді, що виділили найбільше нової пам'яті після розігріву.
+Якщо ріст будь-якої величини перевищує поріг, скрипт завершується з кодом 1, без дисплея — з кодом 2.
+
+Без дисплея (Linux без DISPLAY) скрипт сам запускає Xvfb, якщо той встановлений.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from fraction_ui.host import resident_memory_mb
+from launcher import TRAINERS
+
+TASK_EVERY = 25
+RESIZE_EVERY = 100
+SOLUTION_EVERY = 500
+GEOMETRIES = ["1400x900", "1500x950", "1300x850"]
+TOP_ALLOCATORS = 10
+
+
+def descendants(widget):
+    for child in widget.winfo_children():
+        yield child
+        yield from descendants(child)
+
+
+def sample(event):
+    current, _ = tracemalloc.get_traced_memory()
+    return {"event": event, "rss_mb": resident_memory_mb(), "objects": len(gc.get_objects()),
+            "traced_mb": current / (1024 * 1024)}
+
+
+def top_allocators(before, after):
+    stats = after.compare_to(before, "lineno")
+    return [{"where": str(stat.traceback[0]), "size_kb": stat.size_diff / 1024, "count": stat.count_diff}
+            for stat in stats[:TOP_ALLOCATORS]]
+
+
+def run_child(index, events, warmup, sample_every, seed):
+    """Дочірній процес: один тренажер, події, записи JSON-рядками в stdout."""
+    import tkinter as tk
+    from tkinter import ttk
+    from launcher import trainer_class
+
+    rng = random.Random(seed)
+    window = trainer_class(index)()
+    window.geometry(GEOMETRIES[0])
+    while window.figure is None:
+        window.update()
+        time.sleep(0.01)
+    window.update()
+
+    def controls():
+        scales, buttons = [], []
+        for widget in descendants(window):
+            if isinstance(widget, ttk.Scale) and not widget.instate(["disabled"]):
+                scales.append(widget)
+            elif isinstance(widget, ttk.Button) and widget.cget("text") in ("+", "-") \
+                    and not widget.instate(["disabled"]):
+                buttons.append(widget)
+        return scales, buttons
+
+    def drag(scale):
+        value = rng.uniform(float(scale.cget("from")), float(scale.cget("to")))
+        scale.set(value)
+        command = str(scale.cget("command"))
+        if command:
+            scale.tk.call(command, value)
+
+    tracemalloc.start()
+    snapshot = None
+    scales, buttons = controls()
+    for event in range(1, events + 1):
+        if event % TASK_EVERY == 0:
+            window._generate_new_task()
+            scales, buttons = controls()  # після нового завдання частина елементів вимикається чи вмикається
+        elif event % RESIZE_EVERY == 1:
+            window.geometry(rng.choice(GEOMETRIES))
+        elif event % SOLUTION_EVERY == 2:
+            before = set(window.winfo_children())
+            window._open_solution_window()
+            window.update()
+            for child in set(window.winfo_children()) - before:
+                if isinstance(child, tk.Toplevel):
+                    child.destroy()
+        elif buttons and rng.random() < 0.3:
+            rng.choice(buttons).invoke()
+        elif scales:
+            drag(rng.choice(scales))
+        window.update()
+
+        if event % sample_every == 0:
+            gc.collect()
+            print(json.dumps(sample(event)), flush=True)
+            if snapshot is None and event >= warmup:
+                snapshot = tracemalloc.take_snapshot()
+    if snapshot is not None:
+        gc.collect()
+        print(json.dumps({"top": top_allocators(snapshot, tracemalloc.take_snapshot())}), flush=True)
+    tracemalloc.stop()
+    window.master.destroy()
+
+
+def start_display():
+    """Запускає Xvfb, якщо дисплея немає; повертає процес Xvfb або None."""
+    if sys.platform != "linux" or os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        print("Немає дисплея (DISPLAY) і не знайдено Xvfb; встановіть xvfb або запустіть на машині з екраном.",
+              file=sys.stderr)
+        sys.exit(2)
+    read_fd, write_fd = os.pipe()
+    xvfb = subprocess.Popen(["Xvfb", "-displayfd", str(write_fd), "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+                            pass_fds=(write_fd,), stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        display = pipe.readline().strip()
+    if not display:
+        xvfb.kill()
+        print("Xvfb не запустився.", file=sys.stderr)
+        sys.exit(2)
+    os.environ["DISPLAY"] = f":{display}"
+    return xvfb
+
+
+def soak(index, args):
+    """Запускає тренажер у дочірньому процесі; повертає (записи, найбільші місця виділення)."""
+    command = [sys.executable, os.path.abspath(__file__), "--child", str(index), "--events", str(args.events),
+               "--warmup", str(args.warmup), "--sample-every", str(args.sample_every), "--seed", str(args.seed)]
+    samples, top = [], []
+    with subprocess.Popen(command, stdout=subprocess.PIPE, text=True, cwd=ROOT) as child:
+        for line in child.stdout:
+            record = json.loads(line)
+            if "top" in record:
+                top = record["top"]
+            else:
+                samples.append(record)
+                print(f"  {record['event']:>7} подій: RSS {record['rss_mb']:7.1f} МБ, "
+                      f"об'єктів {record['objects']:>8}, Python {record['traced_mb']:6.2f} МБ", flush=True)
+    if child.returncode:
+        raise RuntimeError(f"дочірній процес завершився з кодом {child.returncode}")
+    return samples, top
+
+
+def growth(samples, warmup):
+    after = [s for s in samples if s["event"] >= warmup]
+    if len(after) < 2:
+        return None
+    first, last = after[0], after[-1]
+    return {key: last[key] - first[key] for key in ("rss_mb", "objects", "traced_mb")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Тривале навантаження тренажерів і перевірка росту пам'яті.")
+    parser.add_argument("--trainer", type=int, action="append", help="номер у launcher.TRAINERS (типово всі)")
+    parser.add_argument("--events", type=int, default=20000, help="подій на тренажер")
+    parser.add_argument("--warmup", type=int, default=2000, help="подій розігріву, що не входять у ріст")
+    parser.add_argument("--sample-every", type=int, default=1000, help="подій між записами")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-rss-growth", type=float, default=20.0, help="МБ")
+    parser.add_argument("--max-object-growth", type=int, default=20000)
+    parser.add_argument("--max-traced-growth", type=float, default=5.0, help="МБ")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        run_child(args.child, args.events, args.warmup, args.sample_every, args.seed)
+        return
+
+    limits = {"rss_mb": args.max_rss_growth, "objects": args.max_object_growth, "traced_mb": args.max_traced_growth}
+    names = {"rss_mb": "RSS, МБ", "objects": "об'єктів", "traced_mb": "Python, МБ"}
+    formats = {"rss_mb": "+.1f", "objects": "+d", "traced_mb": "+.2f"}
+    xvfb = start_display()
+    failed = []
+    try:
+        for index in args.trainer or range(len(TRAINERS)):
+            title = TRAINERS[index][0]
+            print(f"{title}: {args.events} подій")
+            samples, top = soak(index, args)
+            delta = growth(samples, args.warmup)
+            if delta is None:
+                print("  замало записів після розігріву, ріст не перевірено")
+                continue
+            over = [key for key in limits if delta[key] > limits[key]]
+            changes = ", ".join(f"{names[key]} {delta[key]:{formats[key]}}" for key in limits)
+            print("  ріст після розігріву: " + changes
+                  + (" — ПЕРЕВИЩЕНО: " + ", ".join(names[key] for key in over) if over else ""))
+            if top:
+                print("  найбільше нової пам'яті виділили:")
+                for entry in top:
+                    print(f"    {entry['size_kb']:+9.1f} КБ {entry['count']:+7}  {entry['where']}")
+            if over:
+                failed.append(title)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    if failed:
+        print("Пам'ять росте: " + ", ".join(failed))
+        sys.exit(1)
+    print("Пам'ять стабільна в усіх тренажерах.")
+
+
+if __name__ == "__main__":
+    main()
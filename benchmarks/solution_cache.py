@@ -0,0 +1,44 @@
+"""Побудова кроків рішення: перший виклик проти повторного з кешу (fraction_core.solutions).
+
+Запуск з кореня репозиторію:  python benchmarks/solution_cache.py [завдань]
+
+Для кожного тренажера береться його потік завдань; кожне завдання будується двічі, як при
+двох натисканнях «Показати рішення». Перший виклик — з порожнім кешем.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fraction_core import solutions, tasks
+
+CASES = [
+    ("додавання (main.py)", solutions.addition_solution, lambda rng: tasks.addition_task(100, rng=rng), {}),
+    ("віднімання, рівень 1", solutions.common_denominator_solution,
+     lambda rng: tasks.subtraction_task(100, rng=rng), {"subtract": True}),
+    ("скорочення", solutions.reduction_solution, lambda rng: tasks.reduction_task(100, rng=rng)[:2], {}),
+    ("мішані числа, +", solutions.mixed_addition_solution, lambda rng: tasks.mixed_addition_task(rng=rng), {}),
+    ("мішані числа, -", solutions.mixed_subtraction_solution, lambda rng: tasks.mixed_subtraction_task(rng=rng), {}),
+]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{'':<22} {'перший, мкс':>12} {'з кешу, мкс':>12}")
+    for name, build, generate, kwargs in CASES:
+        rng = random.Random(0)
+        task_list = [generate(rng) for _ in range(count)]
+        build.cache_clear()
+        solutions.lcm_explanation.cache_clear()
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            for task in task_list:
+                build(*task, **kwargs)
+            timings.append((time.perf_counter() - start) / count * 1e6)
+        print(f"{name:<22} {timings[0]:12.1f} {timings[1]:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Вікно рішення: час відкриття й затримка під час зміни розміру, віртуалізований список проти повного.
+
+Запуск з кореня репозиторію (потрібен дисплей):  python benchmarks/solution_window.py [завдань]
+
+Рішення кількох завдань віднімання мішаних чисел (рівень 2) склеюються в один довгий список
+кроків. «Повний» варіант — той самий SolutionWindow з нескінченним OVERSCAN і без затримки
+перекомпонування, тобто з усіма кроками на полотні одразу. Віджетів у вікні стала кількість;
+для порівняння друкуються кількість віджетів і елементів полотна.
+"""
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from fraction_core.solutions import mixed_subtraction_solution
+from fraction_core.tasks import mixed_subtraction_task
+from fraction_ui.host import shared_root
+
+WIDTHS = [820, 1000, 700, 1200, 900, 760]
+
+
+def load_solution_window():
+    spec = importlib.util.spec_from_file_location("lvl2_subtraction", os.path.join(ROOT, "vind. drob lvl2.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SolutionWindow
+
+
+def settle(window):
+    """Обробляє події, поки не виконаються відкладені оновлення вікна; повертає найдовший блок у мс."""
+    longest = 0
+    while True:
+        start = time.perf_counter()
+        window.update()
+        longest = max(longest, (time.perf_counter() - start) * 1000)
+        if window._reflow_pending is None and window._update_pending is None:
+            return longest
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def measure(window_class, root, steps):
+    start = time.perf_counter()
+    window = window_class(root, steps)
+    settle(window)
+    open_ms = (time.perf_counter() - start) * 1000
+
+    blocks, settled = [], []
+    for width in WIDTHS:
+        start = time.perf_counter()
+        window.geometry(f"{width}x600")
+        blocks.append(settle(window))
+        settled.append((time.perf_counter() - start) * 1000)
+    items, widgets = len(window.canvas.find_all()), count_widgets(window)
+    window.destroy()
+    return open_ms, statistics.median(blocks), statistics.median(settled), items, widgets
+
+
+def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rng = random.Random(0)
+    steps = []
+    for _ in range(tasks):
+        steps += mixed_subtraction_solution(*mixed_subtraction_task(rng=rng))
+    print(f"{len(steps)} кроків рішення ({tasks} завдань)")
+
+    root = shared_root()
+    virtual = load_solution_window()
+    full = type("FullSolutionWindow", (virtual,), {"OVERSCAN": float("inf"), "REFLOW_DELAY_MS": 0})
+    # Найдовший блок — скільки вікно не відповідало під час зміни розміру; до стабільного вигляду
+    # у віртуалізованого входить і затримка REFLOW_DELAY_MS
+    print(f"{'':<16} {'відкриття, мс':>14} {'найдовший блок, мс':>19} {'до стабільного, мс':>19} "
+          f"{'елементів':>10} {'віджетів':>9}")
+    for name, window_class in (("повний", full), ("віртуалізований", virtual)):
+        open_ms, block_ms, settled_ms, items, widgets = measure(window_class, root, steps)
+        print(f"{name:<16} {open_ms:14.0f} {block_ms:19.1f} {settled_ms:19.1f} {items:10} {widgets:9}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Холодний старт тренажерів: коли з'являється вікно і коли намальовано перший круг.
+
+Запуск з кореня репозиторію (потрібен дисплей):  python benchmarks/startup.py [повторів]
+
+Кожен тренажер запускається в окремому процесі Python, тож кеш імпортів щоразу порожній.
+Дочірній процес завантажує файл тренажера як модуль, відмічає першу подію <Map> вікна
+і першу повну перемальовку фігури, на якій уже є осі, після чого закривається. Час
+рахується від запуску процесу; у таблиці — медіана повторів.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = ["main.py", "dodav. drob.py", "vidn. drob lvl1.py", "skor.drob.py",
+                "mix to neprav drib.py", "dodav drob 2lvl.py", "vind. drob lvl2.py"]
+TIMEOUT_MS = 30000
+
+CHILD = r"""
+import importlib.util, json, sys, time
+sys.path.insert(0, sys.argv[2])
+from fraction_ui.host import TrainerWindow
+spec = importlib.util.spec_from_file_location("trainer", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+app_class = next(obj for obj in vars(module).values()
+                 if isinstance(obj, type) and issubclass(obj, TrainerWindow) and obj is not TrainerWindow)
+marks = {}
+
+def on_draw(event):
+    if event.canvas.figure.axes:
+        marks.setdefault("pie", time.time())
+
+create_figure = app_class._create_figure
+def _create_figure(self):
+    create_figure(self)
+    self.canvas.mpl_connect("draw_event", on_draw)
+app_class._create_figure = _create_figure
+
+app = app_class()
+app.bind("<Map>", lambda event: marks.setdefault("window", time.time()), add="+")
+
+def check():
+    if "window" in marks and "pie" in marks:
+        print(json.dumps(marks))
+        app.master.destroy()
+    else:
+        app.after(5, check)
+
+app.after(5, check)
+app.after(int(sys.argv[3]), app.master.destroy)
+app.mainloop()
+"""
+
+
+def measure(script):
+    start = time.time()
+    result = subprocess.run([sys.executable, "-c", CHILD, os.path.join(ROOT, script), ROOT, str(TIMEOUT_MS)],
+                            capture_output=True, text=True, cwd=ROOT)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode or not lines:
+        raise RuntimeError(f"{script}: {result.stderr.strip() or 'немає першого кадру'}")
+    marks = json.loads(lines[-1])
+    return marks["window"] - start, marks["pie"] - start
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'тренажер':<24} {'вікно, мс':>10} {'перший круг, мс':>16}")
+    for script in ENTRY_POINTS:
+        runs = [measure(script) for _ in range(repeats)]
+        window = statistics.median(w for w, _ in runs) * 1000
+        pie = statistics.median(p for _, p in runs) * 1000
+        print(f"{script:<24} {window:10.0f} {pie:16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Довгий урок: сотні нових завдань і змін розміру вікна, пам'ять і затримка рядка завдання.
+
+Запуск з кореня репозиторію (потрібен дисплей):  python benchmarks/task_header_soak.py [завдань] [тренажер]
+
+тренажер — номер у launcher.TRAINERS (типово 0). Після кожних CHECKPOINT завдань вікно двічі
+змінює розмір; друкуються резидентна пам'ять, приріст пам'яті Python від першої контрольної
+точки (tracemalloc), кількість прив'язок <Configure> на полотні завдання, скільки разів воно
+перемальовувалося й скільки тривала обробка зміни розміру. Пам'ять і затримка мають лишатися
+рівними, а прив'язка — одна.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from fraction_ui.host import resident_memory_mb
+from launcher import TRAINERS, trainer_class
+
+CHECKPOINT = 50
+GEOMETRIES = ["1500x950", "1400x900"]
+HEADING_BINDINGS = "прив'язок"
+
+
+def wait_for_figure(window):
+    while window.figure is None:
+        window.update()
+        time.sleep(0.01)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    index = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    window = trainer_class(index)()
+    window.geometry(GEOMETRIES[-1])
+    wait_for_figure(window)
+    window.update()
+
+    print(f"{TRAINERS[index][0]}: {count} завдань")
+    print(f"{'завдань':>8} {'RSS, МБ':>9} {'приріст Python, КБ':>19} {HEADING_BINDINGS:>10} {'малювань':>9} "
+          f"{'зміна розміру, мс':>18}")
+    tracemalloc.start()
+    baseline = None
+    for task in range(1, count + 1):
+        window._generate_new_task()
+        window.update()
+        if task % CHECKPOINT:
+            continue
+        start = time.perf_counter()
+        for geometry in GEOMETRIES:
+            window.geometry(geometry)
+            window.update()
+        resize_ms = (time.perf_counter() - start) * 1000 / len(GEOMETRIES)
+        current, _ = tracemalloc.get_traced_memory()
+        if baseline is None:
+            baseline = current
+        header = window.task_header
+        bindings = len(header.bind("<Configure>").strip().splitlines())
+        print(f"{task:8} {resident_memory_mb():9.1f} {(current - baseline) / 1024:19.1f} {bindings:10} "
+              f"{header.draws:9} {resize_ms:18.1f}")
+    tracemalloc.stop()
+    window.master.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Мікробенчмарки на pytest-benchmark: щоб кожну зміну швидкодії можна було виміряти до й після.
+
+Запуск з кореня репозиторію (дисплей не потрібен, малювання йде на Agg; потрібен pytest-benchmark):
+    python -m pytest benchmarks/test_suite.py                       # виміряти й надрукувати
+    python -m pytest benchmarks/test_suite.py -k "solution or render" # лише частина
+    python -m pytest benchmarks/test_suite.py --benchmark-storage=file://benchmarks/baseline \\
+        --benchmark-save=baseline                                    # записати базову лінію
+    python -m pytest benchmarks/test_suite.py --benchmark-storage=file://benchmarks/baseline \\
+        --benchmark-compare --benchmark-compare-fail=median:20%      # порівняти; помилка, якщо повільніше
+
+Групи:
+  task      — генератори завдань fraction_core.tasks (усе, що робить _generate_new_task без вікна);
+  primes    — розклад на прості множники (prime_factorization і factorize_array);
+  check     — перевірка відповіді, яку викликають visualize, _check_user_answer і _check_answer;
+  solution  — побудова кроків рішення (_build_solution_for_task): cold — з порожнім кешем, cached — з кешу;
+  render    — кадр тренажера на Agg з тими самими художниками fraction_ui, що й у вікні (фігури —
+              у benchmarks/conftest.py): pair — три круги з заголовками mathtext, як у main.py;
+              mixed — ряди кіл, що налягають, як у тренажерах мішаних чисел. Кожен кадр — зміна
+              художників і frames.present() з компонуванням LayoutCache і показом через BlitManager.
+Самі класи тренажерів тут не створюються: їм потрібні вікно й дисплей.
+З FRACTIONS_BLIT=1 кадри render показуються через blit.
+"""
+import itertools
+import math
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fraction_core import checking, solutions, tasks
+from fraction_core.arithmetic import prime_factorization
+from fraction_core.primes import ensure_factor_table, factorize_array
+from fraction_ui.mathtext import title_cache
+from fraction_ui.pies import overlapping_pies, overlapping_width
+
+INPUTS = 500  # різних входів на бенчмарк, щоб не міряти один і той самий випадок
+
+CONVERSION_ARGS = (10, 5, 59)  # як у тренажері «Мішані числа і неправильні дроби»
+FAMILIES = {
+    "addition": (tasks.addition_task, (100,)),
+    "subtraction": (tasks.subtraction_task, (100,)),
+    "mixed_addition": (tasks.mixed_addition_task, ()),
+    "mixed_subtraction": (tasks.mixed_subtraction_task, ()),
+    "reduction": (tasks.reduction_task, (100,)),
+    "conversion": (tasks.conversion_task, CONVERSION_ARGS),
+}
+
+
+def cycle(values):
+    """Функція, що щоразу повертає наступне значення зі списку по колу."""
+    return itertools.cycle(values).__next__
+
+
+def task_list(family, count=INPUTS, seed=0):
+    generate, args = FAMILIES[family]
+    rng = random.Random(seed)
+    return [generate(*args, rng=rng) for _ in range(count)]
+
+
+# --- Генерація завдань ---
+
+@pytest.mark.benchmark(group="task")
+@pytest.mark.parametrize("family", FAMILIES)
+def test_task(benchmark, family):
+    generate, args = FAMILIES[family]
+    rng = random.Random(0)
+    benchmark(lambda: generate(*args, rng=rng))
+
+
+# --- Прості множники ---
+
+@pytest.mark.benchmark(group="primes")
+def test_prime_factorization(benchmark):
+    ensure_factor_table(10000)
+    value = cycle(list(range(2, 10000, 7)))
+    benchmark(lambda: prime_factorization(value()))
+
+
+@pytest.mark.benchmark(group="primes")
+def test_factorize_array(benchmark):
+    ensure_factor_table(10000)
+    values = list(range(2, 10000, 7))
+    benchmark(factorize_array, values)
+
+
+# --- Перевірка відповіді ---
+
+def _answers(family, make_answer):
+    """Пари (завдання, відповідь): половина правильних, половина з помилкою в першому числі відповіді."""
+    rng = random.Random(1)
+    result = []
+    for task in task_list(family):
+        answer = list(make_answer(task))
+        if rng.random() < 0.5:
+            answer[0] += 1
+        result.append((task, tuple(answer)))
+    return result
+
+
+def _converted(task):
+    n1, d1, n2, d2 = task
+    common = d1 * d2 // math.gcd(d1, d2)
+    return n1 * (common // d1), common, n2 * (common // d2), common
+
+
+def _mixed_answer(task):
+    n1, d1, n2, d2 = _converted(task)
+    w1, f1 = divmod(n1, d1)
+    w2, f2 = divmod(n2, d2)
+    return w1, f1, d1, w2, f2, d2
+
+
+def _conversion_answer(task):
+    task_type, whole, num, den, improper_num = task
+    return (0, improper_num, den) if task_type == tasks.MIXED_TO_IMPROPER else (whole, num, den)
+
+
+# назва: (родина завдань, правильна відповідь, перевірка (завдання, відповідь))
+CHECKS = {
+    "converted_addends": ("addition", _converted, checking.check_converted_addends),
+    "common_denominator_result": (
+        "subtraction", _converted,
+        lambda task, *answer: checking.check_common_denominator_result(task, *answer, subtract=True)),
+    "mixed_addition": (
+        "mixed_addition", _mixed_answer,
+        lambda task, *answer: checking.check_mixed_addition(task, checking.mixed_result(*task), *answer)),
+    "mixed_subtraction": (
+        "mixed_subtraction", _mixed_answer,
+        lambda task, *answer: checking.check_mixed_subtraction(checking.mixed_result(*task, subtract=True),
+                                                               *answer)),
+    "reduction": ("reduction", lambda task: task[2:],
+                  lambda task, *answer: checking.check_reduction(task[2], task[3], *answer)),
+    "conversion": ("conversion", _conversion_answer, checking.check_conversion),
+}
+
+
+@pytest.mark.benchmark(group="check")
+@pytest.mark.parametrize("name", CHECKS)
+def test_check(benchmark, name):
+    family, make_answer, check = CHECKS[name]
+    pair = cycle(_answers(family, make_answer))
+
+    def step():
+        task, answer = pair()
+        return check(task, *answer)
+    benchmark(step)
+
+
+# --- Кроки рішення ---
+
+# назва: (побудова кроків, родина завдань, аргументи з завдання, іменовані аргументи)
+SOLUTIONS = {
+    "addition": (solutions.addition_solution, "addition", lambda task: task, {}),
+    "subtraction": (solutions.common_denominator_solution, "subtraction", lambda task: task, {"subtract": True}),
+    "mixed_addition": (solutions.mixed_addition_solution, "mixed_addition", lambda task: task, {}),
+    "mixed_subtraction": (solutions.mixed_subtraction_solution, "mixed_subtraction", lambda task: task, {}),
+    "reduction": (solutions.reduction_solution, "reduction", lambda task: task[:2], {}),
+    "conversion": (solutions.conversion_solution, "conversion", lambda task: (task,), {}),
+}
+
+
+@pytest.mark.benchmark(group="solution")
+@pytest.mark.parametrize("name", SOLUTIONS)
+def test_solution_cold(benchmark, name):
+    build, family, arguments, kwargs = SOLUTIONS[name]
+    task = cycle([arguments(task) for task in task_list(family)])
+
+    def step():
+        build.cache_clear()
+        solutions.lcm_explanation.cache_clear()
+        return build(*task(), **kwargs)
+    benchmark(step)
+
+
+@pytest.mark.benchmark(group="solution")
+@pytest.mark.parametrize("name", SOLUTIONS)
+def test_solution_cached(benchmark, name):
+    build, family, arguments, kwargs = SOLUTIONS[name]
+    task = cycle([arguments(task) for task in task_list(family, count=solutions.SOLUTION_CACHE_SIZE)])
+    benchmark(lambda: build(*task(), **kwargs))
+
+
+# --- Кадри тренажерів ---
+
+def _title(n, d):
+    return f"Дріб\n$\\frac{{{n}}}{{{d}}}$"
+
+
+@pytest.mark.benchmark(group="render")
+def test_render_pair(benchmark, pair_figure):
+    """Рух повзунка в main.py: новий дріб на одному з кругів, перевірка, заголовок і підпис значення."""
+    rng = random.Random(0)
+    moves = [(rng.randrange(3), rng.randint(1, 20)) for _ in range(INPUTS)]
+    move = cycle([(i, rng.randint(0, d), d) for i, d in moves])
+
+    def step():
+        i, n, d = move()
+        title_cache.set(pair_figure.axes[i].title, _title(n, d))
+        pair_figure.values[i].set_text(f"(= {round(n / d, 3)})")
+        pair_figure.pies[i].update([n], ['deepskyblue'], d)
+        pair_figure.frames.present()
+    benchmark(step)
+
+
+@pytest.mark.benchmark(group="render")
+def test_render_mixed(benchmark, mixed_figure):
+    """Нове завдання на мішані числа: ряди кіл, що налягають, і заголовки над ними."""
+    max_width = overlapping_width(4)
+    task = cycle(task_list("mixed_addition"))
+    for ax in mixed_figure.circle_axes:
+        ax.set_xlim(-max_width / 2 - 0.2, max_width / 2 + 0.2)
+        ax.set_ylim(-2.4, 1.2)
+
+    def step():
+        n1, d1, n2, d2 = task()
+        n3, d3 = checking.mixed_result(n1, d1, n2, d2)
+        for title_ax, pool, (n, d) in zip(mixed_figure.title_axes, mixed_figure.pools, ((n1, d1), (n2, d2), (n3, d3))):
+            title_cache.set(title_ax.title, _title(n, d))
+            pool.show(overlapping_pies(n, d, 'salmon'))
+        mixed_figure.frames.present()
+    benchmark(step)
+
+
+@pytest.mark.benchmark(group="render")
+def test_pie_update(benchmark, pair_figure):
+    """Лише PieArtist.update без показу: контури з кешу wedge_paths, кольори й роздільники."""
+    rng = random.Random(0)
+    fraction = cycle([(rng.randint(0, d), d) for d in (rng.randint(1, 40) for _ in range(INPUTS))])
+    pie = pair_figure.pies[0]
+
+    def step():
+        n, d = fraction()
+        return pie.update([n], ['deepskyblue'], d)
+    benchmark(step)
+
+
+@pytest.mark.benchmark(group="render")
+def test_layout_cached(benchmark, pair_figure):
+    """LayoutCache.apply, коли довжини заголовків не змінюються: subplotpars з кешу замість tight_layout."""
+    for ax, pie in zip(pair_figure.axes, pair_figure.pies):
+        ax.title.set_text(_title(3, 8))
+        pie.update([3], ['deepskyblue'], 8)
+    pair_figure.canvas.draw()
+    pair_figure.layout.apply()
+    benchmark(pair_figure.layout.apply)
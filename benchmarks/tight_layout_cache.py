@@ -0,0 +1,88 @@
+"""tight_layout на кожен кадр проти LayoutCache.
+
+Запуск з кореня репозиторію:  python benchmarks/tight_layout_cache.py [кадрів]
+
+Сцена та рух повзунків ті самі, що в blit_vs_full_draw.py. Для кожного режиму друкується
+час самого кроку компонування та всього кадру (з canvas.draw), скільки мілісекунд
+на кадр заощаджено і наскільки верх/низ сітки відхиляються від точного tight_layout (у пікселях).
+"""
+import logging
+import os
+import statistics
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blit_vs_full_draw import EMPTY, make_canvas, pies_for, random_states
+from fraction_ui.layout import _SUBPLOT_PARAM_NAMES, LayoutCache, reset_subplot_layout
+from fraction_ui.pies import PieArtist, prepare_pie_axes, reset_pie_limits
+
+MODES = {
+    # назва: title_bucket або False, якщо кешу немає
+    "tight_layout щокадру": False,
+    "LayoutCache, точний текст": None,
+    "LayoutCache, довжина рядка": 1,
+}
+
+
+def run(states, bucket):
+    canvas = make_canvas()
+    figure = canvas.figure
+    cache = LayoutCache(figure, title_bucket=bucket, pad=2.0) if bucket is not False else None
+    axes, pies = [], []
+    for i in range(3):
+        ax = figure.add_subplot(1, 3, i + 1)
+        prepare_pie_axes(ax)
+        ax.set_title("", pad=25, fontsize=26)
+        axes.append(ax)
+        pies.append(PieArtist(ax, empty_color=EMPTY, divider_limit=40))
+
+    layout_ms, frame_ms, params = [], [], []
+    for state in states:
+        start = time.perf_counter()
+        for ax, pie, (numerators, colors, den, title) in zip(axes, pies, pies_for(state)):
+            ax.title.set_text(title)
+            pie.update(numerators, colors, den)
+            reset_pie_limits(ax)
+        layout_start = time.perf_counter()
+        if cache is None:
+            reset_subplot_layout(figure)
+            figure.tight_layout(pad=2.0)
+        else:
+            cache.apply()
+        layout_ms.append((time.perf_counter() - layout_start) * 1000)
+        canvas.draw()
+        frame_ms.append((time.perf_counter() - start) * 1000)
+        params.append([getattr(figure.subplotpars, name) for name in _SUBPLOT_PARAM_NAMES])
+    return layout_ms, frame_ms, params, cache, figure.bbox.size
+
+
+def main():
+    logging.getLogger('matplotlib.axes._base').setLevel(logging.ERROR)
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    states = random_states(frames)
+
+    exact_params, exact_layout = None, None
+    for name, bucket in MODES.items():
+        layout_ms, frame_ms, params, cache, (width, height) = run(states, bucket)
+        line = (f"{name:<28} компонування: медіана {statistics.median(layout_ms):6.2f} мс, "
+                f"середнє {statistics.mean(layout_ms):6.2f} мс;  кадр: медіана {statistics.median(frame_ms):6.1f} мс")
+        if cache is None:
+            exact_params, exact_layout = params, statistics.mean(layout_ms)
+            print(line)
+            continue
+        # left, bottom, right, top у частках фігури -> пікселі; wspace/hspace не переводимо
+        sizes = (width, height, width, height)
+        deviation = max(abs(a - b) * size for got, exact in zip(params, exact_params)
+                        for a, b, size in zip(got, exact, sizes))
+        print(line)
+        print(f"  {cache.hits} влучань / {cache.misses} промахів, заощаджено "
+              f"{exact_layout - statistics.mean(layout_ms):5.2f} мс на кадр, "
+              f"відхилення від tight_layout до {deviation:.1f} пікс.")
+
+
+if __name__ == "__main__":
+    main()
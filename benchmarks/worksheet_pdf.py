@@ -0,0 +1,49 @@
+"""Сторінок PDF на секунду залежно від кількості процесів (fraction_ui.worksheet_pdf).
+
+Запуск з кореня репозиторію:  python benchmarks/worksheet_pdf.py [учнів] [завдань на учня]
+
+Для кожної кількості процесів (1, 2, 4, ... до кількості ядер) клас із учнів рендериться
+у тимчасову теку; час включає запуск пулу й побудову Figure у кожному процесі. Для
+порівняння — той самий клас без пулу, в одному процесі.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fraction_core.worksheet import FAMILIES
+from fraction_ui.worksheet_pdf import TASKS_PER_PAGE, render_student, render_worksheets, student_jobs
+
+
+def worker_counts():
+    cores = os.cpu_count() or 1
+    counts, workers = [], 1
+    while workers < cores:
+        counts.append(workers)
+        workers *= 2
+    return counts + [cores]
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2 * TASKS_PER_PAGE
+    names = [f"Учень {i + 1}" for i in range(students)]
+    print(f"{students} учнів по {count} завдань, ядер: {os.cpu_count()}")
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        jobs = student_jobs(names, list(FAMILIES), count, out_dir)
+        start = time.perf_counter()
+        pages = sum(render_student(job) for job in jobs)
+        seconds = time.perf_counter() - start
+        print(f"  без пулу:       {pages} сторінок за {seconds:5.1f} с, {pages / seconds:6.1f} с./с")
+
+        for workers in worker_counts():
+            start = time.perf_counter()
+            pages = render_worksheets(jobs, workers)
+            seconds = time.perf_counter() - start
+            print(f"  процесів: {workers:<4} {pages} сторінок за {seconds:5.1f} с, {pages / seconds:6.1f} с./с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Швидкість генерації аркушів завдань (fraction_core.worksheet).
+
+Запуск з кореня репозиторію:  python benchmarks/worksheet_throughput.py [завдань]
+
+Окремо міряється холодний старт (побудова індексів і готових рядків, один раз на процес)
+і генерація аркуша в пам'ять для кожної родини та для всіх родин разом, у CSV і JSONL.
+"""
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fraction_core.worksheet import FAMILIES, FORMATS, family_table, write_worksheet
+
+
+def measure(families, count, fmt, repeats=5):
+    times = []
+    for seed in range(repeats):
+        out = io.StringIO()
+        start = time.perf_counter()
+        write_worksheet(out, families, count, seed, fmt)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    start = time.perf_counter()
+    for fmt in FORMATS:
+        for family in FAMILIES:
+            family_table(family, fmt)
+    print(f"холодний старт (індекси й рядки для {len(FAMILIES)} родин, {len(FORMATS)} формати): "
+          f"{(time.perf_counter() - start) * 1000:.0f} мс")
+
+    cases = [[family] for family in FAMILIES] + [list(FAMILIES)]
+    for fmt in FORMATS:
+        print(f"{fmt}, {count} завдань:")
+        for families in cases:
+            seconds = measure(families, count, fmt)
+            name = families[0] if len(families) == 1 else "усі родини"
+            print(f"  {name:<18} {seconds * 1000:7.1f} мс  ({count / seconds / 1e6:5.2f} млн завдань/с)")
+
+
+if __name__ == "__main__":
+    main()
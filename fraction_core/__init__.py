@@ -0,0 +1,5 @@
+"""Математика тренажерів дробів без Tk і matplotlib: генерація завдань, перевірка відповідей, кроки розв'язку.
+
+Пакет імпортується без дисплея, тож ним можна пакетно генерувати завдання, міряти швидкодію
+й перевіряти обчислення так само, як це роблять самі тренажери.
+"""
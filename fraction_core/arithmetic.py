@@ -0,0 +1,17 @@
+"""Розклад на прості множники, НСК і скорочення дробів."""
+import math
+
+from fraction_core.primes import sieve
+
+
+def prime_factorization(n):
+    return sieve.factorize(n)
+
+
+def lcm(a, b):
+    return (a * b) // math.gcd(a, b)
+
+
+def reduce_fraction(n, d):
+    common_divisor = math.gcd(n, d)
+    return n // common_divisor, d // common_divisor
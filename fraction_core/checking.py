@@ -0,0 +1,104 @@
+"""Перевірка відповідей. Кожна функція повертає (правильно, повідомлення для учня)."""
+import math
+
+from fraction_core.arithmetic import lcm, reduce_fraction
+from fraction_core.tasks import MIXED_TO_IMPROPER
+
+CORRECT = "✔ ПРАВИЛЬНО!"
+
+
+def check_converted_addends(task, num1, den1, num2, den2):
+    """Тренажер main.py: обидва дроби зведено до спільного знаменника без зміни їх значень."""
+    task_n1, task_d1, task_n2, task_d2 = task
+    if not (den1 > 0 and den1 == den2):
+        return False, ""
+    if num1 * task_d1 != task_n1 * den1 or num2 * task_d2 != task_n2 * den2:
+        return False, ""
+    if math.gcd(num1 + num2, den1) > 1:
+        return True, "✔ Правильно! Результат можна скоротити."
+    return True, "✔ ВІДМІННО! Результат нескоротний."
+
+
+def check_common_denominator_result(task, num1, den1, num2, den2, subtract=False):
+    """Сума (або різниця) дробів користувача зі спільним знаменником дорівнює відповіді завдання."""
+    task_n1, task_d1, task_n2, task_d2 = task
+    if not (den1 > 0 and den1 == den2):
+        return False, ""
+    sign = -1 if subtract else 1
+    user_n, user_d = num1 + sign * num2, den1
+    correct_n, correct_d = task_n1 * task_d2 + sign * task_n2 * task_d1, task_d1 * task_d2
+    if user_n * correct_d != user_d * correct_n:
+        return False, ""
+    if user_n >= 0 and math.gcd(user_n, user_d) > 1:
+        return True, "✔ Правильно! Спробуйте ще скоротити вашу відповідь."
+    return True, "✔ ВІДМІННО! Правильна відповідь."
+
+
+def mixed_result(n1, d1, n2, d2, subtract=False):
+    """Скорочений результат n1/d1 ± n2/d2 для неправильних дробів."""
+    common = lcm(d1, d2)
+    common_n1, common_n2 = n1 * (common // d1), n2 * (common // d2)
+    return reduce_fraction(common_n1 - common_n2 if subtract else common_n1 + common_n2, common)
+
+
+def check_mixed_addition(task, correct, w1, n1, d1, w2, n2, d2):
+    """Додавання мішаних чисел (рівень 2) з підказками, на якому кроці помилка."""
+    if d1 == 0 or d2 == 0:
+        return False, "Знаменник не може бути нулем!"
+    if d1 != d2:
+        return False, "Зведіть до спільного знаменника!"
+
+    common_d = d1
+    user_total = (w1 * common_d + n1) + (w2 * common_d + n2)
+    if reduce_fraction(user_total, common_d) == correct:
+        return True, "✔ ВІДМІННО! Рішення правильне."
+
+    task_n1, task_d1, task_n2, task_d2 = task
+    lcm_original = lcm(task_d1, task_d2)
+    if common_d != lcm_original:
+        return False, "Рішення невірне. Перевірте обчислення!"
+    correct_sum = task_n1 * (lcm_original // task_d1) + task_n2 * (lcm_original // task_d2)
+    if user_total != correct_sum:
+        return False, "Неправильна сума чисельників!"
+    if user_total >= common_d:
+        return False, "Виділіть цілу частину та/або скоротіть дріб!"
+    return False, "Рішення невірне. Перевірте обчислення або скорочення!"
+
+
+def check_mixed_subtraction(correct, w1, n1, d1, w2, n2, d2):
+    """Віднімання мішаних чисел (рівень 2): спершу спільний знаменник, потім «позичання» одиниці."""
+    if d1 == 0 or d2 == 0:
+        return False, "Знаменник не може бути нулем!"
+    if d1 != d2:
+        return False, "Зведіть до спільного знаменника!"
+    if w1 < w2:
+        return False, "Ціла частина зменшуваного менша!"
+    if n1 < n2:
+        if w1 > 0:
+            return False, "Дріб менший. 'Позичте' одиницю від цілої частини!"
+        return False, "Дробова частина зменшуваного менша, немає цілих для позичання!"
+
+    user_total = (w1 - w2) * d1 + (n1 - n2)
+    if reduce_fraction(user_total, d1) == correct:
+        return True, "✔ ВІДМІННО! Рішення правильне."
+    return False, "Рішення невірне. Перевірте обчислення!"
+
+
+def check_reduction(correct_n, correct_d, user_n, user_d):
+    if user_n == correct_n and user_d == correct_d:
+        return True, "✔ ПРАВИЛЬНО!"
+    return False, ""
+
+
+def check_conversion(task, user_w, user_n, user_d):
+    """Перетворення мішаного числа в неправильний дріб і навпаки; task — як у tasks.conversion_task."""
+    task_type, whole, num, den, improper_num = task
+    if user_d == 0:
+        return False, ""
+    if task_type == MIXED_TO_IMPROPER:
+        # Неправильний дріб вводиться без цілої частини
+        is_correct = user_w == 0 and reduce_fraction(user_n, user_d) == reduce_fraction(improper_num, den)
+    else:
+        is_correct = (user_n < user_d and user_w == whole
+                      and reduce_fraction(user_n, user_d) == reduce_fraction(num, den))
+    return (True, CORRECT) if is_correct else (False, "")
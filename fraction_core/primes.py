@@ -0,0 +1,79 @@
+"""Розклад на прості множники через таблицю найменших простих дільників (решето).
+
+spf[n] — найменший простий дільник n, тож розклад — це ланцюжок ділень n //= spf[n]:
+O(log n) кроків замість перебору всіх d до sqrt(n). Таблиця спільна для всіх тренажерів,
+будується один раз під їхні межі (MAX_DENOMINATOR, MAX_IMPROPER_NUMERATOR) і за потреби
+розширюється, коли трапляється більше число. numpy потрібен лише для пакетного factorize_array.
+"""
+import math
+
+DEFAULT_LIMIT = 1024
+
+
+class FactorSieve:
+    def __init__(self, limit=DEFAULT_LIMIT):
+        self.limit = 0
+        self._spf = self._spf_list = None
+        self.ensure(limit)
+
+    def ensure(self, limit):
+        """Гарантує, що таблиця покриває всі числа до limit включно."""
+        if limit <= self.limit:
+            return
+        # Зростаємо щонайменше вдвічі, щоб послідовність дедалі більших чисел не перебудовувала таблицю щоразу
+        limit = max(limit, 2 * self.limit)
+        spf = list(range(limit + 1))
+        for p in range(2, math.isqrt(limit) + 1):
+            if spf[p] != p:
+                continue
+            # Прості перебираємо за зростанням, тож уже записаний дільник менший за p
+            for multiple in range(p * p, limit + 1, p):
+                if spf[multiple] == multiple:
+                    spf[multiple] = p
+        # Масив numpy для пакетного розкладу будується лише на вимогу; обидва підміняємо разом
+        self._spf_list, self._spf, self.limit = spf, None, limit
+
+    def factorize(self, n):
+        """Прості множники n за зростанням, з повтореннями; для n <= 1 — порожній список."""
+        if n > self.limit:
+            self.ensure(n)
+        spf, factors = self._spf_list, []
+        while n > 1:
+            p = spf[n]
+            factors.append(p)
+            n //= p
+        return factors
+
+    def factorize_array(self, values):
+        """Пакетний розклад масиву чисел (наприклад, знаменників аркуша завдань).
+
+        Повертає двовимірний масив int64: рядок i — прості множники values[i] за зростанням,
+        доповнені нулями до довжини найдовшого розкладу.
+        """
+        import numpy as np  # лише тут, щоб тренажери не чекали на numpy під час запуску
+        remaining = np.array(values, dtype=np.int64).ravel()
+        if remaining.size and remaining.max() > self.limit:
+            self.ensure(int(remaining.max()))
+        if self._spf is None:
+            self._spf = np.array(self._spf_list, dtype=np.int64)
+        spf, columns = self._spf, []
+        active = remaining > 1
+        while active.any():
+            factor = np.where(active, spf[np.where(active, remaining, 0)], 0)
+            columns.append(factor)
+            remaining = np.where(active, remaining // np.maximum(factor, 1), remaining)
+            active = remaining > 1
+        if not columns:
+            return np.zeros((remaining.size, 0), dtype=np.int64)
+        return np.stack(columns, axis=1)
+
+
+sieve = FactorSieve()
+
+
+def ensure_factor_table(limit):
+    sieve.ensure(limit)
+
+
+def factorize_array(values):
+    return sieve.factorize_array(values)
@@ -0,0 +1,328 @@
+"""Кроки розв'язку для вікна «Розв'язок»: пари (стиль, текст), де стиль — "bold" або "normal".
+
+Кроки одного завдання не змінюються, тож побудова кешується (LRU на SOLUTION_CACHE_SIZE
+завдань), а кеш повертає кортеж, щоб вікно не могло випадково його змінити. prefetch будує
+кроки щойно показаного завдання у фоновому потоці, і кнопка «Показати рішення» бере їх уже з кешу.
+"""
+import functools
+import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from fraction_core.arithmetic import lcm, prime_factorization, reduce_fraction
+from fraction_core.tasks import MIXED_TO_IMPROPER
+
+SOLUTION_CACHE_SIZE = 256
+
+_prefetch_pool = None
+
+
+def _memoized(build):
+    """functools.lru_cache для побудови кроків; кешується незмінний кортеж."""
+    @functools.lru_cache(maxsize=SOLUTION_CACHE_SIZE)
+    @functools.wraps(build)
+    def cached(*args, **kwargs):
+        return tuple(build(*args, **kwargs))
+    return cached
+
+
+def prefetch(build, *args, **kwargs):
+    """Будує build(*args, **kwargs) у фоновому потоці, щоб наступний виклик узяв кроки з кешу."""
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        _prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solutions")
+    return _prefetch_pool.submit(build, *args, **kwargs)
+
+
+@_memoized
+def lcm_explanation(d1, d2, detailed=True):
+    """Пошук НСК через прості множники та додаткові множники обох дробів.
+
+    detailed — розгорнутий варіант тренажера main.py (кроки 1–2); інакше короткий
+    варіант тренажерів із попереднім скороченням (кроки 2–3).
+    """
+    factors1, factors2 = prime_factorization(d1), prime_factorization(d2)
+    count1 = Counter(factors1)
+    lcm_factors_list, missing_factors = list(factors1), []
+    for factor in factors2:
+        if count1.get(factor, 0) > 0:
+            count1[factor] -= 1
+        else:
+            lcm_factors_list.append(factor)
+            missing_factors.append(str(factor))
+    common = math.prod(lcm_factors_list)
+    factors_text = (f"1. Розкладемо знаменники ({d1} і {d2}) на прості множники:\n"
+                    f"   {d1} = {' * '.join(map(str, factors1))}\n   {d2} = {' * '.join(map(str, factors2))}")
+    multipliers = [
+        ("normal", f"   - Для першого дробу: {common} ÷ {d1} = {common // d1}"),
+        ("normal", f"   - Для другого дробу: {common} ÷ {d2} = {common // d2}"),
+    ]
+    if not detailed:
+        return [
+            ("bold", "--- КРОК 2: ПОШУК НСК (Найменшого Спільного Кратного) ---"),
+            ("normal", factors_text),
+            ("normal", f"2. Перемножимо їх множники, щоб знайти НСК: {common}"),
+            ("bold", "--- КРОК 3: ДОДАТКОВІ МНОЖНИКИ ---"),
+            *multipliers,
+        ]
+    return [
+        ("bold", "--- КРОК 1: ПОШУК НСК (Найменшого Спільного Кратного) ---"),
+        ("normal", factors_text),
+        ("normal",
+         "2. Щоб знайти НСК, випишемо множники першого числа і доповнимо їх тими, яких не вистачає з другого."),
+        ("normal", f"   - Беремо множники від {d1}: {', '.join(map(str, factors1))}"),
+        ("normal",
+         f"   - З множників {d2} не вистачає: {', '.join(missing_factors) if missing_factors else 'всі множники вже є'}"),
+        ("normal",
+         f"3. Перемножимо їх:\n   НСК = ({' * '.join(map(str, factors1))}) * {' * '.join(missing_factors) if missing_factors else '1'} = {common}"),
+        ("bold", "--- КРОК 2: ДОДАТКОВІ МНОЖНИКИ ---"),
+        *multipliers,
+    ]
+
+
+@_memoized
+def addition_solution(n1, d1, n2, d2):
+    """Тренажер main.py: НСК, додавання і, якщо можна, скорочення результату."""
+    steps = list(lcm_explanation(d1, d2))
+    common = lcm(d1, d2)
+    m1, m2 = common // d1, common // d2
+    sum_n = (n1 * m1) + (n2 * m2)
+    steps.extend([
+        ("bold", "--- КРОК 3: ДОДАВАННЯ ДРОБІВ ---"),
+        ("normal",
+         f"1. Домножимо дроби із завдання на їх додаткові множники:\n({n1}/{d1}) + ({n2}/{d2}) -> ({(n1 * m1)}/{common}) + ({(n2 * m2)}/{common})"),
+        ("normal", f"2. Додамо чисельники:\n= ({sum_n}/{common})"),
+    ])
+
+    common_divisor = math.gcd(sum_n, common)
+    if common_divisor > 1:
+        reduced_n, reduced_d = sum_n // common_divisor, common // common_divisor
+        steps.extend([
+            ("bold", "--- КРОК 4: СКОРОЧЕННЯ РЕЗУЛЬТАТУ ---"),
+            ("normal", f"Отриманий дріб ({sum_n}/{common}) можна скоротити."),
+            ("normal", f"Знайдемо найбільший спільний дільник (НСД) для {sum_n} і {common}. НСД = {common_divisor}."),
+            ("normal",
+             f"Поділимо чисельник і знаменник на {common_divisor}:\n({sum_n}/{common}) -> ({reduced_n}/{reduced_d})"),
+            ("bold", f"Кінцева відповідь: {reduced_n}/{reduced_d}")
+        ])
+    return steps
+
+
+@_memoized
+def common_denominator_solution(n1, d1, n2, d2, subtract=False):
+    """Додавання або віднімання з попереднім скороченням дробів (dodav. drob.py, vidn. drob lvl1.py)."""
+    steps = []
+    reduction_steps_text = []
+    gcd1 = math.gcd(n1, d1)
+    if gcd1 > 1:
+        reduced_n1, reduced_d1 = n1 // gcd1, d1 // gcd1
+        reduction_steps_text.append(f"1. Скоротимо перший дріб: ({n1}/{d1}) -> ({reduced_n1}/{reduced_d1})")
+        n1, d1 = reduced_n1, reduced_d1
+
+    gcd2 = math.gcd(n2, d2)
+    if gcd2 > 1:
+        reduced_n2, reduced_d2 = n2 // gcd2, d2 // gcd2
+        reduction_steps_text.append(f"2. Скоротимо другий дріб: ({n2}/{d2}) -> ({reduced_n2}/{reduced_d2})")
+        n2, d2 = reduced_n2, reduced_d2
+
+    if reduction_steps_text:
+        steps.append(("bold", "--- КРОК 1: ПОПЕРЕДНЄ СКОРОЧЕННЯ ---"))
+        steps.append(("normal", "\n".join(reduction_steps_text)))
+
+    # Подальші кроки використовують вже скорочені дроби
+    steps.extend(lcm_explanation(d1, d2, detailed=False))
+
+    common = lcm(d1, d2)
+    m1, m2 = common // d1, common // d2
+    if subtract:
+        result_n = (n1 * m1) - (n2 * m2)
+        title, sign, action = "ВІДНІМАННЯ ДРОБІВ", "-", "Віднімемо"
+    else:
+        result_n = (n1 * m1) + (n2 * m2)
+        title, sign, action = "ДОДАВАННЯ ДРОБІВ", "+", "Додамо"
+    steps.extend([
+        ("bold", f"--- КРОК 4: {title} ---"),
+        ("normal",
+         f"1. Домножимо дроби на множники:\n({n1}/{d1}) {sign} ({n2}/{d2}) -> ({(n1 * m1)}/{common}) {sign} ({(n2 * m2)}/{common})"),
+        ("normal", f"2. {action} чисельники:\n= ({result_n}/{common})"),
+    ])
+
+    final_n, final_d = result_n, common
+    common_divisor = math.gcd(result_n, common)
+    if common_divisor > 1:
+        final_n, final_d = result_n // common_divisor, common // common_divisor
+        steps.extend([
+            ("bold", "--- КРОК 5: СКОРОЧЕННЯ РЕЗУЛЬТАТУ ---"),
+            ("normal", f"Знайдемо НСД для {result_n} і {common}. НСД = {common_divisor}."),
+            ("normal",
+             f"Поділимо чисельник і знаменник на {common_divisor}:\n({result_n}/{common}) -> ({final_n}/{final_d})"),
+        ])
+    steps.append(("bold", f"Кінцева відповідь: {final_n}/{final_d}"))
+    return steps
+
+
+def _final_mixed_steps(steps, final_w, final_f_n, common):
+    """Скорочення й кінцева відповідь для мішаних чисел (спільна частина обох тренажерів рівня 2)."""
+    final_n = final_w * common + final_f_n
+    final_d = common
+    common_divisor = math.gcd(final_n, final_d)
+    if common_divisor > 1 and final_n != 0:
+        steps.append(("bold", "--- КРОК 4: СКОРОЧЕННЯ ---"))
+        reduced_n, reduced_d = final_n // common_divisor, final_d // common_divisor
+        steps.append(("normal",
+                      f"Перетворимо результат {final_w} {final_f_n}/{common} на неправильний дріб {final_n}/{common} і скоротимо його:\n({final_n}/{common}) -> ({reduced_n}/{reduced_d})"))
+        final_n, final_d = reduced_n, reduced_d
+
+    if final_n >= final_d and final_d != 0:
+        rw, rn = divmod(final_n, final_d)
+        steps.append(("bold", f"Кінцева відповідь: {rw} {rn}/{final_d}" if rn > 0 else str(rw)))
+    else:
+        steps.append(("bold", f"Кінцева відповідь: {final_n}/{final_d}"))
+    return steps
+
+
+@_memoized
+def mixed_addition_solution(n1, d1, n2, d2):
+    """Додавання мішаних чисел, заданих неправильними дробами n1/d1 і n2/d2."""
+    w1, f_n1 = divmod(n1, d1)
+    w2, f_n2 = divmod(n2, d2)
+    common = lcm(d1, d2)
+    new_f_n1, new_f_n2 = f_n1 * (common // d1), f_n2 * (common // d2)
+    steps = [
+        ("bold", "--- КРОК 1: ЗВЕДЕННЯ ДО СПІЛЬНОГО ЗНАМЕННИКА ---"),
+        ("normal",
+         f"НСК для {d1} і {d2} є {common}.\n{w1} {f_n1}/{d1} + {w2} {f_n2}/{d2} -> {w1} {new_f_n1}/{common} + {w2} {new_f_n2}/{common}"),
+    ]
+
+    final_w, final_f_n = w1 + w2, new_f_n1 + new_f_n2
+    steps.append(("bold", "--- КРОК 2: ДОДАВАННЯ ---"))
+    steps.append(("normal",
+                  f"1. Цілі частини: {w1} + {w2} = {final_w}\n2. Дробові частини: ({new_f_n1}/{common}) + ({new_f_n2}/{common}) = ({final_f_n}/{common})"))
+
+    if final_f_n >= common:
+        steps.append(("bold", "--- КРОК 3: ПЕРЕТВОРЕННЯ НЕПРАВИЛЬНОГО ДРОБУ ---"))
+        carried_w, remaining_f_n = divmod(final_f_n, common)
+        steps.append(("normal",
+                      f"Дробова частина {final_f_n}/{common} є неправильним дробом.\nВиділяємо цілу частину: {final_f_n} / {common} = {carried_w} (цілих) і {remaining_f_n} (залишок)."))
+        final_w += carried_w
+        final_f_n = remaining_f_n
+        steps.append(("normal",
+                      f"Додаємо цілі частини: {final_w - carried_w} + {carried_w} = {final_w}.\nОтримуємо: {final_w} {final_f_n}/{common}"))
+
+    return _final_mixed_steps(steps, final_w, final_f_n, common)
+
+
+@_memoized
+def mixed_subtraction_solution(n1, d1, n2, d2):
+    """Віднімання мішаних чисел з «позичанням» одиниці, якщо дробова частина зменшуваного менша."""
+    w1, f_n1 = divmod(n1, d1)
+    w2, f_n2 = divmod(n2, d2)
+    common = lcm(d1, d2)
+    new_f_n1, new_f_n2 = f_n1 * (common // d1), f_n2 * (common // d2)
+    steps = [
+        ("bold", "--- КРОК 1: ЗВЕДЕННЯ ДО СПІЛЬНОГО ЗНАМЕННИКА ---"),
+        ("normal",
+         f"НСК для {d1} і {d2} є {common}.\n{w1} {f_n1}/{d1} - {w2} {f_n2}/{d2} -> {w1} {new_f_n1}/{common} - {w2} {new_f_n2}/{common}"),
+    ]
+
+    if new_f_n1 < new_f_n2:
+        steps.append(("bold", "--- КРОК 2: 'ПОЗИЧАННЯ' ОДИНИЦІ ---"))
+        steps.append(("normal",
+                      f"Оскільки {new_f_n1} < {new_f_n2}, позичаємо 1 від цілої частини ({w1}).\n1 = {common}/{common}."))
+        w1 -= 1
+        new_f_n1 += common
+        steps.append(("normal", f"Отримуємо: {w1} і ({new_f_n1}/{common})"))
+
+    final_w, final_f_n = w1 - w2, new_f_n1 - new_f_n2
+    steps.append(("bold", "--- КРОК 3: ВІДНІМАННЯ ---"))
+    steps.append(("normal",
+                  f"1. Цілі частини: {w1} - {w2} = {final_w}\n2. Дробові частини: ({new_f_n1}/{common}) - ({new_f_n2}/{common}) = ({final_f_n}/{common})"))
+
+    return _final_mixed_steps(steps, final_w, final_f_n, common)
+
+
+@_memoized
+def reduction_solution(n, d):
+    """Скорочення дробу n/d через НСД, знайдений розкладом на прості множники."""
+    gcd = math.gcd(n, d)
+    correct_n, correct_d = n // gcd, d // gcd
+    n_factors_str = ' * '.join(map(str, prime_factorization(n)))
+    d_factors_str = ' * '.join(map(str, prime_factorization(d)))
+    return [
+        ("bold", "--- КРОК 1: ПОШУК НАЙБІЛЬШОГО СПІЛЬНОГО ДІЛЬНИКА (НСД) ---"),
+        ("normal",
+         f"Щоб скоротити дріб, потрібно знайти найбільше число, на яке ділиться і чисельник ({n}), і знаменник ({d})."),
+        ("normal", f"1. Розкладемо числа на прості множники:\n   {n} = {n_factors_str}\n   {d} = {d_factors_str}"),
+        ("normal", "2. Знайдемо спільні множники в обох розкладах і перемножимо їх. Це і буде НСД."),
+        ("normal", f"   НСД({n}, {d}) = {gcd}"),
+        ("bold", "--- КРОК 2: СКОРОЧЕННЯ ДРОБУ ---"),
+        ("normal", f"Тепер поділимо чисельник і знаменник на їх НСД, тобто на {gcd}."),
+        ("normal", f"Чисельник: {n} ÷ {gcd} = {correct_n}\nЗнаменник: {d} ÷ {gcd} = {correct_d}"),
+        ("normal", f"({n}/{d}) -> ({correct_n}/{correct_d})"),
+        ("bold", "--- РЕЗУЛЬТАТ ---"),
+        ("normal", f"Скорочений дріб: {correct_n}/{correct_d}")
+    ]
+
+
+def mixed_to_improper_solution(w, n, d):
+    step1_res = w * d
+    final_num = step1_res + n
+    return [
+        ("bold", f"--- Перетворення мішаного числа {w} {n}/{d} в неправильний дріб ---"),
+        ("bold", "--- КРОК 1: Множимо цілу частину на знаменник ---"),
+        ("normal",
+         f"Щоб перетворити мішане число, спочатку помножте цілу частину ({w}) на знаменник ({d})."),
+        ("normal",
+         f"{w} × {d} = {step1_res}"),
+        ("bold", "--- КРОК 2: Додаємо чисельник до результату ---"),
+        ("normal",
+         f"Додайте отриманий результат ({step1_res}) до чисельника ({n}) мішаного числа. Це буде новий чисельник неправильного дробу."),
+        ("normal",
+         f"{step1_res} + {n} = {final_num}"),
+        ("bold", "--- КРОК 3: Формуємо неправильний дріб ---"),
+        ("normal",
+         f"Новий чисельник - {final_num}, а знаменник залишається таким же, як і в початкового мішаного числа ({d})."),
+        ("normal",
+         f"{w} {n}/{d} -> {final_num}/{d}"),
+        ("bold", "--- РЕЗУЛЬТАТ ---"),
+        ("normal", f"Мішане число {w} {n}/{d} перетворюється в неправильний дріб: {final_num}/{d}")
+    ]
+
+
+def improper_to_mixed_solution(num_imp, den_imp):
+    whole_res, remainder_res = divmod(num_imp, den_imp)
+    simplified_num, simplified_den = remainder_res, den_imp
+    # Якщо є можливість скоротити дробову частину
+    if remainder_res != 0:
+        simplified_num, simplified_den = reduce_fraction(remainder_res, den_imp)
+    return [
+        ("bold", f"--- Перетворення неправильного дробу {num_imp}/{den_imp} в мішане число ---"),
+        ("bold", "--- КРОК 1: Ділимо чисельник на знаменник ---"),
+        ("normal",
+         f"Щоб перетворити неправильний дріб, поділіть чисельник ({num_imp}) на знаменник ({den_imp})."),
+        ("normal",
+         f"{num_imp} ÷ {den_imp} = {whole_res} (ціла частина) з залишком {remainder_res} (новий чисельник)."),
+        ("bold", "--- КРОК 2: Формуємо мішане число ---"),
+        ("normal",
+         f"Ціла частина дробу стає цілою частиною мішаного числа ({whole_res})."),
+        ("normal",
+         f"Залишок від ділення ({remainder_res}) стає чисельником дробової частини."),
+        ("normal",
+         f"Знаменник залишається без змін ({den_imp})."),
+        ("normal",
+         f"({num_imp}/{den_imp}) -> {whole_res} {remainder_res}/{den_imp}"),
+        ("normal",
+         f"Скорочуємо дробову частину, якщо можливо: {remainder_res}/{den_imp} -> {simplified_num}/{simplified_den}"),
+        ("bold", "--- РЕЗУЛЬТАТ ---"),
+        ("normal",
+         f"Неправильний дріб {num_imp}/{den_imp} перетворюється в мішане число: {whole_res} {simplified_num}/{simplified_den}")
+    ]
+
+
+@_memoized
+def conversion_solution(task):
+    """Кроки для завдання з tasks.conversion_task."""
+    task_type, whole, num, den, improper_num = task
+    if task_type == MIXED_TO_IMPROPER:
+        return mixed_to_improper_solution(whole, num, den)
+    return improper_to_mixed_solution(improper_num, den)
@@ -0,0 +1,108 @@
+"""Відтворювані потоки завдань: завдання номер k залежить лише від (seed, k).
+
+Кожне завдання генерується власним CounterRandom, стан якого — хеш (seed, k, лічильник
+викликів), а не результат попередніх завдань. Тому task(k) рахується одразу, без
+генерації 0..k-1, дві дошки з однаковим seed показують ту саму послідовність, а сеанс
+учня можна відтворити за seed і номером завдання. Сервер класу може роздавати номери
+завдань замість списків.
+
+FRACTIONS_SEED=<число> задає seed для тренажерів, FRACTIONS_TASK=<номер> — з якого завдання почати,
+FRACTIONS_SEED_LOG=1 друкує вибраний seed, щоб сеанс можна було повторити.
+"""
+import os
+import random
+import sys
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+def _mix64(x):
+    """Фіналізатор SplitMix64: кожен біт входу впливає на кожен біт виходу."""
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK64
+    return x ^ (x >> 31)
+
+
+class CounterRandom(random.Random):
+    """random.Random, у якого i-те 64-бітне число — _mix64(ключ + i * φ), а ключ задається seed.
+
+    Усі похідні методи (randint, choice, choices, shuffle...) працюють через random() і
+    getrandbits(), тож генератори завдань приймають його як звичайний rng.
+
+    seed — ціле число (береться за модулем 2**64); seed(None), як і в random.Random, бере ключ
+    з os.urandom, тож такий генератор не відтворюється. Інші типи seed відкидаються з TypeError.
+    """
+
+    def seed(self, a=None, version=2):
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        elif not isinstance(a, int):
+            raise TypeError(f"seed CounterRandom має бути цілим числом або None, отримано {type(a).__name__}")
+        self._key = _mix64(a & _MASK64)
+        self._counter = 0
+        self.gauss_next = None  # друге число пари з gauss() від попереднього seed
+
+    def _next64(self):
+        self._counter += 1
+        return _mix64((self._key + self._counter * _GOLDEN) & _MASK64)
+
+    def random(self):
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k):
+        bits, filled = 0, 0
+        while filled < k:
+            bits |= self._next64() << filled
+            filled += 64
+        return bits & ((1 << k) - 1)
+
+    def getstate(self):
+        return self._key, self._counter, self.gauss_next
+
+    def setstate(self, state):
+        self._key, self._counter, self.gauss_next = state
+
+
+def task_key(seed, k):
+    """Ключ CounterRandom для завдання k потоку seed."""
+    return _mix64((_mix64(seed & _MASK64) + k * _GOLDEN) & _MASK64)
+
+
+class TaskStream:
+    """Нескінченна відтворювана послідовність завдань generate(*args, rng=...).
+
+    next() видає завдання за порядком, task(k) — будь-яке за O(1), seek(k) переставляє позицію.
+    """
+
+    def __init__(self, generate, *args, seed=None, position=0):
+        self.generate, self.args = generate, args
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.position = position
+
+    def task(self, k):
+        return self.generate(*self.args, rng=CounterRandom(task_key(self.seed, k)))
+
+    def seek(self, k):
+        self.position = k
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        task = self.task(self.position)
+        self.position += 1
+        return task
+
+
+def session_stream(generate, *args):
+    """Потік завдань тренажера; seed і початкове завдання — з FRACTIONS_SEED і FRACTIONS_TASK, якщо задані.
+
+    Без FRACTIONS_SEED seed випадковий; з FRACTIONS_SEED_LOG=1 його видно в stderr.
+    """
+    seed = os.environ.get("FRACTIONS_SEED")
+    position = int(os.environ.get("FRACTIONS_TASK", "0"))
+    stream = TaskStream(generate, *args, seed=int(seed) if seed else None, position=position)
+    if not seed and os.environ.get("FRACTIONS_SEED_LOG", "") not in ("", "0"):
+        print(f"FRACTIONS_SEED={stream.seed} повторить завдання цього сеансу", file=sys.stderr)
+    return stream
@@ -0,0 +1,158 @@
+"""Заздалегідь перелічені множини допустимих завдань.
+
+Замість «генеруй, доки не підійде» кожен генератор бере готовий індекс усіх допустимих
+завдань і робить один рівномірний вибір. Індекс будується один раз на набір параметрів
+і спільний для всіх викликів. Розмір і кількість завдань на кожен рівень складності
+показують, що саме може випасти.
+
+Складність завдання на два дроби — спільний знаменник (НСК знаменників), який має знайти
+учень; завдання на скорочення — НСД чисельника і знаменника, тобто на скільки скорочувати;
+перетворення мішаного числа — його напрямок.
+"""
+import functools
+import math
+import random
+
+from fraction_core.arithmetic import lcm
+
+MIXED_TO_IMPROPER, IMPROPER_TO_MIXED = "mixed_to_improper", "improper_to_mixed"
+ADDITION_DENOMINATORS = range(4, 16)
+MIXED_DENOMINATORS = range(3, 9)
+MIXED_ADDITION_WHOLES = range(0, 3)
+MIXED_SUBTRACTION_WHOLES = range(1, 4)
+REDUCTION_DENOMINATORS = range(3, 13)
+REDUCTION_MULTIPLIERS = range(2, 9)
+
+
+def common_denominator(task):
+    n1, d1, n2, d2 = task
+    return lcm(d1, d2)
+
+
+def reduction_gcd(task):
+    n_task, d_task, n_corr, d_corr = task
+    return d_task // d_corr
+
+
+def conversion_type(task):
+    return task[0]
+
+
+class TaskIndex:
+    def __init__(self, tasks, difficulty=common_denominator):
+        self.tasks = tuple(tasks)
+        self.by_difficulty = {}
+        for task in self.tasks:
+            self.by_difficulty.setdefault(difficulty(task), []).append(task)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    @property
+    def counts(self):
+        """{складність: кількість завдань}, за зростанням складності."""
+        return {level: len(self.by_difficulty[level]) for level in sorted(self.by_difficulty)}
+
+    def draw(self, rng=random, difficulty=None, weights=None):
+        """Рівномірно випадкове завдання — з усього індексу або лише заданої складності.
+
+        weights — {складність: вага}: спершу за вагами вибирається рівень, потім завдання в ньому.
+        Рівні без ваги не випадають; якщо додатної ваги немає в жодного рівня індексу — ValueError.
+        """
+        if weights is not None:
+            levels = [level for level in self.by_difficulty if weights.get(level, 0) > 0]
+            if not levels:
+                raise ValueError(f"Жоден рівень складності індексу ({', '.join(map(str, self.by_difficulty))}) "
+                                 f"не має додатної ваги у {weights}")
+            difficulty = rng.choices(levels, weights=[weights[level] for level in levels])[0]
+        return rng.choice(self.tasks if difficulty is None else self.by_difficulty[difficulty])
+
+    def stream(self, rng=random):
+        """Завдання індексу у випадковому порядку, кожне рівно один раз.
+
+        Перестановка Фішера–Єйтса робиться ліниво: кожне наступне завдання коштує O(1).
+        """
+        pool = list(self.tasks)
+        for end in range(len(pool) - 1, -1, -1):
+            pick = rng.randint(0, end)
+            pool[pick], pool[end] = pool[end], pool[pick]
+            yield pool[end]
+
+    def summary(self):
+        counts = self.counts
+        levels = ", ".join(f"{level}: {count}" for level, count in counts.items())
+        return f"{len(self)} завдань, {len(counts)} рівнів складності ({levels})"
+
+
+def _proper_fractions(denominators):
+    return [(n, d) for d in denominators for n in range(1, d)]
+
+
+def _mixed_numbers(denominators, wholes):
+    return [(w * d + n, d) for d in denominators for w in wholes for n in range(1, d)]
+
+
+@functools.lru_cache(maxsize=None)
+def addition_index(max_denominator):
+    """Два правильні дроби з різними знаменниками 4–15, НСК яких не більший за max_denominator."""
+    fractions = _proper_fractions(ADDITION_DENOMINATORS)
+    return TaskIndex((n1, d1, n2, d2) for n1, d1 in fractions for n2, d2 in fractions
+                     if d1 != d2 and lcm(d1, d2) <= max_denominator)
+
+
+@functools.lru_cache(maxsize=None)
+def subtraction_index(max_denominator):
+    """Як addition_index, але зменшуване не менше за від'ємник."""
+    return TaskIndex(task for task in addition_index(max_denominator).tasks
+                     if task[0] * task[3] >= task[2] * task[1])
+
+
+@functools.lru_cache(maxsize=None)
+def mixed_addition_index():
+    """Два мішані числа з цілими 0–2 і різними знаменниками 3–8, записані неправильними дробами."""
+    numbers = _mixed_numbers(MIXED_DENOMINATORS, MIXED_ADDITION_WHOLES)
+    return TaskIndex((n1, d1, n2, d2) for n1, d1 in numbers for n2, d2 in numbers if d1 != d2)
+
+
+def _needs_borrowing(n1, d1, n2, d2):
+    common = lcm(d1, d2)
+    w1, f_n1 = divmod(n1 * (common // d1), common)
+    w2, f_n2 = divmod(n2 * (common // d2), common)
+    return w1 < w2 or f_n1 < f_n2
+
+
+@functools.lru_cache(maxsize=None)
+def mixed_subtraction_index():
+    """Мішані числа n1/d1 > n2/d2 (цілих у від'ємника не більше), для яких треба позичати одиницю."""
+    minuends = _mixed_numbers(MIXED_DENOMINATORS, MIXED_SUBTRACTION_WHOLES)
+    subtrahends = _mixed_numbers(MIXED_DENOMINATORS, range(0, MIXED_SUBTRACTION_WHOLES[-1] + 1))
+    return TaskIndex((n1, d1, n2, d2) for n1, d1 in minuends for n2, d2 in subtrahends
+                     if d1 != d2 and n2 // d2 <= n1 // d1 and n1 * d2 > n2 * d1
+                     and _needs_borrowing(n1, d1, n2, d2))
+
+
+@functools.lru_cache(maxsize=None)
+def reduction_index(max_denominator):
+    """(n_task, d_task, n_corr, d_corr): нескоротний дріб зі знаменником 3–12, домножений на 2–8,
+    зі знаменником завдання не більшим за max_denominator."""
+    return TaskIndex(((n * k, d * k, n, d) for n, d in _proper_fractions(REDUCTION_DENOMINATORS)
+                      if math.gcd(n, d) == 1 for k in REDUCTION_MULTIPLIERS if d * k <= max_denominator),
+                     difficulty=reduction_gcd)
+
+
+@functools.lru_cache(maxsize=None)
+def conversion_index(max_denominator, max_whole_part, max_improper_numerator):
+    """(task_type, whole, num, den, improper_num): мішане число whole num/den і рівний йому неправильний дріб.
+
+    Мішані числа мають цілу частину 1–max_whole_part, неправильні дроби — чисельник до
+    max_improper_numerator, що не ділиться націло на знаменник.
+    """
+    tasks = [(MIXED_TO_IMPROPER, whole, num, den, whole * den + num)
+             for num, den in _proper_fractions(range(2, max_denominator + 1))
+             for whole in range(1, max_whole_part + 1)]
+    for den in range(2, max_denominator + 1):
+        for improper_num in range(den + 1, max_improper_numerator + 1):
+            whole, num = divmod(improper_num, den)
+            if num:
+                tasks.append((IMPROPER_TO_MIXED, whole, num, den, improper_num))
+    return TaskIndex(tasks, difficulty=conversion_type)
@@ -0,0 +1,47 @@
+"""Генератори завдань тренажерів.
+
+Кожен генератор повертає стан завдання у тому вигляді, який приймає _load_state відповідного
+тренажера. rng — будь-що з інтерфейсом random.Random; за замовчуванням модуль random.
+Усі завдання вибираються з готових індексів task_index.
+"""
+import random
+
+from fraction_core.task_index import (IMPROPER_TO_MIXED, MIXED_TO_IMPROPER, addition_index, conversion_index,
+                                       mixed_addition_index, mixed_subtraction_index, reduction_index,
+                                       subtraction_index)
+
+CONVERSION_WEIGHTS = {MIXED_TO_IMPROPER: 1, IMPROPER_TO_MIXED: 1}
+
+
+def addition_task(max_denominator, rng=random):
+    """(n1, d1, n2, d2): два правильні дроби з різними знаменниками 4–15 і НСК <= max_denominator."""
+    return addition_index(max_denominator).draw(rng)
+
+
+def subtraction_task(max_denominator, rng=random):
+    """Як addition_task, але зменшуване не менше за від'ємник."""
+    return subtraction_index(max_denominator).draw(rng)
+
+
+def mixed_addition_task(rng=random):
+    """(n1, d1, n2, d2) для двох мішаних чисел з цілими 0–2, записаних неправильними дробами."""
+    return mixed_addition_index().draw(rng)
+
+
+def mixed_subtraction_task(rng=random):
+    """Мішані числа n1/d1 > n2/d2, для яких після зведення до НСК треба позичати одиницю."""
+    return mixed_subtraction_index().draw(rng)
+
+
+def reduction_task(max_denominator, rng=random):
+    """(n_task, d_task, n_corr, d_corr): нескоротний дріб, домножений на 2–8, зі знаменником <= max_denominator."""
+    return reduction_index(max_denominator).draw(rng)
+
+
+def conversion_task(max_denominator, max_whole_part, max_improper_numerator, rng=random):
+    """(task_type, whole, num, den, improper_num): мішане число whole num/den і рівний йому неправильний дріб.
+
+    Обидва напрямки перетворення випадають однаково часто.
+    """
+    index = conversion_index(max_denominator, max_whole_part, max_improper_numerator)
+    return index.draw(rng, weights=CONVERSION_WEIGHTS)
@@ -0,0 +1,200 @@
+"""Аркуші завдань без вікна: потік завдань з відповідями у CSV або JSONL.
+
+Запуск з кореня репозиторію:
+    python -m fraction_core.worksheet -n 30 --family addition --family reduction --seed 7 -o 5a.csv
+
+Обмеження ті самі, що в тренажерах (НСК <= 100, MAX_WHOLE_PART тощо), бо завдання беруться
+з тих самих індексів task_index. Для кожного завдання індексу рядок CSV/JSONL форматується
+один раз; генерація аркуша — це лише випадковий вибір готових рядків, тож 100 тис. завдань
+виходять за десятки мілісекунд. Однаковий --seed дає однаковий аркуш.
+"""
+import argparse
+import csv
+import functools
+import io
+import itertools
+import json
+import random
+import sys
+
+from fraction_core.checking import mixed_result
+from fraction_core.task_index import (MIXED_TO_IMPROPER, addition_index, conversion_index, mixed_addition_index,
+                                      mixed_subtraction_index, reduction_index, subtraction_index)
+
+# Як у тренажерах: main.py, «dodav. drob.py», «vidn. drob lvl1.py», skor.drob.py
+MAX_DENOMINATOR = 100
+# Як у «mix to neprav drib.py»
+CONVERSION_MAX_DENOMINATOR = 10
+MAX_WHOLE_PART = 5
+MAX_IMPROPER_NUMERATOR = CONVERSION_MAX_DENOMINATOR * MAX_WHOLE_PART + CONVERSION_MAX_DENOMINATOR - 1
+
+CHUNK_SIZE = 10000
+FORMATS = ("csv", "jsonl")
+
+
+def format_mixed(n, d):
+    """n/d як мішане число: «2 1/3», «2» або «1/3»."""
+    whole, rest = divmod(n, d)
+    if not rest:
+        return str(whole)
+    return f"{whole} {rest}/{d}" if whole else f"{rest}/{d}"
+
+
+def _addition(task):
+    n1, d1, n2, d2 = task
+    return f"{n1}/{d1} + {n2}/{d2}", format_mixed(*mixed_result(n1, d1, n2, d2))
+
+
+def _subtraction(task):
+    n1, d1, n2, d2 = task
+    return f"{n1}/{d1} - {n2}/{d2}", format_mixed(*mixed_result(n1, d1, n2, d2, subtract=True))
+
+
+def _reduction(task):
+    n_task, d_task, n_corr, d_corr = task
+    return f"{n_task}/{d_task}", f"{n_corr}/{d_corr}"
+
+
+def _conversion(task):
+    task_type, whole, num, den, improper_num = task
+    if task_type == MIXED_TO_IMPROPER:
+        return f"{whole} {num}/{den}", f"{improper_num}/{den}"
+    return f"{improper_num}/{den}", format_mixed(improper_num, den)
+
+
+def _mixed_addition(task):
+    n1, d1, n2, d2 = task
+    return (f"{format_mixed(n1, d1)} + {format_mixed(n2, d2)}",
+            format_mixed(*mixed_result(n1, d1, n2, d2)))
+
+
+def _mixed_subtraction(task):
+    n1, d1, n2, d2 = task
+    return (f"{format_mixed(n1, d1)} - {format_mixed(n2, d2)}",
+            format_mixed(*mixed_result(n1, d1, n2, d2, subtract=True)))
+
+
+# назва: (індекс завдань, текст завдання й відповіді, чи випадають рівні складності однаково часто)
+FAMILIES = {
+    "addition": (lambda: addition_index(MAX_DENOMINATOR), _addition, False),
+    "subtraction": (lambda: subtraction_index(MAX_DENOMINATOR), _subtraction, False),
+    "reduction": (lambda: reduction_index(MAX_DENOMINATOR), _reduction, False),
+    "conversion": (lambda: conversion_index(CONVERSION_MAX_DENOMINATOR, MAX_WHOLE_PART, MAX_IMPROPER_NUMERATOR),
+                   _conversion, True),
+    "mixed_addition": (mixed_addition_index, _mixed_addition, False),
+    "mixed_subtraction": (mixed_subtraction_index, _mixed_subtraction, False),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def family_table(family, fmt):
+    """Готові рядки (без номера) для кожного завдання індексу родини, у порядку index.tasks."""
+    build_index, describe, equal_levels = FAMILIES[family]
+    rows = []
+    for task in build_index().tasks:
+        text, answer = describe(task)
+        if fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="").writerow([family, text, answer])
+            rows.append(buffer.getvalue())
+        else:
+            rows.append(json.dumps({"family": family, "task": text, "answer": answer}, ensure_ascii=False)[1:])
+    return rows
+
+
+@functools.lru_cache(maxsize=None)
+def family_weights(family):
+    """Накопичені ваги завдань індексу родини для rng.choices або None, якщо всі завдання рівноймовірні."""
+    build_index, describe, equal_levels = FAMILIES[family]
+    if not equal_levels:
+        return None
+    # Як у тренажері: обидва напрямки перетворення однаково часто, хоч завдань у них різна кількість
+    index = build_index()
+    level_of = {task: level for level, tasks in index.by_difficulty.items() for task in tasks}
+    return list(itertools.accumulate(1 / len(index.by_difficulty[level_of[task]]) for task in index.tasks))
+
+
+def sample_tasks(families, count, rng=random, chunk_size=CHUNK_SIZE):
+    """Вибір завдань аркуша: списки (родина, номер завдання в індексі родини) по chunk_size штук.
+
+    Єдиний вибір і для CSV/JSONL, і для PDF (fraction_ui.worksheet_pdf), тож однаковий seed дає
+    ті самі завдання в обох. Родина кожного завдання випадкова й рівноймовірна; повтори в families
+    не збільшують її частку.
+    """
+    families = list(dict.fromkeys(families))
+    sizes = {family: len(FAMILIES[family][0]()) for family in families}
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        order = rng.choices(families, k=size) if len(families) > 1 else families * size
+        picked = {family: iter(rng.choices(range(sizes[family]), cum_weights=family_weights(family),
+                                           k=order.count(family)))
+                  for family in families}
+        yield [(family, next(picked[family])) for family in order]
+
+
+def sheet_tasks(families, count, rng=random):
+    """count завдань одного аркуша як (родина, завдання, текст завдання, відповідь)."""
+    tasks = []
+    for chunk in sample_tasks(families, count, rng):
+        for family, position in chunk:
+            build_index, describe, equal_levels = FAMILIES[family]
+            task = build_index().tasks[position]
+            tasks.append((family, task, *describe(task)))
+    return tasks
+
+
+def worksheet_lines(families, count, seed=0, fmt="csv", chunk_size=CHUNK_SIZE):
+    """Потік готових рядків (без \\n) аркуша з count завдань; родина кожного завдання випадкова."""
+    tables = {family: family_table(family, fmt) for family in families}
+    if fmt == "csv":
+        yield "n,family,task,answer"
+    template = "{},{}" if fmt == "csv" else '{{"n": {}, {}'
+    number = 1
+    for chunk in sample_tasks(families, count, random.Random(seed), chunk_size):
+        for family, position in chunk:
+            yield template.format(number, tables[family][position])
+            number += 1
+
+
+def write_worksheet(out, families, count, seed=0, fmt="csv", chunk_size=CHUNK_SIZE):
+    lines = worksheet_lines(families, count, seed, fmt, chunk_size)
+    while True:
+        block = list(itertools.islice(lines, chunk_size))
+        if not block:
+            return
+        out.write("\n".join(block))
+        out.write("\n")
+
+
+def non_negative_int(text):
+    """Тип argparse для кількостей: ціле число, не менше нуля."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"очікується ціле число, отримано {text!r}") from None
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"кількість не може бути від'ємною: {value}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Аркуш завдань на дроби з відповідями у CSV або JSONL.")
+    parser.add_argument("-n", "--count", type=non_negative_int, default=30, help="скільки завдань (за замовчуванням 30)")
+    parser.add_argument("--family", action="append", choices=list(FAMILIES),
+                        help="родина завдань; можна кілька разів, за замовчуванням усі")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=FORMATS, help="за замовчуванням — за розширенням файлу, інакше csv")
+    parser.add_argument("-o", "--output", help="файл; без нього — стандартний вивід")
+    args = parser.parse_args(argv)
+
+    families = args.family or list(FAMILIES)
+    fmt = args.format or ("jsonl" if (args.output or "").endswith((".jsonl", ".json")) else "csv")
+    if args.output is None:
+        write_worksheet(sys.stdout, families, args.count, args.seed, fmt)
+        return
+    with open(args.output, "w", encoding="utf-8", newline="") as out:
+        write_worksheet(out, families, args.count, args.seed, fmt)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Спільні допоміжні засоби відображення для всіх тренажерів дробів."""
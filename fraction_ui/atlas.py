@@ -0,0 +1,193 @@
+"""Необов'язковий атлас заздалегідь растеризованих кругів дробів.
+
+Для знаменників 2–40 круг повністю визначається чисельниками, кольорами та знаменником,
+тому його можна один раз намалювати в RGBA-масив NumPy і далі показувати як зображення
+(AxesImage) замість секторів і роздільників. Вмикається змінною середовища FRACTIONS_ATLAS=1;
+FRACTIONS_ATLAS_DIR=<тека> додатково зберігає спрайти на диск між запусками.
+"""
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+
+from fraction_ui.pies import PieArtist
+
+
+def atlas_enabled():
+    return os.environ.get("FRACTIONS_ATLAS", "") not in ("", "0")
+
+
+class PieAtlas:
+    """Спрайти кругів одного стилю: LRU у пам'яті та, за бажання, .npz-файли на диску."""
+
+    # Запас навколо круга, щоб контур товщиною в кілька пікселів не обрізався
+    MARGIN = 0.03
+
+    def __init__(self, empty_color='#E0E0E0', wedgeprops=None, divider_limit=None, size_px=256,
+                 denominators=range(2, 41), max_sprites=256, cache_dir=None):
+        self.denominators = denominators
+        self.size_px = size_px
+        self.max_sprites = max_sprites
+        self.cache_dir = cache_dir
+        self.hits, self.misses, self.disk_hits = 0, 0, 0
+        self._sprites = OrderedDict()
+
+        style = (empty_color, sorted((wedgeprops or {}).items()), divider_limit, size_px, self.MARGIN)
+        self._style_key = hashlib.sha1(repr(style).encode()).hexdigest()[:12]
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        # Одна невидима фігура на весь атлас: круг на ній лише оновлюється, як і в тренажерах
+        dpi = 100
+        figure = Figure(figsize=(size_px / dpi, size_px / dpi), dpi=dpi, facecolor='none')
+        self._canvas = FigureCanvasAgg(figure)
+        ax = figure.add_axes((0, 0, 1, 1))
+        ax.set_axis_off()
+        limit = 1 + self.MARGIN
+        ax.set(xlim=(-limit, limit), ylim=(-limit, limit))
+        self._pie = PieArtist(ax, empty_color=empty_color, max_wedges=3, wedgeprops=wedgeprops,
+                              divider_limit=divider_limit)
+
+    def covers(self, denominator):
+        return denominator in self.denominators
+
+    def sprite(self, numerators, colors, denominator):
+        """RGBA-масив (size_px, size_px, 4) для круга радіуса 1 з полем MARGIN."""
+        key = (tuple(numerators), tuple(colors), denominator)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = self._load(key)
+        if sprite is None:
+            sprite = self._render(key)
+            self._save(key, sprite)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def warm(self, colors, empty_numerator=True):
+        """Растеризує всі n/d для кожного кольору з colors (наприклад, під час запуску)."""
+        for color in colors:
+            for den in self.denominators:
+                for num in range(0 if empty_numerator else 1, den + 1):
+                    self.sprite((num,), (color,), den)
+
+    def nbytes(self):
+        return sum(sprite.nbytes for sprite in self._sprites.values())
+
+    def _render(self, key):
+        numerators, colors, denominator = key
+        self._pie.update(numerators, colors, denominator)
+        self._canvas.draw()
+        sprite = np.asarray(self._canvas.buffer_rgba()).copy()
+        sprite.flags.writeable = False
+        return sprite
+
+    def _path(self, key):
+        name = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{self._style_key}-{name}.npz")
+
+    def _load(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            with np.load(self._path(key)) as data:
+                sprite = data['rgba']
+        except (OSError, KeyError, ValueError):
+            return None
+        self.disk_hits += 1
+        sprite.flags.writeable = False
+        return sprite
+
+    def _save(self, key, sprite):
+        if self.cache_dir:
+            np.savez_compressed(self._path(key), rgba=sprite)
+
+
+class AtlasPie:
+    """Замінник PieArtist: круги з атласу показує як зображення, решту — звичайними секторами."""
+
+    def __init__(self, ax, atlas, center=(0, 0), radius=1.0, **pie_kwargs):
+        self.ax = ax
+        self.atlas = atlas
+        self.center, self.radius = center, radius
+        self.vector = PieArtist(ax, center=center, radius=radius, **pie_kwargs)
+        self.image = AxesImage(ax, interpolation='antialiased')
+        self.image.set_visible(False)
+        ax.add_image(self.image)
+        self._from_atlas = False
+        self._sprite = None
+        self._visible = True
+
+    def update(self, numerators, colors, denominator):
+        sprite = None
+        if self.atlas.covers(denominator):
+            sprite = self.atlas.sprite(numerators, colors, denominator)
+        self._from_atlas = sprite is not None
+
+        if sprite is None:
+            changed = self.vector.update(numerators, colors, denominator)
+            self.vector.set_visible(self._visible)
+        else:
+            changed = sprite is not self._sprite
+            if changed:
+                self.image.set_data(sprite)
+                self._place_image()
+            self.vector.set_visible(False)
+        self._sprite = sprite
+        self._sync_image()
+        return changed
+
+    def set_geometry(self, center, radius):
+        if (center, radius) == (self.center, self.radius):
+            return
+        self.center, self.radius = center, radius
+        self.vector.set_geometry(center, radius)
+        self._place_image()
+
+    def set_visible(self, visible):
+        self._visible = visible
+        self.vector.set_visible(visible and not self._from_atlas)
+        self._sync_image()
+
+    def artists(self):
+        return [self.image, *self.vector.artists()]
+
+    def _place_image(self):
+        half = self.radius * (1 + PieAtlas.MARGIN)
+        cx, cy = self.center
+        self.image.set_extent((cx - half, cx + half, cy - half, cy + half))
+
+    def _sync_image(self):
+        visible = self._visible and self._from_atlas
+        if self.image.get_visible() != visible:
+            self.image.set_visible(visible)
+
+
+_ATLASES = {}
+
+
+def make_pie(ax, center=(0, 0), radius=1.0, empty_color='#E0E0E0', wedgeprops=None, divider_limit=None,
+             **pie_kwargs):
+    """PieArtist або, якщо FRACTIONS_ATLAS=1, AtlasPie зі спільним атласом для цього стилю."""
+    if not atlas_enabled():
+        return PieArtist(ax, center=center, radius=radius, empty_color=empty_color, wedgeprops=wedgeprops,
+                         divider_limit=divider_limit, **pie_kwargs)
+
+    style = (empty_color, tuple(sorted((wedgeprops or {}).items())), divider_limit)
+    atlas = _ATLASES.get(style)
+    if atlas is None:
+        atlas = _ATLASES[style] = PieAtlas(empty_color=empty_color, wedgeprops=wedgeprops,
+                                           divider_limit=divider_limit,
+                                           cache_dir=os.environ.get("FRACTIONS_ATLAS_DIR") or None)
+    return AtlasPie(ax, atlas, center=center, radius=radius, empty_color=empty_color, wedgeprops=wedgeprops,
+                    divider_limit=divider_limit, **pie_kwargs)
@@ -0,0 +1,206 @@
+"""Необов'язковий режим blit для оновлення діаграм без повного перемальовування фігури.
+
+Вмикається змінною середовища FRACTIONS_BLIT=1. Статичне тло (рамки осей, пунктирні
+роздільники тощо) зберігається після повного малювання через copy_from_bbox, а при зміні
+дробу відновлюється restore_region і поверх нього малюються лише змінні художники тих
+колонок фігури, у яких щось змінилося.
+"""
+import os
+from operator import attrgetter
+
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+
+
+def blit_enabled():
+    return os.environ.get("FRACTIONS_BLIT", "") not in ("", "0")
+
+
+def _text_state(text):
+    return text.get_text(), text.get_visible(), text.get_position(), text.get_color()
+
+
+def place_title(ax, renderer):
+    """Ставить ax.title туди, куди його поставив би Axes.draw, лише через публічні методи.
+
+    Заголовок стоїть на y=1 в координатах осей, а якщо його низ заходить нижче верху осей (або
+    підписів осі x, коли вони вгорі), піднімається так, щоб низ збігся з цим верхом. Від тексту
+    це залежить через mathtext: у \\frac знаменник опускається нижче базової лінії.
+    Заголовки з явно заданим y, осі-близнюки й заголовки loc='left'/'right' не враховуються:
+    у тренажерах їх немає.
+    """
+    title = ax.title
+    if not title.get_text():
+        return
+    bbox = None
+    if ax.xaxis.get_ticks_position() in ('top', 'unknown') or ax.xaxis.get_label_position() == 'top':
+        bbox = ax.xaxis.get_tightbbox(renderer)
+    top = (bbox or ax.get_window_extent(renderer)).ymax
+    x, _ = title.get_position()
+    title.set_position((x, 1.0))
+    if top < 0:
+        return
+    to_axes = ax.transAxes.inverted()
+    if title.get_window_extent(renderer).ymin < top:
+        title.set_position((x, to_axes.transform((0, top))[1]))
+        ymin = title.get_window_extent(renderer).ymin
+        if ymin < top:
+            title.set_position((x, to_axes.transform((0, 2 * top - ymin))[1]))
+
+
+class _Column:
+    """Вертикальна смуга фігури з осями, що перекриваються по горизонталі."""
+
+    def __init__(self, x0, x1, axes):
+        self.x0, self.x1, self.axes = x0, x1, axes
+        self.bbox = None
+        self.background = None
+
+
+class BlitManager:
+    """Показує зміни фігури через blit або, якщо blit вимкнено чи змінилося компонування, через canvas.draw()."""
+
+    def __init__(self, canvas, enabled=None):
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.enabled = blit_enabled() if enabled is None else enabled
+        self.full_draws, self.blits = 0, 0
+
+        self._axes, self._static = [], set()
+        self._columns, self._signature = [], None
+        self._text_states = {}
+        if self.enabled:
+            canvas.mpl_connect('draw_event', self._on_draw)
+
+    def reset(self):
+        """Забуває зареєстровані осі; викликається після figure.clear()."""
+        self._axes, self._static = [], set()
+        self._columns, self._signature = [], None
+        self._text_states = {}
+
+    def register(self, ax, static=()):
+        """Художники осей, окрім static, малюватимуться поверх збереженого тла."""
+        if not self.enabled:
+            return
+        self._axes.append(ax)
+        self._static.update(static)
+
+    def update(self):
+        """Показує поточний стан фігури. Повертає True, якщо вистачило blit."""
+        if not self.enabled:
+            self.canvas.draw()
+            self.full_draws += 1
+            return False
+
+        self._mark_animated()
+        if not self._columns or self._layout_signature() != self._signature:
+            return self._full_draw()
+
+        dirty = [column for column in self._columns if self._is_dirty(column)]
+        if not dirty:
+            return True
+
+        renderer = self.canvas.get_renderer()
+        for column in dirty:
+            for ax in column.axes:
+                # Те, що Axes.draw робить перед малюванням дочірніх художників: межі за aspect і
+                # положення заголовка, яке залежить від висоти його тексту
+                ax.apply_aspect()
+                place_title(ax, renderer)
+            for artist in self._column_artists(column):
+                if self._may_overflow(artist) and not self._fits(artist.get_window_extent(renderer), column.bbox):
+                    return self._full_draw()
+
+        for column in dirty:
+            self.canvas.restore_region(column.background)
+            self._draw_column(column)
+            self.canvas.blit(column.bbox)
+        self.blits += 1
+        return True
+
+    def _full_draw(self):
+        self.canvas.draw()
+        self.full_draws += 1
+        return False
+
+    def _dynamic_artists(self, ax):
+        dynamic = {*ax.patches, *ax.lines, *ax.texts, *ax.collections, *ax.images, ax.title}
+        return [a for a in ax.get_children() if a in dynamic and a not in self._static]
+
+    def _mark_animated(self):
+        for ax in self._axes:
+            for artist in self._dynamic_artists(ax):
+                if not artist.get_animated():
+                    artist.set_animated(True)
+
+    def _column_artists(self, column):
+        artists = [a for ax in column.axes for a in self._dynamic_artists(ax)]
+        return sorted(artists, key=attrgetter('zorder'))
+
+    def _layout_signature(self):
+        return (tuple(self.figure.bbox.bounds),
+                tuple(tuple(ax.get_position(original=True).bounds) for ax in self._axes))
+
+    def _is_dirty(self, column):
+        for artist in self._column_artists(column):
+            if isinstance(artist, Text):
+                if self._text_states.get(artist) != _text_state(artist):
+                    return True
+            elif artist.stale:
+                return True
+        return False
+
+    def _draw_column(self, column):
+        for artist in self._column_artists(column):
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+            artist.stale = False
+            if isinstance(artist, Text):
+                self._text_states[artist] = _text_state(artist)
+
+    def _build_columns(self, renderer):
+        spans = []
+        for ax in self._axes:
+            extent = ax.get_tightbbox(renderer) or ax.get_window_extent(renderer)
+            spans.append((extent.x0, extent.x1, ax))
+        spans.sort(key=lambda span: span[0])
+
+        columns = []
+        for x0, x1, ax in spans:
+            if columns and x0 < columns[-1].x1:
+                columns[-1].x1 = max(columns[-1].x1, x1)
+                columns[-1].axes.append(ax)
+            else:
+                columns.append(_Column(x0, x1, [ax]))
+
+        # Межі колонок ділять проміжки між сусідами навпіл, щоб смуги покривали всю ширину фігури
+        width, height = self.figure.bbox.width, self.figure.bbox.height
+        for i, column in enumerate(columns):
+            left = 0 if i == 0 else (columns[i - 1].x1 + column.x0) / 2
+            right = width if i == len(columns) - 1 else (column.x1 + columns[i + 1].x0) / 2
+            column.bbox = Bbox.from_extents(int(left), 0, int(right), height)
+        return columns
+
+    @staticmethod
+    def _may_overflow(artist):
+        """Обрізані по осях художники (лінії ax.plot) не виходять за межі своєї колонки."""
+        if not artist.get_visible():
+            return False
+        clipped = artist.get_clip_box() is not None or artist.get_clip_path() is not None
+        return not (artist.get_clip_on() and clipped)
+
+    @staticmethod
+    def _fits(extent, bbox):
+        return extent.x0 >= bbox.x0 - 1 and extent.x1 <= bbox.x1 + 1
+
+    def _on_draw(self, event):
+        if not self._axes:
+            return
+        renderer = event.renderer
+        self._columns = self._build_columns(renderer)
+        for column in self._columns:
+            column.background = self.canvas.copy_from_bbox(column.bbox)
+        self._signature = self._layout_signature()
+        self._text_states = {}
+        for column in self._columns:
+            self._draw_column(column)
@@ -0,0 +1,99 @@
+"""Кадр як транзакція: скільки б помічників не змінювало фігуру за одну подію, показ — один.
+
+Помічники (visualize, перевірка відповіді тощо) лише змінюють художників і викликають
+frames.present(). Усередині `with frames.frame("подія"):` це тільки позначає кадр зміненим,
+а компонування (LayoutCache.apply) і показ фігури (BlitManager.update) виконуються один раз,
+коли закривається найзовнішній with. Поза with present() сам є окремим кадром.
+
+FRACTIONS_DRAW_STATS=1 рахує покази фігури (повні canvas.draw через draw_event і blit) у
+кожному кадрі за подіями, одразу повідомляє в stderr про кадр з кількома показами і
+друкує підсумок під час виходу. Якщо передано profiler (fraction_ui.profiling), час
+компонування й показу записується в його фази layout і raster.
+"""
+import atexit
+import os
+import sys
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+
+OUTSIDE_FRAME = "поза кадром"
+
+
+def draw_stats_enabled():
+    return os.environ.get("FRACTIONS_DRAW_STATS", "") not in ("", "0")
+
+
+class FrameManager:
+    """Збирає зміни фігури в кадри з рівно одним показом."""
+
+    def __init__(self, blitter, layout=None, stats=None, profiler=None):
+        self.blitter, self.layout, self.profiler = blitter, layout, profiler
+        self.frames = 0
+        self.overdrawn = Counter()  # подія -> кадрів, що показали фігуру більше одного разу
+        self.per_event = defaultdict(Counter)  # подія -> {показів за кадр: кадрів}
+        self.stats = draw_stats_enabled() if stats is None else stats
+
+        self._depth, self._dirty = 0, False
+        self._full_draws = 0
+        blitter.canvas.mpl_connect('draw_event', self._on_draw)
+        if self.stats:
+            atexit.register(lambda: print(self.summary(), file=sys.stderr))
+
+    @contextmanager
+    def frame(self, event="render"):
+        self._depth += 1
+        if self._depth == 1:
+            self._dirty = False
+            shown_before = self._shown()
+        try:
+            yield self
+        finally:
+            # Показ ще всередині кадру, щоб draw_event зарахувався цьому кадру
+            if self._depth == 1:
+                if self._dirty:
+                    self._dirty = False
+                    self._show()
+                self._record(event, self._shown() - shown_before)
+            self._depth -= 1
+
+    def present(self, event="render"):
+        """Позначає кадр зміненим; поза frame() одразу показує фігуру як окремий кадр."""
+        if self._depth:
+            self._dirty = True
+            return
+        with self.frame(event):
+            self._dirty = True
+
+    def _show(self):
+        if self.layout is not None:
+            with self._phase("layout"):
+                self.layout.apply()
+        with self._phase("raster"):
+            self.blitter.update()
+
+    def _phase(self, name):
+        return nullcontext() if self.profiler is None else self.profiler.phase(name)
+
+    def _shown(self):
+        return self._full_draws + self.blitter.blits
+
+    def _on_draw(self, event):
+        self._full_draws += 1
+        if not self._depth:
+            # Перемальовування самим бекендом, наприклад після зміни розміру вікна
+            self.per_event[OUTSIDE_FRAME][1] += 1
+
+    def _record(self, event, shown):
+        self.frames += 1
+        self.per_event[event][shown] += 1
+        if shown > 1:
+            self.overdrawn[event] += 1
+            if self.stats:
+                print(f"кадр «{event}» показав фігуру {shown} рази", file=sys.stderr)
+
+    def summary(self):
+        lines = [f"Кадрів: {self.frames}, з кількома показами: {sum(self.overdrawn.values())}"]
+        for event, counts in sorted(self.per_event.items()):
+            shown = ", ".join(f"{n} показ(ів) — {frames}" for n, frames in sorted(counts.items()))
+            lines.append(f"  {event}: {shown}")
+        return "\n".join(lines)
@@ -0,0 +1,138 @@
+"""Спільний корінь Tk для тренажерів: усі вікна можуть жити в одному процесі.
+
+Кожен тренажер — TrainerWindow, тобто Toplevel над коренем shared_root(). Запущений окремим
+скриптом, тренажер сам створює прихований корінь і завершує програму, коли його закривають.
+У launcher.py корінь — вікно вибору теми, і кілька тренажерів відкриваються поруч в одному
+інтерпретаторі: matplotlib, бекенд TkAgg, таблиці fraction_core, шрифти й стилі ttk
+завантажуються один раз.
+"""
+import inspect
+import os
+import sys
+import tkinter as tk
+import traceback
+from tkinter import font, ttk
+
+from fraction_ui.lazy import import_plotting, load_in_background
+from fraction_ui.profiling import FpsOverlay, FrameProfiler, overlay_enabled
+
+_root = None
+_fonts = {}
+
+
+def set_shared_root(root):
+    """Робить root спільним коренем (launcher); шрифти старого кореня забуваються."""
+    global _root
+    _root = root
+    _fonts.clear()
+
+
+def shared_root():
+    """Спільний корінь Tk; якщо його ще немає — створює прихований."""
+    if _root is None or not _root.winfo_exists():
+        root = tk.Tk()
+        root.withdraw()
+        set_shared_root(root)
+    return _root
+
+
+def shared_font(size, weight="normal", family="Helvetica"):
+    """Іменований шрифт Tk, один на весь процес для кожного поєднання параметрів."""
+    key = (family, size, weight)
+    if key not in _fonts:
+        _fonts[key] = font.Font(root=shared_root(), family=family, size=size, weight=weight)
+    return _fonts[key]
+
+
+def install_styles(widget):
+    """Стилі ttk тренажерів. Вони спільні для інтерпретатора, тож налаштовуються однаково для всіх вікон."""
+    style = ttk.Style(widget)
+    body, title, success = shared_font(16), shared_font(18, "bold"), shared_font(18, "bold")
+    style.configure("TLabel", font=body)
+    style.configure("TButton", font=body, padding=10)
+    style.configure("TScale", length=300)
+    style.configure("Title.TLabel", font=title)
+    style.configure("Success.TLabel", font=success, foreground="green")
+    style.configure("Error.TLabel", font=success, foreground="red")
+    return style
+
+
+class TrainerWindow(tk.Toplevel):
+    """Вікно тренажера. Без master — окрема програма: прихований корінь і вихід при закритті вікна.
+
+    self.profiler (fraction_ui.profiling) передається RenderScheduler і FrameManager нащадка;
+    якщо вимірювання ввімкнено, обробник повзунків _on_slider_change записується у фазу event.
+    Нащадок викликає load_plotting() наприкінці __init__; коли графіка завантажиться, self.plot —
+    простір імен fraction_ui.lazy.import_plotting і викликається його _create_figure.
+    Під час знищення вікна (закриття тренажера в launcher.py) відкладене перемальовування
+    self.render_scheduler скасовується, а FpsOverlay зупиняється, щоб їхні after не спрацювали
+    на вже знищених віджетах.
+    """
+
+    def __init__(self, master=None):
+        standalone = master is None
+        super().__init__(master or shared_root())
+        if standalone:
+            self.protocol("WM_DELETE_WINDOW", self.master.destroy)
+        self.profiler = FrameProfiler(os.path.basename(inspect.getfile(type(self))))
+        self.fps_overlay, self._overlay_pending = None, None
+        if self.profiler.enabled:
+            self._on_slider_change = self.profiler.timed("event", self._on_slider_change)
+            if overlay_enabled():
+                # Після побудови вікна нащадком, щоб напис був над його віджетами
+                self._overlay_pending = self.after_idle(self._show_overlay)
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _show_overlay(self):
+        self._overlay_pending = None
+        self.fps_overlay = FpsOverlay(self, self.profiler)
+
+    def _on_destroy(self, event):
+        if event.widget is not self:  # <Destroy> кожного дочірнього віджета теж приходить сюди
+            return
+        scheduler = getattr(self, "render_scheduler", None)
+        if scheduler is not None:
+            scheduler.cancel()
+        if self._overlay_pending is not None:
+            self.after_cancel(self._overlay_pending)
+            self._overlay_pending = None
+        if self.fps_overlay is not None:
+            self.fps_overlay.stop()
+
+    def load_plotting(self):
+        """Імпортує matplotlib у фоні; до того self.plot і self.figure — None, і visualize нічого не малює."""
+        self.plot = None
+        load_in_background(self, import_plotting, self._on_plotting_loaded, self._on_plotting_failed)
+
+    def _on_plotting_loaded(self, plot):
+        if not self.winfo_exists():  # вікно закрили, поки йшов імпорт
+            return
+        self.plot = plot
+        self._create_figure()
+
+    def _on_plotting_failed(self, exc):
+        """Без графіки тренажер не працює: пояснення замість порожнього місця під кругами."""
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
+        if not self.winfo_exists():
+            return
+        ttk.Label(self.plot_frame, style="Error.TLabel", wraplength=900, justify=tk.CENTER,
+                  text=f"Не вдалося завантажити графіку (matplotlib): {exc}\n"
+                       "Перевірте встановлення matplotlib і перезапустіть тренажер.").pack(expand=True)
+
+
+def resident_memory_mb():
+    """Резидентна пам'ять поточного процесу в МБ (на Linux — поточна, інакше — пікова)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS рахує в байтах, Linux — у КБ
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
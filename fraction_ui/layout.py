@@ -0,0 +1,86 @@
+"""Допоміжні засоби компонування фігури для повторно використаних осей."""
+from collections import OrderedDict
+
+from matplotlib.figure import SubplotParams
+
+_SUBPLOT_PARAM_NAMES = ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+
+
+def reset_subplot_layout(figure):
+    """Повертає параметри сітки до значень за замовчуванням, як після figure.clear().
+
+    tight_layout змінює subplotpars фігури і відштовхується від поточних позицій осей, тож без
+    скидання кожне наступне компонування тих самих осей залежало б від попереднього.
+    """
+    defaults = SubplotParams()
+    figure.subplots_adjust(**{name: getattr(defaults, name) for name in _SUBPLOT_PARAM_NAMES})
+
+
+class LayoutCache:
+    """Результат tight_layout, збережений для (форми сітки, розміру фігури, довжин підписів).
+
+    Коли змінюється лише колір сектора або цифра в заголовку тієї ж довжини, tight_layout дав би
+    (майже) ті самі subplotpars, тож їх достатньо відновити з кешу замість вимірювання всього тексту.
+    Розмір фігури в пікселях входить у ключ, а bind_configure ще й очищає кеш при зміні розміру вікна.
+    Понад maxsize записів витісняється той, що найдовше не використовувався.
+    title_bucket — ширина кошика довжини рядка в символах. Висота mathtext трохи залежить від самих
+    цифр, тож у межах кошика верх сітки може відрізнятися від точного tight_layout на піксель-два
+    (зате заголовки не здригаються при кожній зміні цифри); None — ключем є сам текст, позиції точні.
+    """
+
+    def __init__(self, figure, title_bucket=1, maxsize=256, **tight_kwargs):
+        self.figure = figure
+        self.title_bucket = title_bucket
+        self.maxsize = maxsize
+        self.tight_kwargs = tight_kwargs
+        self.hits, self.misses = 0, 0
+        self._params = OrderedDict()
+
+    def apply(self, layout_key=None):
+        """Ставить компонування фігури; layout_key — додатковий стан, від якого воно залежить."""
+        key = (layout_key, self._grid_key(), tuple(self.figure.bbox.size), self._text_key())
+        params = self._params.get(key)
+        if params is not None:
+            self.hits += 1
+            self._params.move_to_end(key)
+            # tight_layout через get_tightbbox викликає apply_aspect з позицій за замовчуванням,
+            # а для осей з adjustable='datalim' це змінює межі, тож повторюємо цей крок
+            reset_subplot_layout(self.figure)
+            for ax in self.figure.axes:
+                if ax.get_visible() and ax.get_in_layout() and ax.get_subplotspec() is not None:
+                    ax.apply_aspect()
+            self.figure.subplots_adjust(**params)
+            return False
+
+        self.misses += 1
+        reset_subplot_layout(self.figure)
+        self.figure.tight_layout(**self.tight_kwargs)
+        self._params[key] = {name: getattr(self.figure.subplotpars, name) for name in _SUBPLOT_PARAM_NAMES}
+        if len(self._params) > self.maxsize:
+            self._params.popitem(last=False)
+        return True
+
+    def invalidate(self, event=None):
+        self._params.clear()
+
+    def bind_configure(self, widget):
+        widget.bind("<Configure>", self.invalidate, add="+")
+
+    def _grid_key(self):
+        key = []
+        for ax in self.figure.axes:
+            spec = ax.get_subplotspec()
+            key.append(None if spec is None else (spec.get_geometry(), ax.get_visible()))
+        return tuple(key)
+
+    def _text_key(self):
+        key = []
+        for ax in self.figure.axes:
+            key.extend(self._string_key(ax.get_title(loc=loc)) for loc in ('center', 'left', 'right'))
+            key.extend(self._string_key(text.get_text()) if text.get_visible() else None for text in ax.texts)
+        return tuple(key)
+
+    def _string_key(self, string):
+        if self.title_bucket is None:
+            return string
+        return tuple(len(line) // self.title_bucket for line in string.split("\n"))
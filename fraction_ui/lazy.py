@@ -0,0 +1,61 @@
+"""Відкладене завантаження графіки: вікно тренажера з'являється раніше, ніж імпортується matplotlib.
+
+Тренажер будує вікно, повзунки й полотно завдання одразу, а import_plotting — імпорт
+matplotlib, numpy і модулів fraction_ui з ними — виконується у фоновому потоці. Потік нічого
+не присвоює глобальним іменам: він повертає простір імен, який вікно тримає в self.plot
+(TrainerWindow.load_plotting), і фігура створюється вже в потоці Tk. Сам модуль не імпортує
+нічого важкого.
+"""
+import threading
+from types import SimpleNamespace
+
+
+def import_plotting():
+    """Імпортує все, чим тренажери малюють; повертає простір імен (plot.Figure, plot.make_pie...)."""
+    import matplotlib.gridspec as gridspec
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Wedge
+    from fraction_ui.atlas import make_pie
+    from fraction_ui.blit import BlitManager
+    from fraction_ui.frame import FrameManager
+    from fraction_ui.layout import LayoutCache
+    from fraction_ui.mathtext import title_cache
+    from fraction_ui.pies import (PiePool, overlapping_pies, overlapping_width, prepare_pie_axes,
+                                  reset_pie_limits, set_artists_visible)
+    return SimpleNamespace(
+        Figure=Figure, FigureCanvasTkAgg=FigureCanvasTkAgg, gridspec=gridspec, Wedge=Wedge, make_pie=make_pie,
+        BlitManager=BlitManager, FrameManager=FrameManager, LayoutCache=LayoutCache,
+        title_cache=title_cache, PiePool=PiePool, overlapping_pies=overlapping_pies,
+        overlapping_width=overlapping_width, prepare_pie_axes=prepare_pie_axes, reset_pie_limits=reset_pie_limits,
+        set_artists_visible=set_artists_visible)
+
+
+def load_in_background(widget, load, on_ready, on_error, poll_ms=15):
+    """Виконує load() у фоновому потоці, потім on_ready(результат) або on_error(виняток) у потоці Tk.
+
+    Tk не можна чіпати з іншого потоку, тому завершення перевіряється через widget.after.
+    Виняток не піднімається в циклі подій Tk: там він лише надрукувався б, а вікно
+    лишилося б без графіки й без пояснення.
+    """
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = load()
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=run, name="plot-import", daemon=True)
+    thread.start()
+
+    def poll():
+        if thread.is_alive():
+            widget.after(poll_ms, poll)
+        elif "error" in outcome:
+            on_error(outcome["error"])
+        else:
+            on_ready(outcome["result"])
+
+    widget.after(poll_ms, poll)
+    return thread
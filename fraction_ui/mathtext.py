@@ -0,0 +1,44 @@
+"""Заголовки з дробами (mathtext), які оновлюються лише тоді, коли змінився сам дріб.
+
+Заголовок на кшталт "Перший дріб\\n$\\frac{3}{8}$" однозначно задається дробом, тому рядок
+заголовка і є його ключем. Під час руху повзунка тренажер щокадру передає заголовки всіх осей,
+але TitleCache чіпає лише ті Text, чий дріб змінився: решта лишається незміненою (stale=False),
+blit (fraction_ui.blit) їх не перемальовує, а LayoutCache бачить ті самі рядки.
+Розбір mathtext лишається за matplotlib; внутрішніх механізмів matplotlib кеш не чіпає.
+FRACTIONS_MATHTEXT_STATS=1 друкує статистику кешу під час виходу.
+"""
+import atexit
+import os
+import sys
+
+
+class TitleCache:
+    """Оновлює заголовок (Text) лише тоді, коли його рядок змінився; рахує hits/misses."""
+
+    def __init__(self):
+        self.hits, self.misses = 0, 0
+
+    def set(self, text, title):
+        """Ставить title на text, якщо там інший рядок. Повертає True, якщо заголовок змінився."""
+        if text.get_text() == title:
+            self.hits += 1
+            return False
+        self.misses += 1
+        text.set_text(title)
+        return True
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self.hits, self.misses = 0, 0
+
+    def summary(self):
+        return (f"заголовки: {self.hits} без змін, {self.misses} оновлень "
+                f"({self.hit_rate():.0%} без змін)")
+
+
+title_cache = TitleCache()
+if os.environ.get("FRACTIONS_MATHTEXT_STATS", "") not in ("", "0"):
+    atexit.register(lambda: print(title_cache.summary(), file=sys.stderr))
@@ -0,0 +1,250 @@
+"""Кругові діаграми дробів, що будуються один раз і далі лише оновлюються (retained mode).
+
+На відміну від ax.pie, який щоразу створює нові Wedge, PieArtist тримає фіксований набір
+секторів на осях і при зміні дробу підставляє їм готові контури з кешу wedge_paths,
+змінюючи лише кольори та видимість. Роздільники секторів одного круга — це одна
+LineCollection, а не окремі лінії.
+"""
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.patches import PathPatch, Wedge
+from matplotlib.path import Path
+
+WEDGE_CACHE_SIZE = 4096
+
+
+def sector_sizes(numerators, denominator):
+    """Розміри секторів так само, як їх формував draw_fraction_pie, і скільки з них заповнених."""
+    sizes = []
+    total_num = sum(numerators)
+    if total_num > 0:
+        sizes.extend(n for n in numerators if n > 0)
+    filled = len(sizes)
+    if denominator - total_num > 0:
+        sizes.append(denominator - total_num)
+    if not sizes:
+        sizes = [1]
+    return sizes, filled
+
+
+def pie_sizes(numerators, colors, denominator, empty_color):
+    """Розміри та кольори секторів так само, як їх формував draw_fraction_pie."""
+    sizes, filled = sector_sizes(numerators, denominator)
+    final_colors = list(colors[:filled])
+    final_colors += [empty_color] * (len(sizes) - len(final_colors))
+    return sizes, final_colors
+
+
+def wedge_angles(sizes):
+    """Кути (theta1, theta2) у градусах, як у ax.pie(startangle=90, counterclock=False)."""
+    total = float(sum(sizes))
+    angles, theta = [], 0.25
+    for size in sizes:
+        next_theta = theta - size / total
+        angles.append((360.0 * next_theta, 360.0 * theta))
+        theta = next_theta
+    return angles
+
+
+@lru_cache(maxsize=WEDGE_CACHE_SIZE)
+def wedge_paths(numerators, denominator, radius):
+    """Контури секторів круга з центром у (0, 0) для кортежу чисельників; LRU-кеш.
+
+    Контур будується тим самим Wedge, що й у ax.pie, тому після зсуву на центр вершини
+    збігаються до біта. Шляхи спільні для всіх кругів і тому лише для читання.
+    """
+    sizes, _ = sector_sizes(numerators, denominator)
+    paths = []
+    for theta1, theta2 in wedge_angles(sizes):
+        path = Wedge((0, 0), radius, theta1, theta2).get_path()
+        paths.append(Path(path.vertices, path.codes, readonly=True))
+    return tuple(paths)
+
+
+@lru_cache(maxsize=None)
+def divider_segments(denominator):
+    """Відрізки від центру одиничного круга до меж секторів, масив (denominator, 2, 2).
+
+    Кути рахуються так само, як у колишньому циклі з ax.plot: перший роздільник угорі,
+    далі за годинниковою стрілкою. Масив спільний для всіх кругів, тому лише для читання.
+    """
+    angles = np.deg2rad(90 - np.arange(denominator) * (360.0 / denominator))
+    segments = np.zeros((denominator, 2, 2))
+    segments[:, 1, 0] = np.cos(angles)
+    segments[:, 1, 1] = np.sin(angles)
+    segments.flags.writeable = False
+    return segments
+
+
+def overlapping_width(count, radius=1.0, overlap=0.65):
+    """Ширина ряду з count кіл радіуса radius, сусідні з яких зсунуті на overlap діаметра."""
+    return (count - 1) * 2 * radius * overlap + 2 * radius if count > 0 else 0
+
+
+def overlapping_pies(n, d, color, radius=1.0, overlap=0.65, center=(0, 0)):
+    """Дріб n/d (можливо, неправильний) рядом кіл, як у тренажерах рівня 2: цілі кола й одне часткове.
+
+    Повертає описи кругів для PiePool.show; ряд відцентровано відносно center. Сектори мають
+    радіус 2.2 * radius, тож сусідні кола помітно налягають одне на одне.
+    """
+    whole, frac_n = divmod(n, d)
+    total_circles = whole + (1 if frac_n > 0 else 0)
+    step = 2 * radius * overlap
+    start_x = center[0] - overlapping_width(total_circles, radius, overlap) / 2 + radius
+    pies = [([d], [color], d, (start_x + i * step, center[1]), radius * 2.2) for i in range(whole)]
+    if frac_n > 0:
+        pies.append(([frac_n], [color], d, (start_x + whole * step, center[1]), radius * 2.2))
+    return pies
+
+
+def set_artists_visible(artists, visible):
+    """Змінює видимість лише за потреби: set_visible завжди позначає художника зміненим."""
+    for artist in artists:
+        if artist.get_visible() != visible:
+            artist.set_visible(visible)
+
+
+def prepare_pie_axes(ax, center=(0, 0), equal=True):
+    """Те саме оформлення осей, яке робить ax.pie(frame=False)."""
+    if equal:
+        ax.axis('equal')
+    ax.set(frame_on=False, xticks=[], yticks=[])
+    reset_pie_limits(ax, center)
+
+
+def reset_pie_limits(ax, center=(0, 0)):
+    """Повертає осі до стану «щойно після ax.pie».
+
+    apply_aspect з adjustable='datalim' змінює межі при кожному малюванні й спирається на dataLim,
+    тому для повторно використаних осей треба заново порахувати dataLim і виставити межі ±1.25.
+    """
+    ax.relim(visible_only=True)
+    ax.set_xlim(-1.25 + center[0], 1.25 + center[0])
+    ax.set_ylim(-1.25 + center[1], 1.25 + center[1])
+
+
+class PieArtist:
+    """Один круг дробу на осях: сектори створюються один раз, далі змінюються лише контури й кольори."""
+
+    def __init__(self, ax, center=(0, 0), radius=1.0, empty_color='#E0E0E0', max_wedges=3,
+                 wedgeprops=None, divider_limit=None, divider_props=None):
+        self.ax = ax
+        self.center, self.radius = center, radius
+        self.empty_color = empty_color
+        self.divider_limit = divider_limit
+        # zorder і стилі кінців як у Line2D з ax.plot, щоб роздільники виглядали як раніше
+        self.divider_props = {'colors': 'black', 'linewidths': 0.7, 'alpha': 0.6, 'zorder': 2,
+                              'capstyle': 'projecting', 'joinstyle': 'round', **(divider_props or {})}
+        wedgeprops = {'edgecolor': 'black', 'linewidth': 1, **(wedgeprops or {})}
+
+        self.wedges = []
+        for _ in range(max_wedges):
+            wedge = PathPatch(Path(np.zeros((1, 2))), clip_on=False, **wedgeprops)
+            wedge.set_visible(False)
+            ax.add_patch(wedge)
+            self.wedges.append(wedge)
+
+        self.dividers = None
+        self._divider_den = None
+        self._state = None
+        self._visible = True
+
+    def update(self, numerators, colors, denominator):
+        """Оновлює сектори під новий дріб. Повертає False, якщо нічого не змінилося."""
+        sizes, final_colors = pie_sizes(numerators, colors, denominator, self.empty_color)
+        state = (tuple(sizes), tuple(final_colors), denominator)
+        if state == self._state:
+            return False
+        if len(sizes) > len(self.wedges):
+            raise ValueError(f"PieArtist має лише {len(self.wedges)} секторів, потрібно {len(sizes)}")
+
+        self._numerators, self._denominator = tuple(numerators), denominator
+        self._place_wedges()
+        for wedge, color in zip(self.wedges, final_colors):
+            wedge.set_facecolor(color)
+            wedge.set_visible(self._visible)
+        for wedge in self.wedges[len(sizes):]:
+            wedge.set_visible(False)
+
+        self._update_dividers(denominator)
+        self._state = state  # лише після успішного оновлення: після винятку той самий виклик малює знову
+        return True
+
+    def _place_wedges(self):
+        paths = wedge_paths(self._numerators, self._denominator, self.radius)
+        for wedge, path in zip(self.wedges, paths):
+            if self.center != (0, 0):
+                path = Path(path.vertices + self.center, path.codes)
+            wedge.set_path(path)
+
+    def set_geometry(self, center, radius):
+        """Переміщує круг без створення нових секторів."""
+        if (center, radius) == (self.center, self.radius):
+            return
+        self.center, self.radius = center, radius
+        if self._state is not None:
+            self._place_wedges()
+        if self._divider_den is not None:
+            self._update_dividers(self._divider_den, force=True)
+
+    def _update_dividers(self, denominator, force=False):
+        if self.divider_limit is None:
+            return
+        den = denominator if 0 < denominator <= self.divider_limit else None
+        if den == self._divider_den and not force:
+            return
+        self._divider_den = den
+        if den is None:
+            if self.dividers is not None:
+                self.dividers.set_visible(False)
+            return
+
+        segments = divider_segments(den) * self.radius + self.center
+        if self.dividers is None:
+            self.dividers = LineCollection(segments, **self.divider_props)
+            self.ax.add_collection(self.dividers, autolim=False)
+        else:
+            self.dividers.set_segments(segments)
+        self.dividers.set_visible(self._visible)
+
+    def set_visible(self, visible):
+        if visible == self._visible:
+            return
+        self._visible = visible
+        used = len(self._state[0]) if self._state else 0
+        for wedge in self.wedges[:used]:
+            wedge.set_visible(visible)
+        if self.dividers is not None:
+            self.dividers.set_visible(visible and self._divider_den is not None)
+
+    def artists(self):
+        """Усі художники, які змінюються при оновленні (для blit та подібного)."""
+        return [*self.wedges, *([self.dividers] if self.dividers is not None else [])]
+
+
+class PiePool:
+    """Змінна кількість кругів на одних осях: зайві PieArtist ховаються, а не видаляються.
+
+    factory будує один круг з тим самим інтерфейсом, що й PieArtist (наприклад, atlas.make_pie).
+    """
+
+    def __init__(self, ax, factory=PieArtist, **pie_kwargs):
+        self.ax = ax
+        self.factory = factory
+        self.pie_kwargs = pie_kwargs
+        self.pies = []
+
+    def show(self, pies):
+        """pies — послідовність (numerators, colors, denominator, center, radius)."""
+        count = 0
+        for count, (numerators, colors, denominator, center, radius) in enumerate(pies, start=1):
+            if count > len(self.pies):
+                self.pies.append(self.factory(self.ax, center=center, radius=radius, **self.pie_kwargs))
+            pie = self.pies[count - 1]
+            pie.set_geometry(center, radius)
+            pie.update(numerators, colors, denominator)
+            pie.set_visible(True)
+        for pie in self.pies[count:]:
+            pie.set_visible(False)
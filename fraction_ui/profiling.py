@@ -0,0 +1,186 @@
+"""Час кадру за фазами: де саме гальмує тренажер — у обробнику Tk, у visualize, у tight_layout чи в Agg.
+
+Вмикається змінною FRACTIONS_PROFILE: `1` — записати підсумок у fractions_profile.json у поточній
+теці, будь-яке інше значення — шлях до JSON-файлу. FRACTIONS_PROFILE_OVERLAY=1 додатково
+показує в кутку вікна поточні FPS і p95 кадру (і вмикає вимірювання без запису JSON).
+
+Фази (ключі JSON):
+  event   — обробник повзунка чи кнопки (_on_slider_change), на кожну подію;
+  queue   — від першої зміни після попереднього кадру до початку перемальовування (RenderScheduler);
+  logic   — перемальовування без компонування й растеризації: visualize, перевірка відповіді;
+  layout  — компонування фігури (LayoutCache.apply, тобто tight_layout або його кеш);
+  raster  — показ фігури: canvas.draw (растеризація Agg і копіювання в Tk) або blit;
+  frame   — увесь шлях від першої зміни до показу.
+Для кожної фази зберігаються останні WINDOW вимірювань; p50/p95/p99 рахуються з них. Під час
+виходу підсумки всіх вікон процесу друкуються в stderr і записуються в JSON.
+"""
+import atexit
+import json
+import math
+import os
+import sys
+import time
+import tkinter as tk
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+PHASES = ("event", "queue", "logic", "layout", "raster", "frame")
+LABELS = {"event": "подія", "queue": "черга", "logic": "логіка", "layout": "компонування",
+          "raster": "растеризація", "frame": "кадр"}
+WINDOW = 2000  # останніх вимірювань кожної фази
+DEFAULT_PATH = "fractions_profile.json"
+OVERLAY_REFRESH_MS = 500
+
+_profilers = []
+
+
+def profile_path():
+    """Шлях до JSON-підсумку або None, якщо FRACTIONS_PROFILE не задано."""
+    value = os.environ.get("FRACTIONS_PROFILE", "")
+    if value in ("", "0"):
+        return None
+    return DEFAULT_PATH if value == "1" else value
+
+
+def overlay_enabled():
+    return os.environ.get("FRACTIONS_PROFILE_OVERLAY", "") not in ("", "0")
+
+
+def percentile(values, q):
+    """q-й перцентиль (0..100) за найближчим рангом; values — відсортовані."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, math.ceil(q / 100 * len(values)) - 1))]
+
+
+class FrameProfiler:
+    """Ковзні вибірки часу фаз одного вікна; вимкнений профайлер нічого не вимірює."""
+
+    def __init__(self, name, enabled=None):
+        self.name = name
+        self.enabled = (profile_path() is not None or overlay_enabled()) if enabled is None else enabled
+        self.samples = {phase: deque(maxlen=WINDOW) for phase in PHASES}
+        self.counts = Counter()
+        self.frame_ends = deque(maxlen=WINDOW)
+
+        self._frame = None
+        self._frame_start = self._requested_at = None
+        if self.enabled:
+            if not _profilers:
+                atexit.register(_report)
+            _profilers.append(self)
+
+    def add(self, phase, seconds):
+        self.samples[phase].append(seconds * 1000)
+        self.counts[phase] += 1
+
+    def timed(self, phase, func):
+        """Обгортка func, що записує тривалість кожного виклику у фазу phase."""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(phase, time.perf_counter() - start)
+        return wrapper
+
+    def phase(self, phase):
+        """with profiler.phase("layout"): ... — усередині кадру час додається до цього кадру."""
+        return self._measure(phase) if self.enabled else nullcontext()
+
+    @contextmanager
+    def _measure(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if self._frame is None:
+                self.add(phase, elapsed)
+            else:
+                self._frame[phase] += elapsed
+
+    def begin_frame(self, requested_at):
+        """Початок перемальовування; requested_at — perf_counter() першої зміни, що його викликала."""
+        if not self.enabled:
+            return
+        self._frame, self._requested_at = Counter(), requested_at
+        self._frame_start = time.perf_counter()
+        self.add("queue", self._frame_start - requested_at)
+
+    def end_frame(self):
+        if not self.enabled or self._frame is None:
+            return
+        end = time.perf_counter()
+        frame, self._frame = self._frame, None
+        for phase, seconds in frame.items():
+            self.add(phase, seconds)
+        self.add("logic", end - self._frame_start - sum(frame.values()))
+        self.add("frame", end - self._requested_at)
+        self.frame_ends.append(end)
+
+    def fps(self, span=1.0):
+        """Кадрів за останні span секунд, у перерахунку на секунду."""
+        now = time.perf_counter()
+        return sum(1 for end in self.frame_ends if now - end <= span) / span
+
+    def stats(self):
+        """{фаза: {count, mean, p50, p95, p99, max}} у мілісекундах для фаз, що мають вимірювання."""
+        result = {}
+        for phase in PHASES:
+            values = sorted(self.samples[phase])
+            if values:
+                result[phase] = {"count": self.counts[phase], "mean": sum(values) / len(values),
+                                 "p50": percentile(values, 50), "p95": percentile(values, 95),
+                                 "p99": percentile(values, 99), "max": values[-1]}
+        return result
+
+    def summary(self):
+        lines = [f"{self.name}: останні {WINDOW} вимірювань, мс"]
+        for phase, s in self.stats().items():
+            lines.append(f"  {LABELS[phase]:<13} p50 {s['p50']:7.2f}  p95 {s['p95']:7.2f}  p99 {s['p99']:7.2f}"
+                         f"  (усього {s['count']})")
+        return "\n".join(lines)
+
+
+def _report():
+    for profiler in _profilers:
+        print(profiler.summary(), file=sys.stderr)
+    path = profile_path()
+    if path is not None:
+        data = {"window": WINDOW, "units": "ms",
+                "trainers": {profiler.name: profiler.stats() for profiler in _profilers}}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+class FpsOverlay:
+    """Напис у правому верхньому куті вікна: FPS за останню секунду й p95 кадру."""
+
+    def __init__(self, window, profiler):
+        self.profiler = profiler
+        self.label = tk.Label(window, font="TkFixedFont", bg="black", fg="lime", padx=6, pady=2)
+        self.label.place(relx=1.0, x=-8, y=8, anchor="ne")
+        self._pending = None
+        self._refresh()
+
+    def stop(self):
+        """Зупиняє оновлення напису; викликається, коли вікно знищується."""
+        if self._pending is not None:
+            self.label.after_cancel(self._pending)
+            self._pending = None
+
+    def _refresh(self):
+        self._pending = None
+        if not self.label.winfo_exists():
+            return
+        frames = self.profiler.samples["frame"]
+        p95 = percentile(sorted(list(frames)[-200:]), 95) if frames else None  # останні 200 кадрів
+        text = f"{self.profiler.fps():.0f} FPS"
+        if p95 is not None:
+            text += f"  кадр p95 {p95:.0f} мс"
+        self.label.config(text=text)
+        self.label.lift()  # над віджетами, створеними пізніше
+        self._pending = self.label.after(OVERLAY_REFRESH_MS, self._refresh)
@@ -0,0 +1,66 @@
+"""Об'єднання частих змін повзунків в одне перемальовування за цикл простою Tk."""
+import time
+
+
+class RenderScheduler:
+    """Відкладає render() до простою Tk і запускає його не частіше, ніж раз на interval_ms.
+
+    ttk.Scale викликає command для кожного проміжного значення, тож request() лише позначає
+    вигляд застарілим. render() читає змінні в момент виконання, тому останнє значення
+    завжди буде намальоване.
+    """
+
+    def __init__(self, widget, render, interval_ms=16, profiler=None):
+        self.widget = widget
+        self.render = render
+        self.interval_ms = interval_ms
+        self.profiler = profiler
+        self.requests, self.renders = 0, 0
+
+        self._dirty = False
+        self._pending = None
+        self._last_render = None
+        self._requested_at = None  # перша зміна після останнього перемальовування
+
+    def request(self):
+        self.requests += 1
+        if not self._dirty:
+            self._requested_at = time.perf_counter()
+        self._dirty = True
+        if self._pending is not None:
+            return
+
+        wait_ms = 0
+        if self._last_render is not None:
+            elapsed_ms = (time.perf_counter() - self._last_render) * 1000
+            wait_ms = max(0, round(self.interval_ms - elapsed_ms))
+        if wait_ms:
+            self._pending = self.widget.after(wait_ms, self._run)
+        else:
+            self._pending = self.widget.after_idle(self._run)
+
+    def flush(self):
+        """Малює негайно, якщо є відкладені зміни."""
+        self.cancel()
+        self._run()
+
+    def cancel(self):
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+
+    def _run(self):
+        self._pending = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._last_render = time.perf_counter()
+        self.renders += 1
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame(self._requested_at)
+        try:
+            self.render()
+        finally:
+            if profiler is not None:
+                profiler.end_frame()
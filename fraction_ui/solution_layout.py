@@ -0,0 +1,226 @@
+"""Компонування кроків рішення в примітиви одного полотна: текст, дроби стовпчиком, рамки.
+
+Раніше кожен дріб кроку був окремим tk.Canvas, а кожен рядок — ttk.Label. Тепер крок
+розкладається в список Text/Line/Box у координатах кроку: рядки виразів складаються з
+елементів Run (текст), Stacked (дріб стовпчиком) і Gap (відступ), пояснення переносяться
+за словами. Ширини рядків міряються через Tk один раз і кешуються за (шрифт, рядок) в
+обмеженому LRU спільного metrics. Той самий список примітивів малюється на tk.Canvas (draw),
+у SVG (to_svg) або в PNG через matplotlib (to_png) для роздаткових матеріалів.
+"""
+from collections import OrderedDict, namedtuple
+from xml.sax.saxutils import escape
+
+from fraction_ui.host import shared_root
+
+# Елементи рядка з виразом
+Run = namedtuple("Run", "text font")
+Stacked = namedtuple("Stacked", "numerator denominator font")
+Gap = namedtuple("Gap", "width")
+
+# Примітиви малювання; anchor — як у tk.Canvas: "nw", "w" або "center"
+Text = namedtuple("Text", "x y text font anchor")
+Line = namedtuple("Line", "x1 y1 x2 y2 width")
+Box = namedtuple("Box", "x1 y1 x2 y2")
+
+FRACTION_HEIGHT = 60  # як у колишніх полотнах дробів: чисельник на 15, риска на 30, знаменник на 45
+FRACTION_PADY = 10
+LINE_PADY = 2
+FRAME_PADDING = 15
+FRAME_BORDER = 2
+WRAP_MARGIN = 40
+BOX_COLOR = '#B0B0B0'
+PX_PER_INCH = 96
+WIDTH_CACHE_SIZE = 4096  # виміряних рядків
+
+
+class TextMetrics:
+    """Кеш вимірювань шрифтів Tk: ширина за (шрифт, рядок), висота рядка й опис шрифту за шрифтом.
+
+    Ширин за сеанс набирається без кінця (кожне завдання — нові числа), тому це LRU на
+    maxsize записів; шрифтів же кілька, і їх описи зберігаються всі.
+    """
+
+    def __init__(self, maxsize=WIDTH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.widths, self.fonts = OrderedDict(), {}
+        self.hits, self.misses = 0, 0
+
+    def width(self, font, text):
+        key = (str(font), text)
+        width = self.widths.get(key)
+        if width is None:
+            self.misses += 1
+            width = self.widths[key] = font.measure(text)
+            if len(self.widths) > self.maxsize:
+                self.widths.popitem(last=False)
+        else:
+            self.hits += 1
+            self.widths.move_to_end(key)
+        return width
+
+    def font_info(self, font):
+        """(родина, розмір у пікселях, жирний, висота рядка, висота над базовою лінією)."""
+        name = str(font)
+        if name not in self.fonts:
+            actual = font.actual()
+            size = actual["size"]
+            # Додатний розмір Tk — у пунктах, від'ємний — у пікселях
+            px = -size if size < 0 else size * float(shared_root().tk.call("tk", "scaling"))
+            self.fonts[name] = (actual["family"], px, actual["weight"] == "bold",
+                                font.metrics("linespace"), font.metrics("ascent"))
+        return self.fonts[name]
+
+    def linespace(self, font):
+        return self.font_info(font)[3]
+
+    def wrap(self, font, text, width):
+        """Рядки тексту, перенесені за словами на ширину width, як wraplength у ttk.Label."""
+        space = self.width(font, " ")
+        rows, row, row_width = [], [], 0
+        for word in text.split(" "):
+            word_width = self.width(font, word)
+            if row and row_width + space + word_width > width:
+                rows.append(" ".join(row))
+                row, row_width = [], 0
+            row_width += word_width + (space if row else 0)
+            row.append(word)
+        rows.append(" ".join(row))
+        return rows
+
+
+metrics = TextMetrics()
+
+
+def arrow(font):
+    return [Gap(10), Run("  ->  ", font), Gap(10)]
+
+
+def fraction_items(token, font, whole_font=None):
+    """Елементи для "n/d", "(n/d)" або мішаного "w n/d"; якщо це не дріб — просто текст."""
+    whole, _, fraction = token.strip().rpartition(' ')
+    try:
+        n_str, d_str = map(str.strip, fraction.replace('(', '').replace(')', '').split('/'))
+    except ValueError:
+        return [Run(token.strip(), font)]
+    items = [Stacked(n_str, d_str, font)]
+    if whole:
+        items[:0] = [Run(whole, whole_font or font), Gap(5)]
+    return items
+
+
+def layout_items(items, x, y, primitives):
+    """Розкладає елементи рядка виразу висотою FRACTION_HEIGHT, починаючи з (x, y)."""
+    middle = y + FRACTION_HEIGHT / 2
+    for item in items:
+        if isinstance(item, Gap):
+            x += item.width
+        elif isinstance(item, Run):
+            primitives.append(Text(x, middle, item.text, item.font, "w"))
+            x += metrics.width(item.font, item.text)
+        else:
+            width = max(metrics.width(item.font, item.numerator), metrics.width(item.font, item.denominator)) + 10
+            primitives.append(Text(x + width / 2, y + 15, item.numerator, item.font, "center"))
+            primitives.append(Line(x + 2, y + 30, x + width - 2, y + 30, 3))
+            primitives.append(Text(x + width / 2, y + 45, item.denominator, item.font, "center"))
+            x += width
+    return x
+
+
+def layout_step(title, lines, width, title_font, body_font, arrow_line_items):
+    """Примітиви кроку в рамці шириною width (координати відносно її кута) і висота рамки.
+
+    Рядок з "->" перетворює на елементи arrow_line_items(частини), решту рядків переносить.
+    """
+    left = y = FRAME_BORDER + FRAME_PADDING
+    primitives = [Text(left, y, title, title_font, "nw")]
+    y += metrics.linespace(title_font)
+    for line in lines:
+        if "->" in line:
+            y += FRACTION_PADY
+            layout_items(arrow_line_items(line.split("->")), left, y, primitives)
+            y += FRACTION_HEIGHT + FRACTION_PADY
+        else:
+            y += LINE_PADY
+            for row in metrics.wrap(body_font, line, max(width - WRAP_MARGIN, 100)):
+                primitives.append(Text(left, y, row, body_font, "nw"))
+                y += metrics.linespace(body_font)
+            y += LINE_PADY
+    height = y + FRAME_PADDING + FRAME_BORDER
+    primitives.insert(0, Box(0, 0, width, height))
+    return height, primitives
+
+
+def draw(canvas, primitives, dx, dy, tags=()):
+    """Малює примітиви на tk.Canvas зі зсувом (dx, dy)."""
+    for p in primitives:
+        if isinstance(p, Text):
+            canvas.create_text(p.x + dx, p.y + dy, text=p.text, font=p.font, anchor=p.anchor, tags=tags)
+        elif isinstance(p, Line):
+            canvas.create_line(p.x1 + dx, p.y1 + dy, p.x2 + dx, p.y2 + dy, width=p.width, tags=tags)
+        else:
+            canvas.create_rectangle(p.x1 + dx, p.y1 + dy, p.x2 + dx, p.y2 + dy, outline=BOX_COLOR, tags=tags)
+
+
+def _baseline(p):
+    """Базова лінія тексту: SVG і matplotlib вирівнюють за нею, tk.Canvas — за anchor."""
+    _, _, _, linespace, ascent = metrics.font_info(p.font)
+    top = p.y if p.anchor == "nw" else p.y - linespace / 2
+    return top + ascent
+
+
+def placed(steps):
+    """[(dx, dy, примітиви)] -> примітиви з уже доданим зсувом."""
+    for dx, dy, primitives in steps:
+        for p in primitives:
+            if isinstance(p, Text):
+                yield p._replace(x=p.x + dx, y=p.y + dy)
+            else:
+                yield p._replace(x1=p.x1 + dx, y1=p.y1 + dy, x2=p.x2 + dx, y2=p.y2 + dy)
+
+
+def to_svg(steps, width, height, path):
+    """Записує кроки [(dx, dy, примітиви)] у SVG розміром width x height пікселів."""
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'viewBox="0 0 {width} {height}">', f'<rect width="{width}" height="{height}" fill="white"/>']
+    for p in placed(steps):
+        if isinstance(p, Text):
+            family, px, bold, _, _ = metrics.font_info(p.font)
+            anchor = "middle" if p.anchor == "center" else "start"
+            out.append(f'<text x="{p.x:.1f}" y="{_baseline(p):.1f}" font-family="{escape(family)}" '
+                       f'font-size="{px:.1f}" font-weight="{"bold" if bold else "normal"}" '
+                       f'text-anchor="{anchor}">{escape(p.text)}</text>')
+        elif isinstance(p, Line):
+            out.append(f'<line x1="{p.x1:.1f}" y1="{p.y1:.1f}" x2="{p.x2:.1f}" y2="{p.y2:.1f}" '
+                       f'stroke="black" stroke-width="{p.width}"/>')
+        else:
+            out.append(f'<rect x="{p.x1:.1f}" y="{p.y1:.1f}" width="{p.x2 - p.x1:.1f}" '
+                       f'height="{p.y2 - p.y1:.1f}" fill="none" stroke="{BOX_COLOR}"/>')
+    out.append('</svg>')
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(out))
+
+
+def to_png(steps, width, height, path, scale=2):
+    """Записує кроки в PNG через matplotlib (Agg); scale — у скільки разів щільніше за екран."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(width / PX_PER_INCH, height / PX_PER_INCH), dpi=PX_PER_INCH * scale)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.set_xlim(0, width)
+    ax.set_ylim(height, 0)
+    ax.axis('off')
+    for p in placed(steps):
+        if isinstance(p, Text):
+            family, px, bold, _, _ = metrics.font_info(p.font)
+            ax.text(p.x, _baseline(p), p.text, family=family, fontsize=px * 72 / PX_PER_INCH,
+                    weight="bold" if bold else "normal", ha="center" if p.anchor == "center" else "left",
+                    va="baseline")
+        elif isinstance(p, Line):
+            # Товщина лінії Tk у пікселях, у matplotlib — у пунктах
+            ax.plot([p.x1, p.x2], [p.y1, p.y2], color="black", linewidth=p.width * 72 / PX_PER_INCH,
+                    solid_capstyle="butt")
+        else:
+            ax.plot([p.x1, p.x2, p.x2, p.x1, p.x1], [p.y1, p.y1, p.y2, p.y2, p.y1], color=BOX_COLOR, linewidth=0.75)
+    figure.savefig(path, facecolor="white")
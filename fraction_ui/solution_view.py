@@ -0,0 +1,143 @@
+"""Вікно рішення: усі кроки на одному tk.Canvas, намальовані лише у видимій частині.
+
+Кроки компонуються fraction_ui.solution_layout в примітиви (текст, дроби стовпчиком, рамки)
+одним проходом, тож висоти всіх кроків відомі одразу, а віджетів у вікні — лише полотно,
+смуга прокрутки й кнопка збереження. Елементи полотна існують тільки для кроків у видимій
+частині й запасі OVERSCAN над і під нею. Зміна розміру вікна не перекомпоновує кроки на кожну
+подію <Configure>: це відбувається через REFLOW_DELAY_MS після останньої. Кнопка «Зберегти»
+записує те саме компонування в SVG або PNG.
+"""
+import bisect
+import tkinter as tk
+from tkinter import filedialog, ttk
+
+from fraction_ui.solution_layout import arrow, draw, fraction_items, layout_step, to_png, to_svg
+
+STEP_PADX, STEP_PADY = 10, 10
+
+
+class VirtualSolutionWindow(tk.Toplevel):
+    """Основа SolutionWindow тренажерів; рядок з "->" перетворює на елементи arrow_line_items нащадка."""
+
+    OVERSCAN = 400  # px
+    REFLOW_DELAY_MS = 80
+
+    def __init__(self, parent, solution_steps, font_explanation, font_title, font_frac):
+        super().__init__(parent)
+        self.title("Рішення завдання")
+        self.geometry("800x600")
+
+        self.font_explanation, self.font_title, self.font_frac = font_explanation, font_title, font_frac
+        self.steps = [(style, text.split('\n')) for style, text in solution_steps]
+        self.step_width = 800 - 2 * STEP_PADX
+        self.layouts, self.offsets, self.total_height = [], [], 0
+        self.built = set()  # номери кроків, намальованих на полотні
+        self.builds = 0
+        self._update_pending = self._reflow_pending = None
+
+        toolbar = ttk.Frame(self)
+        toolbar.pack(side="bottom", fill="x")
+        ttk.Button(toolbar, text="Зберегти як SVG або PNG", command=self.export_dialog).pack(side="right", padx=10, pady=5)
+        self.canvas = tk.Canvas(self, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        # Полотно повідомляє про кожну зміну видимої області, хоч би що її зсунуло
+        self.canvas.configure(yscrollcommand=self._on_view_change)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.bind("<Configure>", self._on_resize)
+        self._layout()
+
+    # --- Елементи рядків з виразами (нащадки уточнюють розбір) ---
+
+    def arrow_line_items(self, parts):
+        items = []
+        for i, part in enumerate(parts):
+            if i > 0:
+                items += arrow(self.font_frac)
+            items += self.expression_items(part.strip())
+        return items
+
+    def expression_items(self, expression):
+        return fraction_items(expression, self.font_frac)
+
+    # --- Компонування ---
+
+    def _layout(self):
+        """Компонує всі кроки під поточну ширину й розставляє їх один під одним."""
+        self.layouts, self.offsets, y = [], [], STEP_PADY
+        for style, lines in self.steps:
+            title_font = self.font_title if style == "bold" else self.font_explanation
+            height, primitives = layout_step(lines[0], lines[1:], self.step_width, title_font,
+                                             self.font_explanation, self.arrow_line_items)
+            self.layouts.append(primitives)
+            self.offsets.append(y)
+            y += height + 2 * STEP_PADY
+        self.total_height = y
+        self.canvas.configure(scrollregion=(0, 0, self.step_width + 2 * STEP_PADX, y))
+
+    def placed_steps(self):
+        """[(dx, dy, примітиви)] для всіх кроків — для експорту."""
+        return [(STEP_PADX, y, primitives) for y, primitives in zip(self.offsets, self.layouts)]
+
+    def visible_range(self):
+        """Номери кроків [first, last), що потрапляють у видиму область із запасом OVERSCAN."""
+        top = self.canvas.canvasy(0) - self.OVERSCAN
+        bottom = self.canvas.canvasy(self.canvas.winfo_height()) + self.OVERSCAN
+        first = max(bisect.bisect_right(self.offsets, top) - 1, 0)
+        return first, bisect.bisect_right(self.offsets, bottom)
+
+    def _update_visible(self):
+        self._update_pending = None
+        first, last = self.visible_range()
+        for index in [i for i in self.built if not first <= i < last]:
+            self.canvas.delete(f"step{index}")
+            self.built.discard(index)
+        for index in range(first, last):
+            if index not in self.built:
+                draw(self.canvas, self.layouts[index], STEP_PADX, self.offsets[index], tags=(f"step{index}",))
+                self.built.add(index)
+                self.builds += 1
+
+    # --- Події ---
+
+    def _on_view_change(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._update_pending is None:
+            self._update_pending = self.after_idle(self._update_visible)
+
+    def _on_resize(self, event):
+        if self._reflow_pending is not None:
+            self.after_cancel(self._reflow_pending)
+        self._reflow_pending = self.after(self.REFLOW_DELAY_MS, self.reflow)
+
+    def reflow(self):
+        """Перекомпоновує кроки під нову ширину полотна."""
+        self._reflow_pending = None
+        width = max(self.canvas.winfo_width() - 2 * STEP_PADX, 1)
+        if width != self.step_width:
+            self.step_width = width
+            self.canvas.delete("all")
+            self.built.clear()
+            self._layout()
+        self._update_visible()
+
+    def export_dialog(self):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".svg",
+                                            filetypes=[("SVG", "*.svg"), ("PNG", "*.png")])
+        if path:
+            self.export(path)
+
+    def export(self, path):
+        """Зберігає все рішення в SVG або PNG (за розширенням path)."""
+        width = self.step_width + 2 * STEP_PADX
+        if path.lower().endswith(".png"):
+            to_png(self.placed_steps(), width, self.total_height, path)
+        else:
+            to_svg(self.placed_steps(), width, self.total_height, path)
+
+    def destroy(self):
+        for pending in (self._update_pending, self._reflow_pending):
+            if pending is not None:
+                self.after_cancel(pending)
+        self._update_pending = self._reflow_pending = None
+        super().destroy()
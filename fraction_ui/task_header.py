@@ -0,0 +1,78 @@
+"""Рядок «Завдання: ...» над тренажером: одне полотно, одна прив'язка <Configure>, поточне завдання.
+
+Раніше кожне нове завдання додавало до полотна ще одну прив'язку <Configure> (add="+") зі
+своїм замиканням, тож після сотні завдань одна зміна розміру перемальовувала сотню старих
+завдань, і кожне перемальовування створювало новий font.Font. TaskHeader прив'язується один раз
+і тримає лише поточне завдання: show() розставляє його елементи (Run, Stacked, Gap з
+fraction_ui.solution_layout) один раз, ширини беруться зі спільного кешу metrics, а полотно
+перемальовується лише тоді, коли змінюється його висота — тільки від неї залежить малюнок.
+"""
+import tkinter as tk
+
+from fraction_ui.solution_layout import Gap, Run, Stacked, metrics
+
+PREFIX_X = 10
+MIN_WIDTH = 50  # вужче полотно ще не розміщене у вікні
+
+
+def mixed_items(n, d, whole_font, frac_font):
+    """Елементи неправильного дробу n/d, записаного мішаним числом (ціла частина й дріб)."""
+    if d == 0:
+        return []
+    whole, frac_n = divmod(n, d)
+    items = [Run(str(whole), whole_font), Gap(5)] if whole > 0 else []
+    if frac_n > 0 or whole == 0:
+        items.append(Stacked(str(frac_n), str(d), frac_font))
+    return items
+
+
+class TaskHeader(tk.Canvas):
+    """Полотно з умовою завдання; offset — відстань чисельника й знаменника від риски дробу."""
+
+    def __init__(self, parent, prefix_font, prefix="Завдання: ", prefix_gap=15, offset=16, line_width=3, **options):
+        super().__init__(parent, **options)
+        self.prefix_font, self.prefix, self.prefix_gap = prefix_font, prefix, prefix_gap
+        self.offset, self.line_width = offset, line_width
+        self.placed = []  # [(x, елемент)] поточного завдання
+        self.drawn_height = None
+        self.draws = 0
+        self.bind("<Configure>", self._on_configure)
+
+    def show(self, items):
+        """Показує нове завдання з елементів рядка."""
+        x = metrics.width(self.prefix_font, self.prefix) + self.prefix_gap
+        self.placed = []
+        for item in items:
+            self.placed.append((x, item))
+            if isinstance(item, Gap):
+                x += item.width
+            elif isinstance(item, Run):
+                x += metrics.width(item.font, item.text)
+            else:
+                x += self._stacked_width(item)
+        self.drawn_height = None
+        self.redraw()
+
+    def _stacked_width(self, item):
+        return max(metrics.width(item.font, item.numerator), metrics.width(item.font, item.denominator)) + 10
+
+    def _on_configure(self, event):
+        self.redraw()
+
+    def redraw(self):
+        width, height = self.winfo_width(), self.winfo_height()
+        if width < MIN_WIDTH or height == self.drawn_height:
+            return
+        self.delete("all")
+        middle = height / 2
+        self.create_text(PREFIX_X, middle, text=self.prefix, font=self.prefix_font, anchor="w", fill="navy")
+        for x, item in self.placed:
+            if isinstance(item, Run):
+                self.create_text(x, middle, text=item.text, font=item.font, anchor="w")
+            elif isinstance(item, Stacked):
+                w = self._stacked_width(item)
+                self.create_text(x + w / 2, middle - self.offset, text=item.numerator, font=item.font, anchor="center")
+                self.create_line(x, middle, x + w, middle, width=self.line_width)
+                self.create_text(x + w / 2, middle + self.offset, text=item.denominator, font=item.font, anchor="center")
+        self.drawn_height = height
+        self.draws += 1
@@ -0,0 +1,217 @@
+"""Друковані аркуші завдань із кругами дробів і ключем відповідей, по одному PDF на учня.
+
+Запуск з кореня репозиторію:
+    python -m fraction_ui.worksheet_pdf --students 30 --family addition --family reduction -o аркуші
+
+Кожен учень отримує свій набір завдань з fraction_core.worksheet із seed, похідним від
+(--seed, номер учня) через task_key, тож аркуші з різними --seed не перетинаються. У PDF
+спершу сторінки із завданнями, потім ключ відповідей; файл названо за номером та іменем учня.
+Круги ті самі, що в тренажері кожної родини (FAMILY_PIES): окремі круги з роздільниками
+секторів, як draw_fraction_pie, або ряд кіл без роздільників, що налягають, як у тренажерах
+рівня 2. Учні розподіляються між процесами; кожен процес малює на Agg без Tk і тримає одну
+Figure з готовими осями та PiePool, які між сторінками лише оновлюються.
+"""
+import argparse
+import os
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from fraction_core.checking import mixed_result
+from fraction_core.streams import task_key
+from fraction_core.worksheet import FAMILIES, non_negative_int, sheet_tasks
+from fraction_ui.pies import PieArtist, PiePool, overlapping_pies
+
+PAGE_SIZE = (8.27, 11.69)  # A4, дюйми
+ROWS, COLS = 4, 3
+TASKS_PER_PAGE = ROWS * COLS
+COLORS = ('deepskyblue', 'salmon')
+ANSWER_COLOR = 'mediumseagreen'
+EMPTY_COLOR = '#E0E0E0'
+# Радіус кроку ряду такий, щоб самі круги (2.2 * радіус) мали радіус 1
+ROW_RADIUS, OVERLAP = 1 / 2.2, 0.65
+GROUP_GAP = 0.8
+SEPARATE_STEP = 2.2  # окремі круги радіуса 1 з проміжком 0.2
+# Як малює круги тренажер кожної родини: (кола налягають, межа знаменника для роздільників)
+FAMILY_PIES = {
+    "addition": (False, 40),            # main.py, draw_fraction_pie
+    "subtraction": (False, 40),         # vidn. drob lvl1.py
+    "reduction": (False, 40),           # skor.drob.py
+    "conversion": (False, 20),          # mix to neprav drib.py
+    "mixed_addition": (True, None),     # dodav drob 2lvl.py, _draw_overlapping_circles
+    "mixed_subtraction": (True, None),  # vind. drob lvl2.py
+}
+MIN_HALF_WIDTH = 2 + GROUP_GAP / 2
+
+_page = None
+
+
+def task_values(family, task):
+    """Дроби (n, d) для кругів завдання та значення відповіді."""
+    if family == "reduction":
+        n_task, d_task, n_corr, d_corr = task
+        return [(n_task, d_task)], (n_corr, d_corr)
+    if family == "conversion":
+        task_type, whole, num, den, improper_num = task
+        return [(improper_num, den)], (improper_num, den)
+    n1, d1, n2, d2 = task
+    subtract = family in ("subtraction", "mixed_subtraction")
+    return [(n1, d1), (n2, d2)], mixed_result(n1, d1, n2, d2, subtract=subtract)
+
+
+def row_of_groups(values, colors, overlap=False):
+    """Описи кругів для PiePool.show: групи кіл для кожного дробу поруч, ряд по центру; і його півширина.
+
+    overlap=True — ряд кіл, що налягають (overlapping_pies, як у тренажерах рівня 2); інакше
+    цілі кола й залишок стоять окремо, як кілька кругів draw_fraction_pie у тренажерах рівня 1.
+    """
+    step = 2 * ROW_RADIUS * OVERLAP if overlap else SEPARATE_STEP
+    widths = [(max(-(-n // d), 1) - 1) * step + 2 for n, d in values]
+    half_width = (sum(widths) + GROUP_GAP * (len(widths) - 1)) / 2
+    pies, left = [], -half_width
+    for (n, d), color, width in zip(values, colors, widths):
+        center = (left + width / 2, 0)
+        if not n:
+            # Нуль (різниця рівних дробів) — одне порожнє коло
+            pies.append(([0], [color], d, center, 1.0))
+        elif overlap:
+            pies += overlapping_pies(n, d, color, ROW_RADIUS, OVERLAP, center)
+        else:
+            whole, frac_n = divmod(n, d)
+            numerators = [d] * whole + ([frac_n] if frac_n else [])
+            pies += [([num], [color], d, (left + 1 + i * step, 0), 1.0) for i, num in enumerate(numerators)]
+        left += width + GROUP_GAP
+    return pies, half_width
+
+
+class WorksheetPage:
+    """Одна Figure сторінки A4 з сіткою осей; draw перемальовує її під новий набір завдань."""
+
+    def __init__(self):
+        self.figure = Figure(figsize=PAGE_SIZE)
+        self.figure.subplots_adjust(left=0.04, right=0.96, bottom=0.03, top=0.93, hspace=0.45, wspace=0.15)
+        self.cells = []
+        for i in range(TASKS_PER_PAGE):
+            ax = self.figure.add_subplot(ROWS, COLS, i + 1)
+            # Як осі кіл у тренажерах рівня 2: межі задаємо самі, розмір осей підлаштовується
+            ax.axis('off')
+            ax.set_aspect('equal', adjustable='box')
+            ax.set_title("", fontsize=11)
+            self.cells.append((ax, {}))
+
+    def _pool(self, ax, pools, divider_limit):
+        """PiePool клітинки з потрібною межею роздільників; створюється під час першого використання."""
+        pool = pools.get(divider_limit)
+        if pool is None:
+            pool = pools[divider_limit] = PiePool(ax, factory=PieArtist, empty_color=EMPTY_COLOR, max_wedges=2,
+                                                  divider_limit=divider_limit, wedgeprops={'linewidth': 0.8})
+        return pool
+
+    def draw(self, heading, tasks, first_number, answers=False):
+        self.figure.suptitle(heading, fontsize=14)
+        for i, (ax, pools) in enumerate(self.cells):
+            if i >= len(tasks):
+                for pool in pools.values():
+                    pool.show([])
+                ax.title.set_text("")
+                continue
+            family, task, text, answer = tasks[i]
+            overlap, divider_limit = FAMILY_PIES[family]
+            values, answer_value = task_values(family, task)
+            if answers:
+                pies, half_width = row_of_groups([answer_value], [ANSWER_COLOR], overlap)
+            else:
+                pies, half_width = row_of_groups(values, COLORS, overlap)
+            # Роздільники одного кола перекреслювали б сектори сусіднього, тож при накладанні їх немає
+            current = self._pool(ax, pools, None if overlap else divider_limit)
+            for pool in pools.values():
+                if pool is not current:
+                    pool.show([])
+            current.show(pies)
+            # Не менше за ширину двох кругів, щоб окремий круг не розтягувався на всю клітинку
+            half_width = max(half_width, MIN_HALF_WIDTH) + 0.1
+            ax.set_xlim(-half_width, half_width)
+            ax.set_ylim(-1.1, 1.1)
+            ax.title.set_text(f"{first_number + i}) {text} = {answer if answers else '____'}")
+
+
+def _init_worker():
+    global _page
+    _page = WorksheetPage()
+
+
+def render_student(job):
+    """Один PDF учня: сторінки завдань, потім ключ відповідей. Повертає кількість сторінок."""
+    name, seed, families, count, path = job
+    if _page is None:
+        _init_worker()
+    tasks = sheet_tasks(families, count, random.Random(seed))
+    chunks = [tasks[start:start + TASKS_PER_PAGE] for start in range(0, len(tasks), TASKS_PER_PAGE)]
+    with PdfPages(path) as pdf:
+        for answers in (False, True):
+            for page, chunk in enumerate(chunks):
+                heading = f"{name} — {'відповіді' if answers else 'завдання'}, с. {page + 1}/{len(chunks)}"
+                _page.draw(heading, chunk, page * TASKS_PER_PAGE + 1, answers)
+                pdf.savefig(_page.figure)
+    return 2 * len(chunks)
+
+
+def student_filename(number, name):
+    """«03 Іваненко Олена.pdf»: номер тримає порядок і розрізняє однакові імена.
+
+    Символи, заборонені в іменах файлів, замінюються на «_».
+    """
+    safe = re.sub(r'[\\/:*?"<>|\x00-\x1f]+', "_", name).strip(" .")
+    return f"{number:02d} {safe}.pdf" if safe else f"{number:02d}.pdf"
+
+
+def student_jobs(names, families, count, out_dir, seed=0):
+    return [(name, task_key(seed, i), list(families), count,
+             os.path.join(out_dir, student_filename(i + 1, name)))
+            for i, name in enumerate(names)]
+
+
+def positive_int(text):
+    """Тип argparse для кількості завдань: ціле число, не менше одиниці (аркуш без завдань не пишеться)."""
+    value = non_negative_int(text)
+    if value == 0:
+        raise argparse.ArgumentTypeError("потрібне принаймні одне завдання")
+    return value
+
+
+def render_worksheets(jobs, workers=None):
+    """Рендерить PDF для всіх учнів у пулі процесів; повертає загальну кількість сторінок."""
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return sum(pool.map(render_student, jobs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDF-аркуші завдань на дроби з кругами та ключем відповідей.")
+    parser.add_argument("--students", type=non_negative_int, default=30, help="скільки учнів (за замовчуванням 30)")
+    parser.add_argument("--names", help="файл з іменами учнів, по одному в рядку (замість --students)")
+    parser.add_argument("-n", "--count", type=positive_int, default=TASKS_PER_PAGE, help="завдань на учня")
+    parser.add_argument("--family", action="append", choices=list(FAMILIES),
+                        help="родина завдань; можна кілька разів, за замовчуванням усі")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="процесів (за замовчуванням — за кількістю ядер)")
+    parser.add_argument("-o", "--output", default="worksheets", help="тека для PDF")
+    args = parser.parse_args(argv)
+
+    if args.names:
+        with open(args.names, encoding="utf-8") as f:
+            names = [line.strip() for line in f if line.strip()]
+    else:
+        names = [f"Учень {i + 1}" for i in range(args.students)]
+    os.makedirs(args.output, exist_ok=True)
+    jobs = student_jobs(names, args.family or list(FAMILIES), args.count, args.output, args.seed)
+    pages = render_worksheets(jobs, args.workers)
+    print(f"{len(jobs)} PDF, {pages} сторінок у {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Усі тренажери в одному процесі: вікно вибору теми, тренажери відкриваються окремими вікнами.
+
+Запуск:  python launcher.py
+
+Кожен файл тренажера імпортується один раз, а вже відкритий тренажер при повторному виборі
+лише піднімається наверх, тож перемикання між темами миттєве. matplotlib, шрифти й стилі
+спільні для всіх вікон (fraction_ui.host). Внизу показано пам'ять процесу; порівняння з
+окремими процесами для кожного тренажера — python benchmarks/launcher_memory.py.
+"""
+import importlib.util
+import os
+import sys
+import tkinter as tk
+from tkinter import ttk
+
+from fraction_ui.host import install_styles, resident_memory_mb, set_shared_root
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# (назва теми, файл тренажера, клас вікна)
+TRAINERS = [
+    ("Додавання: зведення доданків", "main.py", "FractionVisualizerApp"),
+    ("Додавання дробів", "dodav. drob.py", "FractionVisualizerApp"),
+    ("Віднімання дробів", "vidn. drob lvl1.py", "FractionVisualizerApp"),
+    ("Скорочення дробів", "skor.drob.py", "FractionReductionApp"),
+    ("Мішані числа і неправильні дроби", "mix to neprav drib.py", "FractionConverterApp"),
+    ("Додавання мішаних чисел", "dodav drob 2lvl.py", "FractionVisualizerApp"),
+    ("Віднімання мішаних чисел", "vind. drob lvl2.py", "FractionVisualizerApp"),
+]
+MEMORY_REFRESH_MS = 2000
+
+_classes = {}
+
+
+def trainer_class(index):
+    """Клас вікна тренажера TRAINERS[index]; файл імпортується лише під час першого виклику."""
+    if index not in _classes:
+        _, filename, class_name = TRAINERS[index]
+        spec = importlib.util.spec_from_file_location(f"trainer_{index}", os.path.join(ROOT_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        # Як звичайний імпорт: inspect.getfile (назва тренажера в профайлері) шукає модуль у sys.modules
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _classes[index] = getattr(module, class_name)
+    return _classes[index]
+
+
+class LauncherApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        set_shared_root(self)
+        self.title("Тренажери дробів")
+        self.style = install_styles(self)
+        self.windows = {}
+        self.memory_var = tk.StringVar()
+
+        frame = ttk.Frame(self, padding=20)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text="Оберіть тему", style="Title.TLabel").pack(pady=(0, 15))
+        for index, (title, _, _) in enumerate(TRAINERS):
+            ttk.Button(frame, text=title, command=lambda i=index: self.open_trainer(i)).pack(fill=tk.X, pady=4)
+        ttk.Label(frame, textvariable=self.memory_var).pack(pady=(15, 0))
+        self._update_memory()
+
+    def open_trainer(self, index):
+        """Відкриває тренажер або піднімає вже відкритий."""
+        window = self.windows.get(index)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            window.focus_set()
+            return window
+        window = self.windows[index] = trainer_class(index)(self)
+        return window
+
+    def open_count(self):
+        return sum(window.winfo_exists() for window in self.windows.values())
+
+    def _update_memory(self):
+        self.memory_var.set(f"Пам'ять процесу: {resident_memory_mb():.0f} МБ, відкрито тренажерів: {self.open_count()}")
+        self.after(MEMORY_REFRESH_MS, self._update_memory)
+
+
+if __name__ == "__main__":
+    app = LauncherApp()
+    app.mainloop()
@@ -1,89 +1,35 @@
 import tkinter as tk
-from tkinter import ttk, font
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.gridspec as gridspec
-import numpy as np
-import math
-import random
-from collections import Counter
-
-
-class SolutionWindow(tk.Toplevel):
+from tkinter import ttk
+from fraction_core.checking import check_converted_addends
+from fraction_core.primes import ensure_factor_table
+from fraction_core.solutions import addition_solution, prefetch
+from fraction_core.streams import session_stream
+from fraction_core.tasks import addition_task
+from fraction_ui.host import TrainerWindow, install_styles, shared_font
+from fraction_ui.scheduler import RenderScheduler
+from fraction_ui.solution_layout import Gap, Run, Stacked, fraction_items
+from fraction_ui.solution_view import VirtualSolutionWindow
+from fraction_ui.task_header import TaskHeader
+
+
+class SolutionWindow(VirtualSolutionWindow):
     """Окреме, повністю функціональне вікно для показу рішення"""
 
     def __init__(self, parent, solution_steps):
-        super().__init__(parent)
-        self.title("Рішення завдання")
-        self.geometry("800x600")
-
-        self.font_explanation = font.Font(family="Helvetica", size=18)
-        self.font_title = font.Font(family="Helvetica", size=20, weight="bold")
-        self.font_frac = font.Font(family="Helvetica", size=22, weight="bold")
-
-        main_canvas = tk.Canvas(self)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=main_canvas.yview)
-        scrollable_frame = ttk.Frame(main_canvas)
-
-        scrollable_frame.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
-        main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
-
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        row_counter = 0
-        for style, text in solution_steps:
-            frame = ttk.LabelFrame(scrollable_frame, padding=15)
-            frame.grid(row=row_counter, column=0, sticky="ew", pady=10, padx=10)
-            scrollable_frame.columnconfigure(0, weight=1)
-            row_counter += 1
-
-            lines = text.split('\n')
-
-            title_label = ttk.Label(frame, text=lines[0],
-                                    font=self.font_title if style == "bold" else self.font_explanation)
-            title_label.pack(anchor="w")
-
-            for line in lines[1:]:
-                if "->" in line:
-                    parts = line.split("->")
-                    frac_frame = ttk.Frame(frame)
-                    frac_frame.pack(anchor="w", pady=10)
-
-                    # Обробка кількох стрілок в одному рядку
-                    for i, part in enumerate(parts):
-                        if i > 0:
-                            ttk.Label(frac_frame, text="  ->  ", font=self.font_frac).pack(side=tk.LEFT, padx=10)
-                        self.draw_fraction_expression(frac_frame, part.strip())
-                else:
-                    line_label = ttk.Label(frame, text=line, font=self.font_explanation, wraplength=700)
-                    line_label.pack(anchor="w", pady=2)
-                    frame.bind("<Configure>", lambda e, lbl=line_label: lbl.config(wraplength=e.width - 40))
-
-    def draw_fraction_expression(self, parent, expression):
-        parts = expression.split('+')
-        for i, part in enumerate(parts):
-            if i > 0: ttk.Label(parent, text=" + ", font=self.font_frac).pack(side=tk.LEFT)
-            try:
-                n_str, d_str = map(str.strip, part.replace('(', '').replace(')', '').split('/'))
-            except ValueError:
-                ttk.Label(parent, text=part, font=self.font_frac).pack(side=tk.LEFT)
-                continue
-
-            canvas = tk.Canvas(parent, height=60, bg=self.cget('bg'), highlightthickness=0)
-            canvas.pack(side=tk.LEFT)
-            n_w, d_w = self.font_frac.measure(n_str), self.font_frac.measure(d_str)
-            max_w = max(n_w, d_w) + 10
-            canvas.config(width=max_w)
-            canvas.create_text(max_w / 2, 15, text=n_str, font=self.font_frac, anchor="center")
-            canvas.create_line(2, 30, max_w - 2, 30, width=3)
-            canvas.create_text(max_w / 2, 45, text=d_str, font=self.font_frac, anchor="center")
-
-
-class FractionVisualizerApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
+        super().__init__(parent, solution_steps, shared_font(18), shared_font(20, "bold"),
+                         shared_font(22, "bold"))
+
+    def expression_items(self, expression):
+        items = []
+        for i, part in enumerate(expression.split('+')):
+            if i > 0: items.append(Run(" + ", self.font_frac))
+            items += fraction_items(part, self.font_frac)
+        return items
+
+
+class FractionVisualizerApp(TrainerWindow):
+    def __init__(self, master=None):
+        super().__init__(master)
         self.title("Інтерактивний тренажер дробів")
         try:
             self.state('zoomed')
@@ -91,20 +37,18 @@ class FractionVisualizerApp(tk.Tk):
             self.attributes('-zoomed', True)
 
         self.MAX_DENOMINATOR = 100
+        ensure_factor_table(self.MAX_DENOMINATOR)
+        # Відтворювана послідовність завдань (FRACTIONS_SEED, FRACTIONS_TASK)
+        self.task_stream = session_stream(addition_task, self.MAX_DENOMINATOR)
         self.color1, self.color2, self.empty_color = 'deepskyblue', 'salmon', '#E0E0E0'
         self.task_n1, self.task_d1, self.task_n2, self.task_d2 = 0, 1, 0, 1
 
-        self.font_body = font.Font(family="Helvetica", size=16)
-        self.font_title = font.Font(family="Helvetica", size=18, weight="bold")
-        self.font_slider_value = font.Font(family="Helvetica", size=17, weight="bold")
-        self.font_success = font.Font(family="Helvetica", size=18, weight="bold")
+        self.font_body = shared_font(16)
+        self.font_title = shared_font(18, "bold")
+        self.font_slider_value = shared_font(17, "bold")
+        self.font_success = shared_font(18, "bold")
 
-        self.style = ttk.Style(self)
-        self.style.configure("TLabel", font=self.font_body)
-        self.style.configure("TButton", font=self.font_body, padding=10)
-        self.style.configure("TScale", length=300)
-        self.style.configure("Title.TLabel", font=self.font_title)
-        self.style.configure("Success.TLabel", font=self.font_success, foreground="green")
+        self.style = install_styles(self)
 
         self.num1_var, self.den1_var = tk.IntVar(), tk.IntVar()
         self.num2_var, self.den2_var = tk.IntVar(), tk.IntVar()
@@ -120,8 +64,8 @@ class FractionVisualizerApp(tk.Tk):
 
         task_frame = ttk.Frame(top_pane_frame)
         task_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
-        self.task_canvas = tk.Canvas(task_frame, height=60)
-        self.task_canvas.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.task_header = TaskHeader(task_frame, self.font_body, height=60)
+        self.task_header.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         toolbar_frame = ttk.Frame(task_frame)
         toolbar_frame.pack(side=tk.LEFT, padx=20)
@@ -142,11 +86,24 @@ class FractionVisualizerApp(tk.Tk):
         plot_frame = ttk.Frame(main_pane)
         main_pane.add(plot_frame, weight=6)
 
-        self.figure = plt.figure(figsize=(14, 6), dpi=90)
-        self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
-        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Фігура з'явиться в _create_figure, коли matplotlib завантажиться у фоні
+        self.plot_frame, self.figure = plot_frame, None
+        self.plot_layout, self.plot_axes, self.pie_views = None, None, {}
+        self.render_scheduler = RenderScheduler(self, self.visualize, profiler=self.profiler)
 
         self._generate_new_task()
+        self.load_plotting()
+
+    def _create_figure(self):
+        self.figure = self.plot.Figure(figsize=(14, 6), dpi=90)
+        self.canvas = self.plot.FigureCanvasTkAgg(self.figure, self.plot_frame)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.blitter = self.plot.BlitManager(self.canvas)
+        self.title_cache = self.plot.title_cache
+        self.layout_cache = self.plot.LayoutCache(self.figure, pad=2.0, h_pad=4.0)
+        self.frames = self.plot.FrameManager(self.blitter, self.layout_cache, profiler=self.profiler)
+        self.layout_cache.bind_configure(self.canvas.get_tk_widget())
+        self.render_scheduler.request()
 
     def _create_fraction_controls(self, parent, title, num_var, den_var, col):
         frame = ttk.Frame(parent);
@@ -175,33 +132,9 @@ class FractionVisualizerApp(tk.Tk):
         return {'frame': frame, 'scale': scale, 'plus': btn_plus, 'minus': btn_minus}
 
     def _update_task_display(self, n1, d1, n2, d2):
-        self.task_canvas.delete("all")
-        self.task_canvas.bind("<Configure>", lambda e: self._draw_task_fractions(n1, d1, n2, d2), add="+")
-        self.update_idletasks()
-        self._draw_task_fractions(n1, d1, n2, d2)
-
-    def _draw_task_fractions(self, n1, d1, n2, d2):
-        self.task_canvas.delete("all")
-        canvas_w, canvas_h = self.task_canvas.winfo_width(), self.task_canvas.winfo_height()
-        if canvas_w < 50: return
-        task_font = font.Font(family="Helvetica", size=24, weight="bold")
-        prefix_text = "Завдання: "
-        prefix_len = font.Font(font=self.font_body).measure(prefix_text)
-        self.task_canvas.create_text(10, canvas_h / 2, text=prefix_text, font=self.font_body, anchor="w", fill="navy")
-        x_pos = prefix_len + 15
-
-        def draw_frac(n, d, x):
-            n_w, d_w = task_font.measure(str(n)), task_font.measure(str(d))
-            max_w = max(n_w, d_w) + 10
-            self.task_canvas.create_text(x + max_w / 2, canvas_h / 2 - 16, text=str(n), font=task_font, anchor="center")
-            self.task_canvas.create_line(x, canvas_h / 2, x + max_w, canvas_h / 2, width=3)
-            self.task_canvas.create_text(x + max_w / 2, canvas_h / 2 + 16, text=str(d), font=task_font, anchor="center")
-            return x + max_w + 20
-
-        x_pos = draw_frac(n1, d1, x_pos)
-        self.task_canvas.create_text(x_pos, canvas_h / 2, text="+", font=task_font, anchor="center")
-        x_pos += 40
-        draw_frac(n2, d2, x_pos)
+        task_font = shared_font(24, "bold")
+        self.task_header.show([Stacked(str(n1), str(d1), task_font), Gap(20), Run("+", task_font), Gap(20),
+                               Stacked(str(n2), str(d2), task_font)])
 
     def _adjust_value(self, var, delta):
         var.set(var.get() + delta)
@@ -217,7 +150,7 @@ class FractionVisualizerApp(tk.Tk):
         if self.num1_var.get() > self.den1_var.get(): self.num1_var.set(self.den1_var.get())
         self.controls2['num']['scale'].config(to=self.den2_var.get())
         if self.num2_var.get() > self.den2_var.get(): self.num2_var.set(self.den2_var.get())
-        self.visualize()
+        self.render_scheduler.request()
 
     def _open_solution_window(self):
         self._build_solution_for_task()
@@ -231,13 +164,10 @@ class FractionVisualizerApp(tk.Tk):
                 control_group[part]['minus'].config(state=state)
 
     def _generate_new_task(self):
-        while True:
-            d1, d2 = random.randint(4, 15), random.randint(4, 15)
-            lcm = (d1 * d2) // math.gcd(d1, d2)
-            if d1 != d2 and lcm <= self.MAX_DENOMINATOR:
-                break
-        n1, n2 = random.randint(1, d1 - 1), random.randint(1, d2 - 1)
-        self._load_state((n1, d1, n2, d2))
+        state = next(self.task_stream)
+        # Кроки рішення будуються у фоні, поки учень розв'язує
+        prefetch(addition_solution, *state)
+        self._load_state(state)
 
     def _load_state(self, state):
         self._set_controls_state(tk.NORMAL)
@@ -251,97 +181,72 @@ class FractionVisualizerApp(tk.Tk):
         self._update_task_display(n1, d1, n2, d2)
         self._on_slider_change()
 
-    def get_prime_factorization(self, n):
-        factors, d = [], 2
-        while d * d <= n:
-            while (n % d) == 0: factors.append(d); n //= d
-            d += 1
-        if n > 1: factors.append(n)
-        return factors
-
-    def _get_detailed_lcm_explanation(self, d1, d2):
-        factors1, factors2 = self.get_prime_factorization(d1), self.get_prime_factorization(d2)
-        count1 = Counter(factors1)
-        lcm_factors_list, missing_factors = list(factors1), []
-        temp_count1 = count1.copy()
-        for factor in factors2:
-            if temp_count1.get(factor, 0) > 0:
-                temp_count1[factor] -= 1
-            else:
-                lcm_factors_list.append(factor);
-                missing_factors.append(str(factor))
-        lcm = math.prod(lcm_factors_list)
-        return [
-            ("bold", "--- КРОК 1: ПОШУК НСК (Найменшого Спільного Кратного) ---"),
-            ("normal",
-             f"1. Розкладемо знаменники ({d1} і {d2}) на прості множники:\n   {d1} = {' * '.join(map(str, factors1))}\n   {d2} = {' * '.join(map(str, factors2))}"),
-            ("normal",
-             "2. Щоб знайти НСК, випишемо множники першого числа і доповнимо їх тими, яких не вистачає з другого."),
-            ("normal", f"   - Беремо множники від {d1}: {', '.join(map(str, factors1))}"),
-            ("normal",
-             f"   - З множників {d2} не вистачає: {', '.join(missing_factors) if missing_factors else 'всі множники вже є'}"),
-            ("normal",
-             f"3. Перемножимо їх:\n   НСК = ({' * '.join(map(str, factors1))}) * {' * '.join(missing_factors) if missing_factors else '1'} = {lcm}"),
-            ("bold", "--- КРОК 2: ДОДАТКОВІ МНОЖНИКИ ---"),
-            ("normal", f"   - Для першого дробу: {lcm} ÷ {d1} = {lcm // d1}"),
-            ("normal", f"   - Для другого дробу: {lcm} ÷ {d2} = {lcm // d2}"),
-        ]
-
     def visualize(self):
-        self.figure.clear()
+        if self.figure is None:  # графіка ще завантажується
+            return
         num1, den1 = self.num1_var.get(), self.den1_var.get()
         num2, den2 = self.num2_var.get(), self.den2_var.get()
 
-        self.success_var.set("")  # Скидаємо повідомлення при кожній зміні
+        # Відповідь перевіряється, лише коли обидва дроби зведено до спільного знаменника
+        task = (self.task_n1, self.task_d1, self.task_n2, self.task_d2)
+        is_correct, message = check_converted_addends(task, num1, den1, num2, den2)
+        self.success_var.set(message)
+        if is_correct:
+            self._set_controls_state(tk.DISABLED)
 
-        # --- НОВА ЛОГІКА ПЕРЕВІРКИ ---
-        # Перевіряємо відповідь, тільки якщо користувач встановив спільний знаменник
-        if den1 > 0 and den1 == den2:
-            # Перевіряємо, чи еквівалентний перший дріб користувача першому дробу завдання
-            is_frac1_equiv = (num1 * self.task_d1 == self.task_n1 * den1)
-            # Перевіряємо, чи еквівалентний другий дріб користувача другому дробу завдання
-            is_frac2_equiv = (num2 * self.task_d2 == self.task_n2 * den2)
-
-            # Якщо обидва дроби перетворено правильно
-            if is_frac1_equiv and is_frac2_equiv:
-                sum_n = num1 + num2
-                sum_d = den1
+        # --- Логіка малювання залишається без змін ---
+        is_sum_greater_than_one = (den1 == den2 and (num1 + num2) > den1)
+        ax1, ax2, ax3, ax4 = self._get_plot_axes(is_sum_greater_than_one)
 
-                common_divisor = math.gcd(sum_n, sum_d)
+        self.draw_fraction_pie(ax1, [num1], [self.color1], den1, f"Перший дріб\n$\\frac{{{num1}}}{{{den1}}}$")
+        self.draw_fraction_pie(ax2, [num2], [self.color2], den2, f"Другий дріб\n$\\frac{{{num2}}}{{{den2}}}$")
 
-                if common_divisor > 1:
-                    # Відповідь правильна, але результат можна скоротити
-                    self.success_var.set("✔ Правильно! Результат можна скоротити.")
-                else:
-                    # Відповідь правильна і результат вже скорочений
-                    self.success_var.set("✔ ВІДМІННО! Результат нескоротний.")
+        if den1 == den2:
+            self._display_sum_result(ax3, ax4, num1, num2, den1)
+        else:
+            self.draw_placeholder(ax3, "Результат")
 
-                self._set_controls_state(tk.DISABLED)
+        self.frames.present()
 
-        # --- Логіка малювання залишається без змін ---
-        is_sum_greater_than_one = (den1 == den2 and (num1 + num2) > den1)
+    def _get_plot_axes(self, is_sum_greater_than_one):
+        """Осі будуються заново лише при переході між сітками 1x3 і 2x3, інакше використовуються наявні."""
+        if self.plot_layout == is_sum_greater_than_one:
+            return self.plot_axes
 
+        self.figure.clear()
+        self.pie_views = {}
         if is_sum_greater_than_one:
-            gs = gridspec.GridSpec(2, 3, figure=self.figure)
+            gs = self.plot.gridspec.GridSpec(2, 3, figure=self.figure)
             ax1, ax2 = self.figure.add_subplot(gs[:, 0]), self.figure.add_subplot(gs[:, 1])
             ax3, ax4 = self.figure.add_subplot(gs[0, 2]), self.figure.add_subplot(gs[1, 2])
         else:
-            gs = gridspec.GridSpec(1, 3, figure=self.figure)
+            gs = self.plot.gridspec.GridSpec(1, 3, figure=self.figure)
             ax1, ax2 = self.figure.add_subplot(gs[0]), self.figure.add_subplot(gs[1])
             ax3 = self.figure.add_subplot(gs[2])
             ax4 = None
 
-        self.draw_fraction_pie(ax1, [num1], [self.color1], den1, f"Перший дріб\n$\\frac{{{num1}}}{{{den1}}}$")
-        self.draw_fraction_pie(ax2, [num2], [self.color2], den2, f"Другий дріб\n$\\frac{{{num2}}}{{{den2}}}$")
-        ax2.axvline(x=1.6, color='grey', linestyle='--', linewidth=2, ymin=0.05, ymax=0.95)
-
-        if den1 == den2:
-            self._display_sum_result(ax3, ax4, num1, num2, den1)
-        else:
-            self.draw_placeholder(ax3, "Результат")
-
-        self.figure.tight_layout(pad=2.0, h_pad=4.0)
-        self.canvas.draw()
+        separator = ax2.axvline(x=1.6, color='grey', linestyle='--', linewidth=2, ymin=0.05, ymax=0.95)
+        self.plot_layout = is_sum_greater_than_one
+        self.plot_axes = (ax1, ax2, ax3, ax4)
+
+        self.blitter.reset()
+        for ax in filter(None, self.plot_axes):
+            self.blitter.register(ax, static=[separator])
+        return self.plot_axes
+
+    def _get_pie_view(self, ax):
+        """Художники однієї осі (круг, підпис значення, заглушка), створені один раз."""
+        view = self.pie_views.get(ax)
+        if view is None:
+            self.plot.prepare_pie_axes(ax)
+            ax.set_title("", pad=25, fontsize=26)
+            view = {
+                'pie': self.plot.make_pie(ax, empty_color=self.empty_color, divider_limit=40),
+                'value': ax.text(0, -1.4, "", ha='center', va='center', fontsize=18, color='gray'),
+                'placeholder': None,
+            }
+            self.pie_views[ax] = view
+        return view
 
     def _display_sum_result(self, ax3, ax4, n1, n2, den):
         sum_num = n1 + n2
@@ -359,68 +264,40 @@ class FractionVisualizerApp(tk.Tk):
                 self.draw_fraction_pie(ax4, [second_rem], [self.color2], den, "")
 
     def _build_solution_for_task(self):
-        n1, d1, n2, d2 = self.task_n1, self.task_d1, self.task_n2, self.task_d2
-        self.solution_steps = self._get_detailed_lcm_explanation(d1, d2)
-        lcm = (d1 * d2) // math.gcd(d1, d2)
-        m1, m2 = lcm // d1, lcm // d2
-
-        sum_n = (n1 * m1) + (n2 * m2)
-
-        sol_text = [
-            ("bold", "--- КРОК 3: ДОДАВАННЯ ДРОБІВ ---"),
-            ("normal",
-             f"1. Домножимо дроби із завдання на їх додаткові множники:\n({n1}/{d1}) + ({n2}/{d2}) -> ({(n1 * m1)}/{lcm}) + ({(n2 * m2)}/{lcm})"),
-            ("normal", f"2. Додамо чисельники:\n= ({sum_n}/{lcm})"),
-        ]
-        self.solution_steps.extend(sol_text)
-
-        # --- НОВИЙ КРОК: СКОРОЧЕННЯ РЕЗУЛЬТАТУ ---
-        common_divisor = math.gcd(sum_n, lcm)
-        if common_divisor > 1:
-            reduced_n = sum_n // common_divisor
-            reduced_d = lcm // common_divisor
-            reduction_step = [
-                ("bold", "--- КРОК 4: СКОРОЧЕННЯ РЕЗУЛЬТАТУ ---"),
-                ("normal", f"Отриманий дріб ({sum_n}/{lcm}) можна скоротити."),
-                ("normal", f"Знайдемо найбільший спільний дільник (НСД) для {sum_n} і {lcm}. НСД = {common_divisor}."),
-                ("normal",
-                 f"Поділимо чисельник і знаменник на {common_divisor}:\n({sum_n}/{lcm}) -> ({reduced_n}/{reduced_d})"),
-                ("bold", f"Кінцева відповідь: {reduced_n}/{reduced_d}")
-            ]
-            self.solution_steps.extend(reduction_step)
+        self.solution_steps = addition_solution(self.task_n1, self.task_d1, self.task_n2, self.task_d2)
 
     def draw_fraction_pie(self, ax, numerators, colors, denominator, title):
-        ax.set_title(title, pad=25, fontsize=26)
-        ax.axis('equal')
+        view = self._get_pie_view(ax)
+        self.title_cache.set(ax.title, title)
         total_num = sum(numerators)
         if total_num > 0 and denominator > 0:
             val, rounded_val = total_num / denominator, round(total_num / denominator, 3)
             prefix = "≈" if abs(val - rounded_val) > 1e-9 else "="
-            ax.text(0, -1.4, f"({prefix} {rounded_val})", ha='center', va='center', fontsize=18, color='gray')
-
-        sizes, final_colors = [], []
-        if sum(numerators) > 0:
-            sizes.extend(n for n in numerators if n > 0)
-            final_colors.extend(colors[:len(sizes)])
-        if denominator - sum(numerators) > 0:
-            sizes.append(denominator - sum(numerators))
-            final_colors.append(self.empty_color)
-
-        if not sizes:
-            sizes, final_colors = [1], [self.empty_color]
-
-        ax.pie(sizes, colors=final_colors, startangle=90, counterclock=False,
-               wedgeprops={'edgecolor': 'black', 'linewidth': 1})
-        if denominator <= 40:
-            for i in range(denominator):
-                angle = np.deg2rad(90 - i * (360.0 / denominator))
-                ax.plot([0, np.cos(angle)], [0, np.sin(angle)], color='black', lw=0.7, alpha=0.6)
+            view['value'].set_text(f"({prefix} {rounded_val})")
+            self.plot.set_artists_visible([view['value']], True)
+        else:
+            self.plot.set_artists_visible([view['value']], False)
+
+        view['pie'].update(numerators, colors, denominator)
+        view['pie'].set_visible(True)
+        if view['placeholder']:
+            self.plot.set_artists_visible(view['placeholder'], False)
+        self.plot.reset_pie_limits(ax)
 
     def draw_placeholder(self, ax, text):
-        ax.set_title(text, pad=25, fontsize=26)
-        ax.axis('equal')
-        ax.pie([1], colors=[self.empty_color], wedgeprops={'edgecolor': 'grey', 'linewidth': 1.5, 'linestyle': '--'})
-        ax.text(0, 0, "Зведіть до\nспільного\nзнаменника!", ha='center', va='center', fontsize=20, color='grey')
+        view = self._get_pie_view(ax)
+        self.title_cache.set(ax.title, text)
+        if view['placeholder'] is None:
+            circle = self.plot.Wedge((0, 0), 1, 0, 360, facecolor=self.empty_color, edgecolor='grey', linewidth=1.5,
+                           linestyle='--', clip_on=False)
+            ax.add_patch(circle)
+            label = ax.text(0, 0, "Зведіть до\nспільного\nзнаменника!", ha='center', va='center', fontsize=20,
+                            color='grey')
+            view['placeholder'] = (circle, label)
+        self.plot.set_artists_visible(view['placeholder'], True)
+        view['pie'].set_visible(False)
+        self.plot.set_artists_visible([view['value']], False)
+        self.plot.reset_pie_limits(ax)
 
 
 if __name__ == "__main__":
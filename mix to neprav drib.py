@@ -1,130 +1,34 @@
 import tkinter as tk
-from tkinter import ttk, font
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-import math
-import random
-
-
-class SolutionWindow(tk.Toplevel):
+from tkinter import ttk
+from fraction_core.checking import check_conversion
+from fraction_core.primes import ensure_factor_table
+from fraction_core.solutions import conversion_solution, prefetch
+from fraction_core.streams import session_stream
+from fraction_core.tasks import MIXED_TO_IMPROPER, conversion_task
+from fraction_ui.host import TrainerWindow, install_styles, shared_font
+from fraction_ui.scheduler import RenderScheduler
+from fraction_ui.solution_layout import Gap, Run, Stacked, fraction_items
+from fraction_ui.solution_view import VirtualSolutionWindow
+from fraction_ui.task_header import TaskHeader
+
+
+class SolutionWindow(VirtualSolutionWindow):
     """Окреме, повністю функціональне вікно для показу рішення"""
 
-    def __init__(self, parent, solution_steps, task_type):
-        super().__init__(parent)
-        self.title("Рішення завдання")
-        self.geometry("800x600")
-
-        self.font_explanation = font.Font(family="Helvetica", size=16)
-        self.font_title = font.Font(family="Helvetica", size=18, weight="bold")
-        self.font_frac = font.Font(family="Helvetica", size=20, weight="bold")
-        self.font_mixed = font.Font(family="Helvetica", size=24, weight="bold")
-
-        self.task_type = task_type  # Зберігаємо тип завдання для коректного відображення
-
-        main_canvas = tk.Canvas(self)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=main_canvas.yview)
-        scrollable_frame = ttk.Frame(main_canvas)
-
-        scrollable_frame.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
-        main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
-
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        row_counter = 0
-        for style, text in solution_steps:
-            frame = ttk.LabelFrame(scrollable_frame, padding=15)
-            frame.grid(row=row_counter, column=0, sticky="ew", pady=10, padx=10)
-            scrollable_frame.columnconfigure(0, weight=1)
-            row_counter += 1
-
-            lines = text.split('\n')
-
-            title_label = ttk.Label(frame, text=lines[0],
-                                    font=self.font_title if style == "bold" else self.font_explanation)
-            title_label.pack(anchor="w")
-
-            for line in lines[1:]:
-                if "->" in line:
-                    parts = line.split("->")
-                    left, right = parts[0].strip(), parts[1].strip()
-
-                    frac_frame = ttk.Frame(frame)
-                    frac_frame.pack(anchor="w", pady=10)
-
-                    # Логіка відображення в залежності від типу завдання та сторони "->"
-                    if self.task_type == "mixed_to_improper":
-                        # Зліва мішане, справа неправильне
-                        if ' ' in left and '/' in left:
-                            whole_str, fraction_str = left.split(' ', 1)
-                            self.draw_mixed_number(frac_frame, whole_str, fraction_str)
-                        else:
-                            self.draw_single_fraction(frac_frame, left)  # На випадок проміжного кроку з дробом
-
-                        ttk.Label(frac_frame, text="  ->  ", font=self.font_frac).pack(side=tk.LEFT, padx=10)
-                        self.draw_single_fraction(frac_frame, right)  # Результат завжди неправильний дріб
-
-                    elif self.task_type == "improper_to_mixed":
-                        # Зліва неправильне, справа мішане
-                        self.draw_single_fraction(frac_frame, left)  # Завжди неправильний дріб зліва
-
-                        ttk.Label(frac_frame, text="  ->  ", font=self.font_frac).pack(side=tk.LEFT, padx=10)
-                        if ' ' in right and '/' in right:
-                            whole_str, fraction_str = right.split(' ', 1)
-                            self.draw_mixed_number(frac_frame, whole_str, fraction_str)
-                        else:
-                            self.draw_single_fraction(frac_frame, right)  # На випадок проміжного кроку з дробом
-
-
-                else:
-                    line_label = ttk.Label(frame, text=line, font=self.font_explanation, wraplength=700)
-                    line_label.pack(anchor="w", pady=2)
-                    frame.bind("<Configure>", lambda e, lbl=line_label: lbl.config(wraplength=e.width - 40))
-
-    def draw_single_fraction(self, parent, frac_str):
-        try:
-            n_str, d_str = map(str.strip, frac_str.replace('(', '').replace(')', '').split('/'))
-        except ValueError:
-            ttk.Label(parent, text=frac_str, font=self.font_frac).pack(side=tk.LEFT)
-            return
-
-        canvas = tk.Canvas(parent, height=60, bg=self.cget('bg'), highlightthickness=0)
-        canvas.pack(side=tk.LEFT)
-        n_w, d_w = self.font_frac.measure(n_str), self.font_frac.measure(d_str)
-        max_w = max(n_w, d_w) + 10
-        canvas.config(width=max_w)
-        canvas.create_text(max_w / 2, 15, text=n_str, font=self.font_frac, anchor="center")
-        canvas.create_line(2, 30, max_w - 2, 30, width=3)
-        canvas.create_text(max_w / 2, 45, text=d_str, font=self.font_frac, anchor="center")
-
-    def draw_mixed_number(self, parent, whole_str, frac_str):
-        try:
-            n_str, d_str = map(str.strip, frac_str.replace('(', '').replace(')', '').split('/'))
-        except ValueError:
-            ttk.Label(parent, text=f"{whole_str} {frac_str}", font=self.font_mixed).pack(side=tk.LEFT)
-            return
-
-        whole_w = self.font_mixed.measure(whole_str)
-        n_w, d_w = self.font_frac.measure(n_str), self.font_frac.measure(d_str)
-        frac_max_w = max(n_w, d_w) + 10
-
-        canvas = tk.Canvas(parent, height=60, width=whole_w + frac_max_w + 5, bg=self.cget('bg'), highlightthickness=0)
-        canvas.pack(side=tk.LEFT)
-
-        canvas.create_text(whole_w / 2, 30, text=whole_str, font=self.font_mixed, anchor="center")
+    def __init__(self, parent, solution_steps):
+        # Потрібен уже під час компонування в super().__init__
+        self.font_mixed = shared_font(24, "bold")
+        super().__init__(parent, solution_steps, shared_font(16), shared_font(18, "bold"),
+                         shared_font(20, "bold"))
 
-        # Малюємо дробову частину
-        frac_x_offset = whole_w + 5
-        canvas.create_text(frac_x_offset + frac_max_w / 2, 15, text=n_str, font=self.font_frac, anchor="center")
-        canvas.create_line(frac_x_offset, 30, frac_x_offset + frac_max_w, 30, width=3)
-        canvas.create_text(frac_x_offset + frac_max_w / 2, 45, text=d_str, font=self.font_frac, anchor="center")
+    def expression_items(self, expression):
+        # Мішане число "w n/d" — з більшою цілою частиною, неправильний дріб — стовпчиком
+        return fraction_items(expression, self.font_frac, whole_font=self.font_mixed)
 
 
-class FractionConverterApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
+class FractionConverterApp(TrainerWindow):
+    def __init__(self, master=None):
+        super().__init__(master)
         self.title("Тренажер: Перетворення дробів")
         try:
             self.state('zoomed')
@@ -134,6 +38,10 @@ class FractionConverterApp(tk.Tk):
         self.MAX_DENOMINATOR = 10  # Обмежуємо для візуалізації
         self.MAX_WHOLE_PART = 5  # Максимальна ціла частина для візуалізації
         self.MAX_IMPROPER_NUMERATOR = self.MAX_DENOMINATOR * self.MAX_WHOLE_PART + self.MAX_DENOMINATOR - 1
+        ensure_factor_table(self.MAX_IMPROPER_NUMERATOR)
+        # Відтворювана послідовність завдань (FRACTIONS_SEED, FRACTIONS_TASK)
+        self.task_stream = session_stream(conversion_task, self.MAX_DENOMINATOR, self.MAX_WHOLE_PART,
+                                          self.MAX_IMPROPER_NUMERATOR)
 
         self.color_filled = 'mediumseagreen'
         self.color_empty = '#E0E0E0'
@@ -151,19 +59,14 @@ class FractionConverterApp(tk.Tk):
         self.success_var = tk.StringVar()
 
         # Шрифти
-        self.font_body = font.Font(family="Helvetica", size=16)
-        self.font_title = font.Font(family="Helvetica", size=18, weight="bold")
-        self.font_slider_value = font.Font(family="Helvetica", size=17, weight="bold")
-        self.font_success = font.Font(family="Helvetica", size=18, weight="bold")
-        self.font_task_display = font.Font(family="Helvetica", size=30, weight="bold")
+        self.font_body = shared_font(16)
+        self.font_title = shared_font(18, "bold")
+        self.font_slider_value = shared_font(17, "bold")
+        self.font_success = shared_font(18, "bold")
+        self.font_task_display = shared_font(30, "bold")
 
         # Стилі
-        self.style = ttk.Style(self)
-        self.style.configure("TLabel", font=self.font_body)
-        self.style.configure("TButton", font=self.font_body, padding=10)
-        self.style.configure("TScale", length=300)
-        self.style.configure("Title.TLabel", font=self.font_title)
-        self.style.configure("Success.TLabel", font=self.font_success, foreground="green")
+        self.style = install_styles(self)
 
         main_pane = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
         main_pane.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -175,8 +78,8 @@ class FractionConverterApp(tk.Tk):
         # Рамка завдання
         task_label_frame = ttk.LabelFrame(controls_main_frame, text="Завдання", padding=10)
         task_label_frame.pack(fill="x", pady=(0, 20))
-        self.task_canvas = tk.Canvas(task_label_frame, height=80, bg='white')
-        self.task_canvas.pack(fill=tk.X, expand=True)
+        self.task_header = TaskHeader(task_label_frame, self.font_body, offset=20, height=80, bg='white')
+        self.task_header.pack(fill=tk.X, expand=True)
 
         # Рамка для кнопок та повідомлення про успіх
         toolbar_frame = ttk.Frame(controls_main_frame)
@@ -199,12 +102,25 @@ class FractionConverterApp(tk.Tk):
         plot_frame = ttk.Frame(main_pane)
         main_pane.add(plot_frame, weight=5)
 
-        self.figure = plt.figure(figsize=(12, 6), dpi=90)
-        self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
-        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Фігура з'явиться в _create_figure, коли matplotlib завантажиться у фоні
+        self.plot_frame, self.figure = plot_frame, None
+        self.plot_axes, self.pie_pools = None, {}
+        self.render_scheduler = RenderScheduler(self, self._render, profiler=self.profiler)
 
         self._generate_new_task()  # Генеруємо перше завдання
         self._on_slider_change()  # Оновлюємо відображення
+        self.load_plotting()
+
+    def _create_figure(self):
+        self.figure = self.plot.Figure(figsize=(12, 6), dpi=90)
+        self.canvas = self.plot.FigureCanvasTkAgg(self.figure, self.plot_frame)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.blitter = self.plot.BlitManager(self.canvas)
+        self.title_cache = self.plot.title_cache
+        self.layout_cache = self.plot.LayoutCache(self.figure, pad=3.0)
+        self.frames = self.plot.FrameManager(self.blitter, self.layout_cache, profiler=self.profiler)
+        self.layout_cache.bind_configure(self.canvas.get_tk_widget())
+        self.render_scheduler.request()
 
     def _create_slider_unit(self, parent, label_text, var):
         frame = ttk.Frame(parent)
@@ -248,56 +164,26 @@ class FractionConverterApp(tk.Tk):
         else:  # mixed_to_improper
             self.user_num_controls['scale'].config(to=self.MAX_IMPROPER_NUMERATOR)
 
+        self.render_scheduler.request()
+
+    def _render(self):
         self._check_answer()
+        if self.figure is None:  # графіка ще завантажується
+            return
         self._visualize_fractions()
 
     def _update_task_display(self):
-        self.task_canvas.delete("all")
-        self.task_canvas.bind("<Configure>", self._draw_task_content, add="+")
-        self.update_idletasks()  # Оновлюємо вікно, щоб отримати коректні розміри canvas
-        self._draw_task_content()
-
-    def _draw_task_content(self, event=None):
-        self.task_canvas.delete("all")
-        canvas_w, canvas_h = self.task_canvas.winfo_width(), self.task_canvas.winfo_height()
-        if canvas_w < 50: return
-
-        prefix_text = "Завдання: "
-        prefix_len = font.Font(font=self.font_body).measure(prefix_text)
-        self.task_canvas.create_text(10, canvas_h / 2, text=prefix_text, font=self.font_body, anchor="w", fill="navy")
-        x_pos = prefix_len + 15
-
+        task_font = self.font_task_display
         if self.task_type == "mixed_to_improper":
-            whole_str = str(self.mixed_whole)
-            whole_w = self.font_task_display.measure(whole_str)
-            self.task_canvas.create_text(x_pos + whole_w / 2, canvas_h / 2, text=whole_str, font=self.font_task_display,
-                                         anchor="center")
-
-            frac_x_offset = x_pos + whole_w + 5
-            num_str, den_str = str(self.mixed_num), str(self.mixed_den)
-            num_w, den_w = self.font_task_display.measure(num_str), self.font_task_display.measure(den_str)
-            max_frac_w = max(num_w, den_w) + 10
-
-            self.task_canvas.create_text(frac_x_offset + max_frac_w / 2, canvas_h / 2 - 20, text=num_str,
-                                         font=self.font_task_display, anchor="center")
-            self.task_canvas.create_line(frac_x_offset, canvas_h / 2, frac_x_offset + max_frac_w, canvas_h / 2, width=3)
-            self.task_canvas.create_text(frac_x_offset + max_frac_w / 2, canvas_h / 2 + 20, text=den_str,
-                                         font=self.font_task_display, anchor="center")
-
-        elif self.task_type == "improper_to_mixed":
-            num_str, den_str = str(self.improper_num), str(self.improper_den)
-            num_w, den_w = self.font_task_display.measure(num_str), self.font_task_display.measure(den_str)
-            max_w = max(num_w, den_w) + 10
-
-            self.task_canvas.create_text(x_pos + max_w / 2, canvas_h / 2 - 20, text=num_str,
-                                         font=self.font_task_display, anchor="center")
-            self.task_canvas.create_line(x_pos, canvas_h / 2, x_pos + max_w, canvas_h / 2, width=3)
-            self.task_canvas.create_text(x_pos + max_w / 2, canvas_h / 2 + 20, text=den_str,
-                                         font=self.font_task_display, anchor="center")
+            items = [Run(str(self.mixed_whole), task_font), Gap(5),
+                     Stacked(str(self.mixed_num), str(self.mixed_den), task_font)]
+        else:
+            items = [Stacked(str(self.improper_num), str(self.improper_den), task_font)]
+        self.task_header.show(items)
 
     def _open_solution_window(self):
         self._build_solution_for_task()
-        SolutionWindow(self, self.solution_steps, self.task_type)
+        SolutionWindow(self, self.solution_steps)
 
     def _set_controls_state(self, state):
         for controls in [self.user_whole_controls, self.user_num_controls, self.user_den_controls]:
@@ -309,52 +195,19 @@ class FractionConverterApp(tk.Tk):
         self._set_controls_state(tk.NORMAL)
         self.success_var.set("")
 
-        self.task_type = random.choice(["mixed_to_improper", "improper_to_mixed"])
+        self.task_type, self.mixed_whole, self.mixed_num, self.mixed_den, self.improper_num = next(self.task_stream)
+        self.improper_den = self.mixed_den
+        # Кроки рішення будуються у фоні, поки учень розв'язує
+        prefetch(conversion_solution, (self.task_type, self.mixed_whole, self.mixed_num, self.mixed_den, self.improper_num))
 
-        # Генеруємо базові значення
-        den = random.randint(2, self.MAX_DENOMINATOR)
-        num_frac = random.randint(1, den - 1)  # Чисельник дробової частини мішаного числа
-        whole_part = random.randint(1, self.MAX_WHOLE_PART)
+        # Скидаємо поля вводу
+        self.user_whole_var.set(0)
+        self.user_num_var.set(0)
+        self.user_den_var.set(1)
 
-        if self.task_type == "mixed_to_improper":
-            self.mixed_whole = whole_part
-            self.mixed_num = num_frac
-            self.mixed_den = den
-
-            # Правильна відповідь
-            self.improper_num = self.mixed_whole * self.mixed_den + self.mixed_num
-            self.improper_den = self.mixed_den
-
-            # Скидаємо поля вводу до нуля або завдання
-            self.user_whole_var.set(0)  # Користувач вводить неправильний дріб, ціла частина не потрібна
-            self.user_num_var.set(0)
-            self.user_den_var.set(1)
-
-            # Активуємо/деактивуємо елементи управління
-            self._set_control_visibility(whole_part=False, improper_fraction_input=True)
-
-        else:  # improper_to_mixed
-            # Генеруємо неправильний дріб
-            self.improper_den = den
-            self.improper_num = random.randint(self.improper_den + 1,
-                                               self.MAX_IMPROPER_NUMERATOR)  # Чисельник має бути більшим за знаменник
-
-            # Правильна відповідь
-            self.mixed_whole = self.improper_num // self.improper_den
-            self.mixed_num = self.improper_num % self.improper_den
-            # Якщо чисельник виявився 0 (ідеально ділиться), то спробуємо ще раз
-            if self.mixed_num == 0:
-                self._generate_new_task()
-                return
-            self.mixed_den = self.improper_den
-
-            # Скидаємо поля вводу до нуля або завдання
-            self.user_whole_var.set(0)
-            self.user_num_var.set(0)
-            self.user_den_var.set(1)
-
-            # Активуємо/деактивуємо елементи управління
-            self._set_control_visibility(whole_part=True, improper_fraction_input=False)
+        # Для неправильного дробу ціла частина не потрібна, для мішаного числа — потрібна
+        mixed_to_improper = self.task_type == MIXED_TO_IMPROPER
+        self._set_control_visibility(whole_part=not mixed_to_improper, improper_fraction_input=mixed_to_improper)
 
         self._update_task_display()
         self._on_slider_change()  # Оновлюємо візуалізацію та перевірку
@@ -389,122 +242,18 @@ class FractionConverterApp(tk.Tk):
             self.user_num_controls['scale'].config(to=self.MAX_IMPROPER_NUMERATOR)
 
     def _check_answer(self):
-        user_w = self.user_whole_var.get()
-        user_n = self.user_num_var.get()
-        user_d = self.user_den_var.get()
-
-        if user_d == 0:  # Уникаємо ділення на нуль
-            self.success_var.set("")
-            return
-
-        is_correct = False
-
-        if self.task_type == "mixed_to_improper":
-            # Користувач має ввести неправильний дріб (тому ціла частина має бути 0)
-            if user_w != 0:
-                self.success_var.set("")  # Якщо введена ціла частина, це не неправильний дріб
-                return
-
-            # Перевіряємо еквівалентність дробів
-            gcd_user = math.gcd(user_n, user_d)
-            simplified_user_n = user_n // gcd_user
-            simplified_user_d = user_d // gcd_user
-
-            gcd_correct = math.gcd(self.improper_num, self.improper_den)
-            simplified_correct_n = self.improper_num // gcd_correct
-            simplified_correct_d = self.improper_den // gcd_correct
-
-            if (simplified_user_n == simplified_correct_n and
-                    simplified_user_d == simplified_correct_d):
-                is_correct = True
-
-        else:  # improper_to_mixed
-            # Користувач має ввести мішане число
-            # Чисельник дробової частини не може бути більшим або рівним знаменнику
-            if user_n >= user_d and user_d > 0:
-                self.success_var.set("")  # Якщо введений дріб є неправильним, то це не мішане число
-                return
-
-            # Перевіряємо, чи збігаються цілі частини та дробові частини (враховуючи скорочення)
-            if user_w == self.mixed_whole:
-                gcd_user_frac = math.gcd(user_n, user_d)
-                gcd_correct_frac = math.gcd(self.mixed_num, self.mixed_den)
-                if (user_n // gcd_user_frac == self.mixed_num // gcd_correct_frac and
-                        user_d // gcd_user_frac == self.mixed_den // gcd_correct_frac):
-                    is_correct = True
-
+        task = (self.task_type, self.mixed_whole, self.mixed_num, self.mixed_den, self.improper_num)
+        is_correct, message = check_conversion(
+            task, self.user_whole_var.get(), self.user_num_var.get(), self.user_den_var.get())
+        self.success_var.set(message)
         if is_correct:
-            self.success_var.set("✔ ПРАВИЛЬНО!")
             self._set_controls_state(tk.DISABLED)
-        else:
-            self.success_var.set("")
 
     def _build_solution_for_task(self):
-        if self.task_type == "mixed_to_improper":
-            w, n, d = self.mixed_whole, self.mixed_num, self.mixed_den
-            step1_res = w * d
-            final_num = step1_res + n
-
-            self.solution_steps = [
-                ("bold", f"--- Перетворення мішаного числа {w} {n}/{d} в неправильний дріб ---"),
-                ("bold", "--- КРОК 1: Множимо цілу частину на знаменник ---"),
-                ("normal",
-                 f"Щоб перетворити мішане число, спочатку помножте цілу частину ({w}) на знаменник ({d})."),
-                ("normal",
-                 f"{w} × {d} = {step1_res}"),
-                ("bold", "--- КРОК 2: Додаємо чисельник до результату ---"),
-                ("normal",
-                 f"Додайте отриманий результат ({step1_res}) до чисельника ({n}) мішаного числа. Це буде новий чисельник неправильного дробу."),
-                ("normal",
-                 f"{step1_res} + {n} = {final_num}"),
-                ("bold", "--- КРОК 3: Формуємо неправильний дріб ---"),
-                ("normal",
-                 f"Новий чисельник - {final_num}, а знаменник залишається таким же, як і в початкового мішаного числа ({d})."),
-                ("normal",
-                 f"{w} {n}/{d} -> {final_num}/{d}"),
-                ("bold", "--- РЕЗУЛЬТАТ ---"),
-                ("normal", f"Мішане число {w} {n}/{d} перетворюється в неправильний дріб: {final_num}/{d}")
-            ]
-        else:  # improper_to_mixed
-            num_imp, den_imp = self.improper_num, self.improper_den
-
-            # Крок 1: Ділення чисельника на знаменник
-            whole_res = num_imp // den_imp
-            remainder_res = num_imp % den_imp
-
-            # Крок 2: Формування мішаного числа
-            simplified_num, simplified_den = remainder_res, den_imp
-            # Якщо є можливість скоротити дробову частину
-            if remainder_res != 0:
-                gcd_frac = math.gcd(remainder_res, den_imp)
-                simplified_num = remainder_res // gcd_frac
-                simplified_den = den_imp // gcd_frac
-
-            self.solution_steps = [
-                ("bold", f"--- Перетворення неправильного дробу {num_imp}/{den_imp} в мішане число ---"),
-                ("bold", "--- КРОК 1: Ділимо чисельник на знаменник ---"),
-                ("normal",
-                 f"Щоб перетворити неправильний дріб, поділіть чисельник ({num_imp}) на знаменник ({den_imp})."),
-                ("normal",
-                 f"{num_imp} ÷ {den_imp} = {whole_res} (ціла частина) з залишком {remainder_res} (новий чисельник)."),
-                ("bold", "--- КРОК 2: Формуємо мішане число ---"),
-                ("normal",
-                 f"Ціла частина дробу стає цілою частиною мішаного числа ({whole_res})."),
-                ("normal",
-                 f"Залишок від ділення ({remainder_res}) стає чисельником дробової частини."),
-                ("normal",
-                 f"Знаменник залишається без змін ({den_imp})."),
-                ("normal",
-                 f"({num_imp}/{den_imp}) -> {whole_res} {remainder_res}/{den_imp}"),
-                ("normal",
-                 f"Скорочуємо дробову частину, якщо можливо: {remainder_res}/{den_imp} -> {simplified_num}/{simplified_den}"),
-                ("bold", "--- РЕЗУЛЬТАТ ---"),
-                ("normal",
-                 f"Неправильний дріб {num_imp}/{den_imp} перетворюється в мішане число: {whole_res} {simplified_num}/{simplified_den}")
-            ]
+        task = (self.task_type, self.mixed_whole, self.mixed_num, self.mixed_den, self.improper_num)
+        self.solution_steps = conversion_solution(task)
 
     def _visualize_fractions(self):
-        self.figure.clear()
 
         # Визначення, що візуалізуємо в секції "Завдання"
         task_num_for_pie = 0
@@ -538,79 +287,54 @@ class FractionConverterApp(tk.Tk):
             # Відповідь має бути неправильним дробом
             user_title_text = f"Ваша відповідь: $\\frac{{{self.user_num_var.get()}}}{{{self.user_den_var.get()}}}$"
 
-        # Створюємо два subplot'а для порівняння
-        ax1 = self.figure.add_subplot(1, 2, 1)
-        ax2 = self.figure.add_subplot(1, 2, 2)
+        ax1, ax2 = self._get_plot_axes()
 
         # Малюємо візуалізацію для завдання та відповіді
         self.draw_fraction_pie(ax1, task_num_for_pie, task_den_for_pie, task_title_text, self.color_filled)
         self.draw_fraction_pie(ax2, user_num_for_pie, user_den_for_pie, user_title_text, 'salmon')
 
-        self.figure.tight_layout(pad=3.0)
-        self.canvas.draw()
+        self.frames.present()
+
+    def _get_plot_axes(self):
+        """Два subplot'а для порівняння створюються один раз, далі оновлюються лише кола на них."""
+        if self.plot_axes is None:
+            self.plot_axes = (self.figure.add_subplot(1, 2, 1), self.figure.add_subplot(1, 2, 2))
+            for ax in self.plot_axes:
+                ax.set_title("", fontsize=20, pad=20)
+                ax.set_aspect('equal')
+                ax.axis('off')
+                # Розділювачі малюються лише до знаменника 20, щоб не було занадто багато ліній
+                self.pie_pools[ax] = self.plot.PiePool(ax, factory=self.plot.make_pie, empty_color=self.color_empty,
+                                                       max_wedges=2, divider_limit=20)
+                self.blitter.register(ax)
+        return self.plot_axes
 
     def draw_fraction_pie(self, ax, numerator, denominator, title, color):
-        ax.clear()
-        ax.set_title(title, fontsize=20, pad=20)
-        ax.set_aspect('equal')
-        ax.axis('off')
+        self.title_cache.set(ax.title, title)
 
-        if denominator <= 0:
-            return
-
-        # Розраховуємо кількість повних кіл та залишок
-        whole_part = numerator // denominator
-        fractional_numerator = numerator % denominator
-
-        # Визначаємо, скільки всього кіл потрібно намалювати
         pies_to_draw = []
-        for _ in range(whole_part):
-            pies_to_draw.append(denominator)  # Повне коло
-
-        if fractional_numerator > 0:
-            pies_to_draw.append(fractional_numerator)
-
-        # Якщо результат 0, все одно малюємо одне пусте коло
-        if not pies_to_draw and numerator == 0:
-            pies_to_draw.append(0)
-
+        if denominator > 0:
+            # Розраховуємо кількість повних кіл та залишок
+            whole_part, fractional_numerator = divmod(numerator, denominator)
+            pies_to_draw = [denominator] * whole_part
+            if fractional_numerator > 0:
+                pies_to_draw.append(fractional_numerator)
+            # Якщо результат 0, все одно малюємо одне пусте коло
+            if not pies_to_draw and numerator == 0:
+                pies_to_draw.append(0)
+
+        # Розташовуємо кола в один ряд, радіус залежить від кількості кіл
         num_pies = len(pies_to_draw)
-        if num_pies == 0: return
-
-        # Розташовуємо кола в один ряд
-        pie_radius = 0.9 / (2 * num_pies)  # Радіус залежить від кількості кіл
-
-        for i, num in enumerate(pies_to_draw):
-            # Розраховуємо центр кожного кола
-            x_center = (2 * i + 1) / (2 * num_pies)
-            y_center = 0.5
-
-            # Визначаємо, які частини малювати
-            if num > 0:
-                sizes = [num, denominator - num] if denominator - num > 0 else [num]
-                colors = [color, self.color_empty] if denominator - num > 0 else [color]
-            else:  # Для випадку 0/D
-                sizes = [1]
-                colors = [self.color_empty]
-
-            # Малюємо саме коло (pie chart)
-            ax.pie(sizes, colors=colors, startangle=90, counterclock=False,
-                   radius=pie_radius, center=(x_center, y_center),
-                   wedgeprops={'edgecolor': 'black', 'linewidth': 1})
-
-            # Малюємо розділювачі для наочності
-            if denominator <= 20:  # Обмеження, щоб не було занадто багато ліній
-                for j in range(denominator):
-                    angle = np.deg2rad(90 - j * (360.0 / denominator))
-                    x1 = x_center
-                    y1 = y_center
-                    x2 = x_center + pie_radius * np.cos(angle)
-                    y2 = y_center + pie_radius * np.sin(angle)
-                    ax.plot([x1, x2], [y1, y2], color='black', lw=0.7, alpha=0.6)
+        pie_radius = 0.9 / (2 * num_pies) if num_pies else 0
+        self.pie_pools[ax].show(
+            ([num], [color], denominator, ((2 * i + 1) / (2 * num_pies), 0.5), pie_radius)
+            for i, num in enumerate(pies_to_draw)
+        )
 
         ax.set_ylim(0, 1)
         ax.set_xlim(0, 1)
 
+
 if __name__ == "__main__":
     app = FractionConverterApp()
     app.mainloop()
\ No newline at end of file
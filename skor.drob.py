@@ -1,82 +1,28 @@
 import tkinter as tk
-from tkinter import ttk, font
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-import math
-import random
-
-
-class SolutionWindow(tk.Toplevel):
+from tkinter import ttk
+from fraction_core.checking import check_reduction
+from fraction_core.primes import ensure_factor_table
+from fraction_core.solutions import reduction_solution, prefetch
+from fraction_core.streams import session_stream
+from fraction_core.tasks import reduction_task
+from fraction_ui.host import TrainerWindow, install_styles, shared_font
+from fraction_ui.scheduler import RenderScheduler
+from fraction_ui.solution_layout import Stacked
+from fraction_ui.solution_view import VirtualSolutionWindow
+from fraction_ui.task_header import TaskHeader
+
+
+class SolutionWindow(VirtualSolutionWindow):
     """Окреме, повністю функціональне вікно для показу рішення"""
 
     def __init__(self, parent, solution_steps):
-        super().__init__(parent)
-        self.title("Рішення завдання")
-        self.geometry("800x600")
-
-        self.font_explanation = font.Font(family="Helvetica", size=18)
-        self.font_title = font.Font(family="Helvetica", size=20, weight="bold")
-        self.font_frac = font.Font(family="Helvetica", size=22, weight="bold")
-
-        main_canvas = tk.Canvas(self)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=main_canvas.yview)
-        scrollable_frame = ttk.Frame(main_canvas)
-
-        scrollable_frame.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
-        main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
-
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        row_counter = 0
-        for style, text in solution_steps:
-            frame = ttk.LabelFrame(scrollable_frame, padding=15)
-            frame.grid(row=row_counter, column=0, sticky="ew", pady=10, padx=10)
-            scrollable_frame.columnconfigure(0, weight=1)
-            row_counter += 1
-
-            lines = text.split('\n')
-
-            title_label = ttk.Label(frame, text=lines[0],
-                                    font=self.font_title if style == "bold" else self.font_explanation)
-            title_label.pack(anchor="w")
-
-            for line in lines[1:]:
-                if "->" in line:
-                    parts = line.split("->")
-                    left, right = parts[0].strip(), parts[1].strip()
-                    frac_frame = ttk.Frame(frame)
-                    frac_frame.pack(anchor="w", pady=10)
-                    self.draw_single_fraction(frac_frame, left)
-                    ttk.Label(frac_frame, text="  ->  ", font=self.font_frac).pack(side=tk.LEFT, padx=10)
-                    self.draw_single_fraction(frac_frame, right)
-                else:
-                    line_label = ttk.Label(frame, text=line, font=self.font_explanation, wraplength=700)
-                    line_label.pack(anchor="w", pady=2)
-                    frame.bind("<Configure>", lambda e, lbl=line_label: lbl.config(wraplength=e.width - 40))
-
-    def draw_single_fraction(self, parent, frac_str):
-        try:
-            n_str, d_str = map(str.strip, frac_str.replace('(', '').replace(')', '').split('/'))
-        except ValueError:
-            ttk.Label(parent, text=frac_str, font=self.font_frac).pack(side=tk.LEFT)
-            return
+        super().__init__(parent, solution_steps, shared_font(18), shared_font(20, "bold"),
+                         shared_font(22, "bold"))
 
-        canvas = tk.Canvas(parent, height=60, bg=self.cget('bg'), highlightthickness=0)
-        canvas.pack(side=tk.LEFT)
-        n_w, d_w = self.font_frac.measure(n_str), self.font_frac.measure(d_str)
-        max_w = max(n_w, d_w) + 10
-        canvas.config(width=max_w)
-        canvas.create_text(max_w / 2, 15, text=n_str, font=self.font_frac, anchor="center")
-        canvas.create_line(2, 30, max_w - 2, 30, width=3)
-        canvas.create_text(max_w / 2, 45, text=d_str, font=self.font_frac, anchor="center")
 
-
-class FractionReductionApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
+class FractionReductionApp(TrainerWindow):
+    def __init__(self, master=None):
+        super().__init__(master)
         self.title("Тренажер скорочення дробів")
         try:
             self.state('zoomed')
@@ -84,21 +30,19 @@ class FractionReductionApp(tk.Tk):
             self.attributes('-zoomed', True)
 
         self.MAX_DENOMINATOR = 100
+        ensure_factor_table(self.MAX_DENOMINATOR)
+        # Відтворювана послідовність завдань (FRACTIONS_SEED, FRACTIONS_TASK)
+        self.task_stream = session_stream(reduction_task, self.MAX_DENOMINATOR)
         self.color1, self.color2, self.empty_color = 'mediumseagreen', 'salmon', '#E0E0E0'
         self.task_n, self.task_d = 0, 1
         self.correct_n, self.correct_d = 0, 1
 
-        self.font_body = font.Font(family="Helvetica", size=16)
-        self.font_title = font.Font(family="Helvetica", size=18, weight="bold")
-        self.font_slider_value = font.Font(family="Helvetica", size=17, weight="bold")
-        self.font_success = font.Font(family="Helvetica", size=18, weight="bold")
+        self.font_body = shared_font(16)
+        self.font_title = shared_font(18, "bold")
+        self.font_slider_value = shared_font(17, "bold")
+        self.font_success = shared_font(18, "bold")
 
-        self.style = ttk.Style(self)
-        self.style.configure("TLabel", font=self.font_body)
-        self.style.configure("TButton", font=self.font_body, padding=10)
-        self.style.configure("TScale", length=300)
-        self.style.configure("Title.TLabel", font=self.font_title)
-        self.style.configure("Success.TLabel", font=self.font_success, foreground="green")
+        self.style = install_styles(self)
 
         self.num_var, self.den_var = tk.IntVar(), tk.IntVar()
         self.success_var = tk.StringVar()
@@ -111,8 +55,8 @@ class FractionReductionApp(tk.Tk):
 
         task_frame = ttk.Frame(controls_main_frame)
         task_frame.pack(fill="x", pady=(0, 20))
-        self.task_canvas = tk.Canvas(task_frame, height=60)
-        self.task_canvas.pack(fill=tk.X, expand=True)
+        self.task_header = TaskHeader(task_frame, self.font_body, prefix="Завдання: скоротити ", height=60)
+        self.task_header.pack(fill=tk.X, expand=True)
 
         toolbar_frame = ttk.Frame(controls_main_frame)
         toolbar_frame.pack(fill="x", pady=20)
@@ -129,11 +73,24 @@ class FractionReductionApp(tk.Tk):
         plot_frame = ttk.Frame(main_pane)
         main_pane.add(plot_frame, weight=5)
 
-        self.figure = plt.figure(figsize=(12, 6), dpi=90)
-        self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
-        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Фігура з'явиться в _create_figure, коли matplotlib завантажиться у фоні
+        self.plot_frame, self.figure = plot_frame, None
+        self.plot_axes, self.pie_views = None, {}
+        self.render_scheduler = RenderScheduler(self, self.visualize, profiler=self.profiler)
 
         self._generate_new_task()
+        self.load_plotting()
+
+    def _create_figure(self):
+        self.figure = self.plot.Figure(figsize=(12, 6), dpi=90)
+        self.canvas = self.plot.FigureCanvasTkAgg(self.figure, self.plot_frame)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.blitter = self.plot.BlitManager(self.canvas)
+        self.title_cache = self.plot.title_cache
+        self.layout_cache = self.plot.LayoutCache(self.figure, pad=3.0)
+        self.frames = self.plot.FrameManager(self.blitter, self.layout_cache, profiler=self.profiler)
+        self.layout_cache.bind_configure(self.canvas.get_tk_widget())
+        self.render_scheduler.request()
 
     def _create_fraction_controls(self, parent, title, num_var, den_var):
         frame = ttk.Frame(parent, padding=10)
@@ -161,26 +118,7 @@ class FractionReductionApp(tk.Tk):
         return {'frame': frame, 'scale': scale, 'plus': btn_plus, 'minus': btn_minus}
 
     def _update_task_display(self, n, d):
-        self.task_canvas.delete("all")
-        self.task_canvas.bind("<Configure>", lambda e: self._draw_task_fraction(n, d), add="+")
-        self.update_idletasks()
-        self._draw_task_fraction(n, d)
-
-    def _draw_task_fraction(self, n, d):
-        self.task_canvas.delete("all")
-        canvas_w, canvas_h = self.task_canvas.winfo_width(), self.task_canvas.winfo_height()
-        if canvas_w < 50: return
-        task_font = font.Font(family="Helvetica", size=24, weight="bold")
-        prefix_text = "Завдання: скоротити "
-        prefix_len = font.Font(font=self.font_body).measure(prefix_text)
-        self.task_canvas.create_text(10, canvas_h / 2, text=prefix_text, font=self.font_body, anchor="w", fill="navy")
-        x_pos = prefix_len + 15
-
-        n_w, d_w = task_font.measure(str(n)), task_font.measure(str(d))
-        max_w = max(n_w, d_w) + 10
-        self.task_canvas.create_text(x_pos + max_w / 2, canvas_h / 2 - 16, text=str(n), font=task_font, anchor="center")
-        self.task_canvas.create_line(x_pos, canvas_h / 2, x_pos + max_w, canvas_h / 2, width=3)
-        self.task_canvas.create_text(x_pos + max_w / 2, canvas_h / 2 + 16, text=str(d), font=task_font, anchor="center")
+        self.task_header.show([Stacked(str(n), str(d), shared_font(24, "bold"))])
 
     def _adjust_value(self, var, delta):
         var.set(var.get() + delta)
@@ -192,7 +130,7 @@ class FractionReductionApp(tk.Tk):
         if self.num_var.get() < 0: self.num_var.set(0)
         self.controls['num']['scale'].config(to=self.den_var.get())
         if self.num_var.get() > self.den_var.get(): self.num_var.set(self.den_var.get())
-        self.visualize()
+        self.render_scheduler.request()
 
     def _open_solution_window(self):
         self._build_solution_for_task()
@@ -205,21 +143,10 @@ class FractionReductionApp(tk.Tk):
             self.controls[part]['minus'].config(state=state)
 
     def _generate_new_task(self):
-        while True:
-            d_corr = random.randint(3, 12)
-            n_corr = random.randint(1, d_corr - 1)
-            if math.gcd(n_corr, d_corr) == 1:
-                break
-
-        multiplier = random.randint(2, 8)
-        n_task = n_corr * multiplier
-        d_task = d_corr * multiplier
-
-        if d_task > self.MAX_DENOMINATOR:
-            self._generate_new_task()
-            return
-
-        self._load_state((n_task, d_task, n_corr, d_corr))
+        state = next(self.task_stream)
+        # Кроки рішення будуються у фоні, поки учень розв'язує
+        prefetch(reduction_solution, *state[:2])
+        self._load_state(state)
 
     def _load_state(self, state):
         self._set_controls_state(tk.NORMAL)
@@ -235,50 +162,20 @@ class FractionReductionApp(tk.Tk):
         self._update_task_display(n_task, d_task)
         self._on_slider_change()
 
-    def get_prime_factorization(self, n):
-        factors, d = [], 2
-        while d * d <= n:
-            while (n % d) == 0: factors.append(d); n //= d
-            d += 1
-        if n > 1: factors.append(n)
-        return factors
-
     def _build_solution_for_task(self):
-        n, d = self.task_n, self.task_d
-        gcd = math.gcd(n, d)
-
-        n_factors_str = ' * '.join(map(str, self.get_prime_factorization(n)))
-        d_factors_str = ' * '.join(map(str, self.get_prime_factorization(d)))
-
-        self.solution_steps = [
-            ("bold", "--- КРОК 1: ПОШУК НАЙБІЛЬШОГО СПІЛЬНОГО ДІЛЬНИКА (НСД) ---"),
-            ("normal",
-             f"Щоб скоротити дріб, потрібно знайти найбільше число, на яке ділиться і чисельник ({n}), і знаменник ({d})."),
-            ("normal", f"1. Розкладемо числа на прості множники:\n   {n} = {n_factors_str}\n   {d} = {d_factors_str}"),
-            ("normal", "2. Знайдемо спільні множники в обох розкладах і перемножимо їх. Це і буде НСД."),
-            ("normal", f"   НСД({n}, {d}) = {gcd}"),
-            ("bold", "--- КРОК 2: СКОРОЧЕННЯ ДРОБУ ---"),
-            ("normal", f"Тепер поділимо чисельник і знаменник на їх НСД, тобто на {gcd}."),
-            ("normal", f"Чисельник: {n} ÷ {gcd} = {self.correct_n}\nЗнаменник: {d} ÷ {gcd} = {self.correct_d}"),
-            ("normal", f"({n}/{d}) -> ({self.correct_n}/{self.correct_d})"),
-            ("bold", "--- РЕЗУЛЬТАТ ---"),
-            ("normal", f"Скорочений дріб: {self.correct_n}/{self.correct_d}")
-        ]
+        self.solution_steps = reduction_solution(self.task_n, self.task_d)
 
     def visualize(self):
-        self.figure.clear()
+        if self.figure is None:  # графіка ще завантажується
+            return
         user_n, user_d = self.num_var.get(), self.den_var.get()
 
-        is_correct = (user_n == self.correct_n and user_d == self.correct_d)
-
+        is_correct, message = check_reduction(self.correct_n, self.correct_d, user_n, user_d)
+        self.success_var.set(message)
         if is_correct:
-            self.success_var.set("✔ ПРАВИЛЬНО!")
             self._set_controls_state(tk.DISABLED)
-        else:
-            self.success_var.set("")
 
-        ax1 = self.figure.add_subplot(1, 2, 1)
-        ax2 = self.figure.add_subplot(1, 2, 2)
+        ax1, ax2 = self._get_plot_axes()
 
         # Малюємо початковий дріб (завдання)
         self.draw_fraction_pie(ax1, self.task_n, self.color1, self.task_d,
@@ -288,39 +185,44 @@ class FractionReductionApp(tk.Tk):
         # Використовуємо інший колір для наочності
         self.draw_fraction_pie(ax2, user_n, self.color2, user_d, f"Ваш дріб\n$\\frac{{{user_n}}}{{{user_d}}}$")
 
-        self.figure.tight_layout(pad=3.0)
-        self.canvas.draw()
+        self.frames.present()
+
+    def _get_plot_axes(self):
+        """Дві осі створюються один раз, далі оновлюються лише художники на них."""
+        if self.plot_axes is None:
+            self.plot_axes = (self.figure.add_subplot(1, 2, 1), self.figure.add_subplot(1, 2, 2))
+            for ax in self.plot_axes:
+                self.blitter.register(ax)
+        return self.plot_axes
+
+    def _get_pie_view(self, ax):
+        """Художники однієї осі (круг і підпис значення), створені один раз."""
+        view = self.pie_views.get(ax)
+        if view is None:
+            self.plot.prepare_pie_axes(ax)
+            ax.set_title("", pad=20, fontsize=24)
+            view = {
+                'pie': self.plot.make_pie(ax, empty_color=self.empty_color, max_wedges=2, divider_limit=40),
+                'value': ax.text(0, -1.3, "", ha='center', va='center', fontsize=18, color='gray'),
+            }
+            self.pie_views[ax] = view
+        return view
 
     def draw_fraction_pie(self, ax, numerator, color, denominator, title):
-        ax.set_title(title, pad=20, fontsize=24)
-        ax.axis('equal')
+        view = self._get_pie_view(ax)
+        self.title_cache.set(ax.title, title)
 
         if numerator > 0 and denominator > 0:
             val = numerator / denominator
-            # --- ЗМІНЕНО ТУТ ---
             # Використовуємо ":.3g" замість ":.3f", щоб видалити зайві нулі
-            ax.text(0, -1.3, f"(= {val:.3g})", ha='center', va='center', fontsize=18, color='gray')
-
-        sizes, colors = [], []
-        if numerator > 0:
-            sizes.append(numerator)
-            colors.append(color)
-        if denominator - numerator > 0:
-            sizes.append(denominator - numerator)
-            colors.append(self.empty_color)
-
-        # Запобігаємо помилці, якщо дріб 0/0 (хоча логіка це не допускає)
-        if not sizes:
-            sizes, colors = [1], [self.empty_color]
-
-        ax.pie(sizes, colors=colors, startangle=90, counterclock=False,
-               wedgeprops={'edgecolor': 'black', 'linewidth': 1})
-
-        # Малюємо розділювачі для наочності
-        if denominator <= 40:
-            for i in range(denominator):
-                angle = np.deg2rad(90 - i * (360.0 / denominator))
-                ax.plot([0, np.cos(angle)], [0, np.sin(angle)], color='black', lw=0.7, alpha=0.6)
+            view['value'].set_text(f"(= {val:.3g})")
+            self.plot.set_artists_visible([view['value']], True)
+        else:
+            self.plot.set_artists_visible([view['value']], False)
+
+        # Розділювачі для наочності PieArtist малює сам (до знаменника 40)
+        view['pie'].update([numerator], [color], denominator)
+        self.plot.reset_pie_limits(ax)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,48 @@
+"""Спільні фікстури тестів: фігура на Agg без вікна."""
+import logging
+
+import matplotlib
+import pytest
+
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_plotting():
+    """Без повідомлень matplotlib про межі осей, які круги виставляють свідомо."""
+    logging.getLogger("matplotlib").setLevel(logging.ERROR)
+
+
+@pytest.fixture
+def canvas():
+    """Полотно Agg з фігурою розміру тренажера."""
+    return FigureCanvasAgg(Figure(figsize=(14, 6), dpi=90))
+
+
+@pytest.fixture
+def ax(canvas):
+    return canvas.figure.add_subplot()
+
+
+@pytest.fixture(scope="session")
+def tcl():
+    """Інтерпретатор Tcl без Tk: after, after_idle й update працюють без дисплея."""
+    import tkinter
+    return tkinter.Tcl()
+
+
+@pytest.fixture(scope="session")
+def tk_root():
+    """Прихований корінь Tk для тестів віджетів; без дисплея такі тести пропускаються."""
+    import tkinter
+    from fraction_ui.host import set_shared_root
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError as exc:
+        pytest.skip(f"Tk без дисплея: {exc}")
+    root.withdraw()
+    set_shared_root(root)
+    yield root
+    root.destroy()
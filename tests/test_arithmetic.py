@@ -0,0 +1,24 @@
+import math
+
+import pytest
+
+from fraction_core.arithmetic import lcm, prime_factorization, reduce_fraction
+
+
+@pytest.mark.parametrize("n, factors", [
+    (0, []), (1, []), (2, [2]), (12, [2, 2, 3]), (97, [97]), (360, [2, 2, 2, 3, 3, 5]),
+])
+def test_prime_factorization(n, factors):
+    assert prime_factorization(n) == factors
+
+
+@pytest.mark.parametrize("a, b", [(4, 6), (7, 13), (12, 12), (1, 9), (15, 10)])
+def test_lcm(a, b):
+    common = lcm(a, b)
+    assert common % a == 0 and common % b == 0
+    assert common * math.gcd(a, b) == a * b
+
+
+@pytest.mark.parametrize("n, d, reduced", [(6, 8, (3, 4)), (5, 7, (5, 7)), (0, 5, (0, 1)), (12, 4, (3, 1))])
+def test_reduce_fraction(n, d, reduced):
+    assert reduce_fraction(n, d) == reduced
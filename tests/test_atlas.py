@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from fraction_ui import atlas
+from fraction_ui.atlas import AtlasPie, PieAtlas, make_pie
+from fraction_ui.pies import PieArtist
+
+
+@pytest.fixture
+def small_atlas():
+    return PieAtlas(size_px=32, max_sprites=2)
+
+
+def test_sprite_cache_hits(small_atlas):
+    sprite = small_atlas.sprite((3,), ('red',), 8)
+    assert sprite.shape == (32, 32, 4) and not sprite.flags.writeable
+    assert small_atlas.sprite((3,), ('red',), 8) is sprite
+    assert (small_atlas.hits, small_atlas.misses) == (1, 1)
+
+
+def test_least_recently_used_sprite_is_evicted(small_atlas):
+    small_atlas.sprite((1,), ('red',), 4)
+    small_atlas.sprite((2,), ('red',), 4)
+    small_atlas.sprite((1,), ('red',), 4)
+    small_atlas.sprite((3,), ('red',), 4)
+    assert small_atlas.misses == 3
+    small_atlas.sprite((1,), ('red',), 4)
+    assert small_atlas.misses == 3
+    small_atlas.sprite((2,), ('red',), 4)
+    assert small_atlas.misses == 4
+
+
+def test_sprites_persist_on_disk(tmp_path):
+    first = PieAtlas(size_px=32, cache_dir=tmp_path).sprite((3,), ('red',), 8)
+    second_atlas = PieAtlas(size_px=32, cache_dir=tmp_path)
+    second = second_atlas.sprite((3,), ('red',), 8)
+    assert second_atlas.disk_hits == 1
+    np.testing.assert_array_equal(first, second)
+    # Інший стиль не бере чужих спрайтів
+    assert PieAtlas(size_px=32, empty_color='white', cache_dir=tmp_path).sprite((3,), ('red',), 8) is not None
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_sprites_differ_by_fraction(small_atlas):
+    assert not np.array_equal(small_atlas.sprite((1,), ('red',), 4), small_atlas.sprite((3,), ('red',), 4))
+
+
+def test_atlas_pie_switches_between_image_and_vector(ax, small_atlas):
+    pie = AtlasPie(ax, small_atlas)
+    pie.update([3], ['red'], 8)
+    assert pie.image.get_visible()
+    assert not any(wedge.get_visible() for wedge in pie.vector.wedges)
+
+    pie.update([3], ['red'], 50)  # поза атласом
+    assert not pie.image.get_visible()
+    assert any(wedge.get_visible() for wedge in pie.vector.wedges)
+
+    pie.set_visible(False)
+    assert not pie.image.get_visible()
+    assert not any(wedge.get_visible() for wedge in pie.vector.wedges)
+
+
+def test_atlas_pie_image_follows_geometry(ax, small_atlas):
+    pie = AtlasPie(ax, small_atlas)
+    pie.update([1], ['red'], 2)
+    pie.set_geometry((2, 1), 0.5)
+    half = 0.5 * (1 + PieAtlas.MARGIN)
+    assert pie.image.get_extent() == pytest.approx([2 - half, 2 + half, 1 - half, 1 + half])
+
+
+def test_make_pie_uses_atlas_only_when_enabled(ax, monkeypatch):
+    monkeypatch.delenv("FRACTIONS_ATLAS", raising=False)
+    assert type(make_pie(ax)) is PieArtist
+    monkeypatch.setenv("FRACTIONS_ATLAS", "1")
+    monkeypatch.delenv("FRACTIONS_ATLAS_DIR", raising=False)
+    monkeypatch.setattr(atlas, "_ATLASES", {})
+    first, second = make_pie(ax), make_pie(ax)
+    assert isinstance(first, AtlasPie) and first.atlas is second.atlas
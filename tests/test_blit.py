@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from fraction_ui.blit import BlitManager, place_title
+from fraction_ui.pies import PieArtist, prepare_pie_axes
+
+
+@pytest.fixture
+def pies(canvas):
+    figure = canvas.figure
+    axes = figure.subplots(1, 3)
+    pies = []
+    for ax in axes:
+        prepare_pie_axes(ax)
+        ax.set_title("", pad=25, fontsize=26)
+        pies.append(PieArtist(ax, divider_limit=40))
+        pies[-1].update([1], ['red'], 4)
+    return axes, pies
+
+
+def pixels(canvas):
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def test_disabled_blit_draws_whole_figure(canvas, pies):
+    blitter = BlitManager(canvas, enabled=False)
+    assert not blitter.update()
+    assert (blitter.full_draws, blitter.blits) == (1, 0)
+
+
+def test_blit_after_first_full_draw(canvas, pies):
+    axes, artists = pies
+    blitter = BlitManager(canvas, enabled=True)
+    for ax in axes:
+        blitter.register(ax)
+    assert not blitter.update()
+    assert blitter.full_draws == 1
+
+    artists[1].update([3], ['red'], 4)
+    assert blitter.update()
+    assert (blitter.full_draws, blitter.blits) == (1, 1)
+    # Без змін показувати нічого
+    assert blitter.update() and blitter.blits == 1
+
+
+def test_blit_matches_full_draw(canvas, pies):
+    axes, artists = pies
+    blitter = BlitManager(canvas, enabled=True)
+    for ax in axes:
+        blitter.register(ax)
+    blitter.update()
+
+    artists[0].update([5], ['blue'], 8)
+    axes[0].title.set_text("Перший дріб\n$\\frac{5}{8}$")
+    assert blitter.update()
+    blitted, position = pixels(canvas), axes[0].title.get_position()
+
+    canvas.draw()
+    assert axes[0].title.get_position() == pytest.approx(position)
+    assert np.abs(pixels(canvas).astype(int) - blitted).max() <= 1
+
+
+@pytest.mark.parametrize("ticks_on_top", [False, True])
+def test_place_title_matches_axes_draw(canvas, ticks_on_top):
+    ax = canvas.figure.add_subplot()
+    prepare_pie_axes(ax)
+    if ticks_on_top:
+        ax.xaxis.set_ticks_position('top')
+        ax.set_xticks([-1, 0, 1])
+    for text in ("Дріб", "Дріб\n$\\frac{17}{20}$"):
+        ax.set_title(text, pad=0, fontsize=26)
+        canvas.draw()
+        expected = ax.title.get_position()
+        assert expected[1] > 1
+        ax.title.set_position((0.5, 0.3))
+        place_title(ax, canvas.get_renderer())
+        assert ax.title.get_position() == pytest.approx(expected)
@@ -0,0 +1,70 @@
+from fraction_core import checking
+from fraction_core.task_index import IMPROPER_TO_MIXED, MIXED_TO_IMPROPER
+
+
+def test_converted_addends():
+    task = (1, 4, 1, 6)
+    assert checking.check_converted_addends(task, 3, 12, 2, 12) == (True, "✔ ВІДМІННО! Результат нескоротний.")
+    assert checking.check_converted_addends(task, 6, 24, 4, 24) == (True, "✔ Правильно! Результат можна скоротити.")
+    assert checking.check_converted_addends(task, 3, 12, 3, 12) == (False, "")
+    assert checking.check_converted_addends(task, 1, 4, 1, 6) == (False, "")
+    assert checking.check_converted_addends(task, 0, 0, 0, 0) == (False, "")
+
+
+def test_common_denominator_result():
+    task = (1, 2, 1, 3)
+    assert checking.check_common_denominator_result(task, 3, 6, 2, 6)[0]
+    assert checking.check_common_denominator_result(task, 6, 12, 4, 12)[1].startswith("✔ Правильно!")
+    assert not checking.check_common_denominator_result(task, 3, 6, 1, 6)[0]
+    assert checking.check_common_denominator_result(task, 3, 6, 2, 6, subtract=True) == (
+        True, "✔ ВІДМІННО! Правильна відповідь.")
+    assert not checking.check_common_denominator_result(task, 3, 6, 2, 6 + 1, subtract=True)[0]
+
+
+def test_mixed_result():
+    assert checking.mixed_result(7, 4, 5, 6) == (31, 12)
+    assert checking.mixed_result(7, 4, 5, 6, subtract=True) == (11, 12)
+    assert checking.mixed_result(3, 2, 1, 2) == (2, 1)
+
+
+def test_mixed_addition():
+    task = (7, 4, 5, 6)  # 1 3/4 + 5/6 = 2 7/12
+    correct = checking.mixed_result(*task)
+    assert checking.check_mixed_addition(task, correct, 1, 9, 12, 0, 10, 12)[0]
+    assert checking.check_mixed_addition(task, correct, 2, 7, 12, 0, 0, 12)[0]
+    assert checking.check_mixed_addition(task, correct, 1, 3, 4, 0, 5, 6) == (
+        False, "Зведіть до спільного знаменника!")
+    assert checking.check_mixed_addition(task, correct, 1, 9, 0, 0, 10, 12) == (
+        False, "Знаменник не може бути нулем!")
+    assert checking.check_mixed_addition(task, correct, 1, 8, 12, 0, 10, 12) == (
+        False, "Неправильна сума чисельників!")
+
+
+def test_mixed_subtraction():
+    correct = checking.mixed_result(9, 4, 5, 6, subtract=True)  # 2 1/4 - 5/6 = 1 5/12
+    assert checking.check_mixed_subtraction(correct, 1, 15, 12, 0, 10, 12)[0]
+    assert checking.check_mixed_subtraction(correct, 2, 3, 12, 0, 10, 12) == (
+        False, "Дріб менший. 'Позичте' одиницю від цілої частини!")
+    assert checking.check_mixed_subtraction(correct, 0, 3, 12, 1, 10, 12) == (
+        False, "Ціла частина зменшуваного менша!")
+    assert checking.check_mixed_subtraction(correct, 1, 14, 12, 0, 10, 12) == (
+        False, "Рішення невірне. Перевірте обчислення!")
+
+
+def test_reduction():
+    assert checking.check_reduction(3, 4, 3, 4) == (True, checking.CORRECT)
+    assert checking.check_reduction(3, 4, 6, 8) == (False, "")
+
+
+def test_conversion():
+    to_improper = (MIXED_TO_IMPROPER, 2, 1, 3, 7)
+    assert checking.check_conversion(to_improper, 0, 7, 3) == (True, checking.CORRECT)
+    assert checking.check_conversion(to_improper, 0, 14, 6)[0]
+    assert not checking.check_conversion(to_improper, 2, 1, 3)[0]
+    assert not checking.check_conversion(to_improper, 0, 7, 0)[0]
+
+    to_mixed = (IMPROPER_TO_MIXED, 2, 1, 3, 7)
+    assert checking.check_conversion(to_mixed, 2, 1, 3) == (True, checking.CORRECT)
+    assert checking.check_conversion(to_mixed, 2, 2, 6)[0]
+    assert not checking.check_conversion(to_mixed, 1, 4, 3)[0]
+    assert not checking.check_conversion(to_mixed, 0, 7, 3)[0]
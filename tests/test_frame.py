@@ -0,0 +1,55 @@
+import pytest
+
+from fraction_ui.blit import BlitManager
+from fraction_ui.frame import OUTSIDE_FRAME, FrameManager
+
+
+class Layout:
+    def __init__(self):
+        self.applies = 0
+
+    def apply(self):
+        self.applies += 1
+
+
+@pytest.fixture
+def frames(canvas):
+    canvas.figure.add_subplot()
+    return FrameManager(BlitManager(canvas, enabled=False), Layout(), stats=False)
+
+
+def test_nested_presents_draw_once(frames):
+    with frames.frame("повзунок"):
+        frames.present()
+        with frames.frame():
+            frames.present()
+            frames.present()
+        assert frames.blitter.full_draws == 0
+    assert frames.blitter.full_draws == 1 and frames.layout.applies == 1
+    assert frames.per_event["повзунок"] == {1: 1} and not frames.overdrawn
+
+
+def test_present_outside_frame_is_its_own_frame(frames):
+    frames.present("перевірка")
+    frames.present("перевірка")
+    assert frames.blitter.full_draws == 2 and frames.frames == 2
+    assert frames.per_event["перевірка"] == {1: 2}
+
+
+def test_frame_without_changes_does_not_draw(frames):
+    with frames.frame("подія"):
+        pass
+    assert frames.blitter.full_draws == 0 and frames.per_event["подія"] == {0: 1}
+
+
+def test_extra_draw_inside_frame_is_reported(frames):
+    with frames.frame("подія"):
+        frames.blitter.canvas.draw()
+        frames.present()
+    assert frames.overdrawn["подія"] == 1 and frames.per_event["подія"] == {2: 1}
+    assert "з кількома показами: 1" in frames.summary()
+
+
+def test_backend_redraw_counts_outside_frames(frames):
+    frames.blitter.canvas.draw()
+    assert frames.per_event[OUTSIDE_FRAME][1] == 1 and frames.frames == 0
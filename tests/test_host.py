@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+from fraction_ui.host import TrainerWindow
+from fraction_ui.scheduler import RenderScheduler
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+
+
+class Trainer(TrainerWindow):
+    def __init__(self, master):
+        super().__init__(master)
+        self.render = Counter()
+        self.render_scheduler = RenderScheduler(self, self.render)
+
+    def _on_slider_change(self, *args):
+        self.render_scheduler.request()
+
+
+class Overlay:
+    stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_destroy_cancels_pending_render(tk_root, monkeypatch):
+    monkeypatch.setenv("FRACTIONS_PROFILE_OVERLAY", "1")
+    window = Trainer(tk_root)
+    tk_root.update()
+    window._on_slider_change()
+    overlay = window.fps_overlay
+    window.destroy()
+    tk_root.update()
+    assert window.render.calls == 0
+    assert overlay is not None and overlay._pending is None
+
+
+def test_child_destroy_keeps_scheduler(tk_root):
+    import tkinter
+    window = Trainer(tk_root)
+    tkinter.Label(window).destroy()
+    window._on_slider_change()
+    tk_root.update()
+    assert window.render.calls == 1
+    window.destroy()
+
+
+def test_on_destroy_without_display(tcl):
+    """Те саме без дисплея: сам обробник <Destroy> на вікні, якого Tk не створював."""
+    window = TrainerWindow.__new__(TrainerWindow)
+    render = Counter()
+    window.render_scheduler = RenderScheduler(tcl, render)
+    window.fps_overlay, window._overlay_pending = Overlay(), None
+    window.render_scheduler.request()
+    window._on_destroy(SimpleNamespace(widget=SimpleNamespace()))
+    assert not window.fps_overlay.stopped
+    window._on_destroy(SimpleNamespace(widget=window))
+    tcl.update()
+    assert render.calls == 0 and window.fps_overlay.stopped
@@ -0,0 +1,71 @@
+import pytest
+
+from fraction_ui.layout import LayoutCache, reset_subplot_layout
+
+
+@pytest.fixture
+def figure(canvas):
+    figure = canvas.figure
+    for i in range(3):
+        figure.add_subplot(1, 3, i + 1).set_title("", pad=25, fontsize=26)
+    return figure
+
+
+def set_titles(figure, *titles):
+    for ax, title in zip(figure.axes, titles):
+        ax.set_title(title, pad=25, fontsize=26)
+
+
+def subplotpars(figure):
+    pars = figure.subplotpars
+    return (pars.left, pars.bottom, pars.right, pars.top, pars.wspace, pars.hspace)
+
+
+def test_same_title_lengths_reuse_tight_layout(figure):
+    cache = LayoutCache(figure, pad=2.0)
+    set_titles(figure, "Дріб\n$\\frac{3}{8}$", "Дріб\n$\\frac{1}{8}$")
+    assert cache.apply()
+    expected = subplotpars(figure)
+    set_titles(figure, "Дріб\n$\\frac{5}{8}$", "Дріб\n$\\frac{7}{8}$")
+    assert not cache.apply()
+    assert subplotpars(figure) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_longer_title_runs_tight_layout(figure):
+    cache = LayoutCache(figure, pad=2.0)
+    cache.apply()
+    set_titles(figure, "Сума\n$\\frac{3}{8} + \\frac{1}{8} = \\frac{4}{8}$")
+    assert cache.apply()
+    reset_subplot_layout(figure)
+    figure.tight_layout(pad=2.0)
+    tight = subplotpars(figure)
+    cache.apply()
+    assert subplotpars(figure) == pytest.approx(tight)
+
+
+@pytest.mark.parametrize("loc", ["left", "right"])
+def test_side_titles_are_part_of_key(figure, loc):
+    cache = LayoutCache(figure, pad=2.0)
+    cache.apply()
+    figure.axes[0].set_title("Завдання", loc=loc)
+    assert cache.apply()
+
+
+def test_least_recently_used_layout_is_evicted(figure):
+    cache = LayoutCache(figure, maxsize=2, pad=2.0)
+    for title in ("a", "bb", "a", "ccc"):
+        set_titles(figure, title)
+        cache.apply()
+    assert (cache.hits, cache.misses) == (1, 3)
+    set_titles(figure, "a")
+    assert not cache.apply()
+    set_titles(figure, "bb")
+    assert cache.apply()
+
+
+def test_invalidate_forgets_layouts(figure):
+    cache = LayoutCache(figure, pad=2.0)
+    cache.apply()
+    cache.invalidate()
+    assert cache.apply()
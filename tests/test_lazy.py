@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from fraction_ui.lazy import import_plotting, load_in_background
+from launcher import TRAINERS
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def wait(tcl, thread, outcome, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not outcome and time.monotonic() < deadline:
+        tcl.update()
+        time.sleep(0.005)
+    thread.join()
+
+
+def test_plotting_namespace():
+    plot = import_plotting()
+    for name in ("Figure", "FigureCanvasTkAgg", "gridspec", "make_pie", "BlitManager", "FrameManager",
+                 "LayoutCache", "title_cache", "PiePool", "prepare_pie_axes", "set_artists_visible"):
+        assert hasattr(plot, name), name
+
+
+@pytest.mark.parametrize("index", range(len(TRAINERS)))
+def test_trainer_import_does_not_load_plotting(index):
+    code = ("import sys; from launcher import trainer_class; trainer_class(%d); "
+            "print(sorted(m for m in ('matplotlib', 'numpy') if m in sys.modules))" % index)
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_load_in_background_reports_result(tcl):
+    outcome = []
+    thread = load_in_background(tcl, lambda: 42, outcome.append, lambda exc: outcome.append(exc), poll_ms=1)
+    wait(tcl, thread, outcome)
+    assert outcome == [42]
+
+
+def test_load_in_background_reports_error(tcl):
+    outcome = []
+
+    def fail():
+        raise ImportError("немає matplotlib")
+
+    thread = load_in_background(tcl, fail, outcome.append, outcome.append, poll_ms=1)
+    wait(tcl, thread, outcome)
+    assert len(outcome) == 1 and isinstance(outcome[0], ImportError)
@@ -0,0 +1,28 @@
+from fraction_ui.mathtext import TitleCache
+
+TITLE = "Перший дріб\n$\\frac{3}{8}$"
+
+
+def test_unchanged_title_is_left_alone(ax):
+    cache = TitleCache()
+    assert cache.set(ax.title, TITLE)
+    ax.title.stale = False
+    assert not cache.set(ax.title, TITLE)
+    assert not ax.title.stale
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_fraction_updates_title(ax):
+    cache = TitleCache()
+    cache.set(ax.title, TITLE)
+    assert cache.set(ax.title, "Перший дріб\n$\\frac{5}{8}$")
+    assert ax.title.get_text() == "Перший дріб\n$\\frac{5}{8}$"
+
+
+def test_title_set_elsewhere_is_not_trusted(ax):
+    cache = TitleCache()
+    cache.set(ax.title, TITLE)
+    ax.set_title("")
+    assert cache.set(ax.title, TITLE)
+    assert ax.title.get_text() == TITLE
+
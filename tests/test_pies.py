@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from fraction_ui.pies import PieArtist, PiePool, divider_segments, pie_sizes, wedge_angles, wedge_paths
+
+
+def visible(artists):
+    return [artist for artist in artists if artist.get_visible()]
+
+
+def test_pie_sizes_match_draw_fraction_pie():
+    assert pie_sizes([3], ['red'], 8, 'grey') == ([3, 5], ['red', 'grey'])
+    assert pie_sizes([2, 3], ['red', 'blue'], 5, 'grey') == ([2, 3], ['red', 'blue'])
+    # Як і в draw_fraction_pie: кольори беруться за порядком, без пропуску нульових чисельників
+    assert pie_sizes([0, 2], ['red', 'blue'], 4, 'grey') == ([2, 2], ['red', 'grey'])
+    assert pie_sizes([0], ['red'], 0, 'grey') == ([1], ['grey'])
+
+
+def test_wedge_angles_start_at_top_clockwise():
+    (first_start, first_end), (second_start, second_end) = wedge_angles([1, 3])
+    assert (first_start, first_end) == (0.0, 90.0)
+    assert second_end == first_start and second_start == -270.0
+
+
+def test_update_reuses_wedges(ax):
+    pie = PieArtist(ax)
+    wedges = list(pie.wedges)
+    patches = len(ax.patches)
+
+    assert pie.update([3], ['red'], 8)
+    first_path = wedges[0].get_path()
+    assert pie.update([5], ['red'], 8)
+    assert pie.wedges == wedges and len(ax.patches) == patches
+    assert wedges[0].get_path() is not first_path
+    assert len(visible(pie.wedges)) == 2
+
+
+def test_update_without_change_is_noop(ax):
+    pie = PieArtist(ax)
+    pie.update([3], ['red'], 8)
+    assert not pie.update([3], ['red'], 8)
+    assert pie.update([3], ['blue'], 8)
+
+
+def test_wedge_matches_ax_pie(canvas):
+    reference_ax, ax = canvas.figure.subplots(1, 2)
+    reference, _ = reference_ax.pie([3, 5], startangle=90, counterclock=False)
+    pie = PieArtist(ax)
+    pie.update([3], ['red'], 8)
+    for expected, wedge in zip(reference, pie.wedges):
+        np.testing.assert_allclose(wedge.get_path().vertices, expected.get_path().vertices)
+
+
+def test_pool_hides_unused_pies(ax):
+    pool = PiePool(ax)
+    pool.show([([1], ['red'], 2, (i, 0), 1.0) for i in range(3)])
+    pies = list(pool.pies)
+    pool.show([([1], ['red'], 2, (0, 0), 1.0)])
+    assert pool.pies == pies
+    assert len(visible(pies[0].wedges)) == 2
+    assert not visible(pies[1].wedges) and not visible(pies[2].wedges)
+
+    pool.show([([1], ['red'], 2, (i, 0), 1.0) for i in range(3)])
+    assert pool.pies == pies and all(len(visible(pie.wedges)) == 2 for pie in pies)
+
+
+def test_dividers_are_one_line_collection(ax):
+    pie = PieArtist(ax, divider_limit=40)
+    pie.update([3], ['red'], 8)
+    assert len(ax.collections) == 1 and not ax.lines
+    assert len(pie.dividers.get_segments()) == 8
+
+    pie.update([3], ['red'], 12)
+    assert list(ax.collections) == [pie.dividers]
+    assert len(pie.dividers.get_segments()) == 12
+
+
+def test_dividers_hidden_above_limit(ax):
+    pie = PieArtist(ax, divider_limit=40)
+    pie.update([3], ['red'], 8)
+    pie.update([3], ['red'], 41)
+    assert not pie.dividers.get_visible()
+    pie.update([3], ['red'], 40)
+    assert pie.dividers.get_visible()
+
+
+def test_divider_segments_start_at_top_clockwise():
+    segments = divider_segments(4)
+    np.testing.assert_allclose(segments[:, 0], 0)
+    np.testing.assert_allclose(segments[:, 1], [[0, 1], [1, 0], [0, -1], [-1, 0]], atol=1e-12)
+    assert not segments.flags.writeable
+
+
+def test_dividers_follow_geometry(ax):
+    pie = PieArtist(ax, divider_limit=40)
+    pie.update([1], ['red'], 4)
+    pie.set_geometry((2, 0), 0.5)
+    np.testing.assert_allclose(pie.dividers.get_segments()[0], [[2, 0], [2, 0.5]], atol=1e-12)
+
+
+def test_wedge_paths_cache_hits():
+    wedge_paths.cache_clear()
+    paths = wedge_paths((3,), 8, 1.0)
+    assert wedge_paths((3,), 8, 1.0) is paths
+    assert wedge_paths.cache_info().hits == 1
+    assert all(path.readonly for path in paths)
+    assert wedge_paths((3,), 8, 2.0) is not paths
+
+
+def test_pies_share_cached_paths(canvas):
+    wedge_paths.cache_clear()
+    first, second = (PieArtist(ax) for ax in canvas.figure.subplots(1, 2))
+    first.update([3], ['red'], 8)
+    second.update([3], ['blue'], 8)
+    assert wedge_paths.cache_info().misses == 1
+    assert first.wedges[0].get_path() is second.wedges[0].get_path()
+
+
+def test_failed_update_is_not_remembered(ax):
+    pie = PieArtist(ax, max_wedges=2)
+    pie.update([1], ['red'], 4)
+    with pytest.raises(ValueError):
+        pie.update([1, 1], ['red', 'blue'], 4)
+    # Той самий виклик не вважається вже намальованим
+    with pytest.raises(ValueError):
+        pie.update([1, 1], ['red', 'blue'], 4)
+    assert not pie.update([1], ['red'], 4)
+    assert pie.update([2], ['red'], 4)
@@ -0,0 +1,46 @@
+from fraction_core.arithmetic import prime_factorization
+from fraction_core.primes import FactorSieve, factorize_array
+
+
+def test_sieve_matches_trial_division():
+    sieve = FactorSieve(limit=500)
+    for n in range(0, 501):
+        factors, rest, d = [], n, 2
+        while d * d <= rest:
+            while rest % d == 0:
+                factors.append(d)
+                rest //= d
+            d += 1
+        if rest > 1:
+            factors.append(rest)
+        assert sieve.factorize(n) == factors
+
+
+def test_sieve_grows_beyond_limit():
+    sieve = FactorSieve(limit=16)
+    assert sieve.factorize(2 * 3 * 5 * 7 * 11) == [2, 3, 5, 7, 11]
+    assert sieve.limit >= 2310
+
+
+def test_sieve_grows_at_least_twofold():
+    sieve = FactorSieve(limit=100)
+    sieve.ensure(101)
+    assert sieve.limit == 200
+    sieve.ensure(50)
+    assert sieve.limit == 200
+
+
+def test_factorize_array_matches_prime_factorization():
+    values = list(range(2, 300))
+    rows = factorize_array(values)
+    for value, row in zip(values, rows.tolist()):
+        assert [p for p in row if p] == prime_factorization(value)
+
+
+def test_factorize_array_pads_with_zeros():
+    rows = FactorSieve(limit=16).factorize_array([1, 8, 97])
+    assert rows.tolist() == [[0, 0, 0], [2, 2, 2], [97, 0, 0]]
+
+
+def test_factorize_array_of_ones():
+    assert FactorSieve().factorize_array([0, 1]).shape == (2, 0)
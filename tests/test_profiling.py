@@ -0,0 +1,88 @@
+import json
+import time
+
+import pytest
+
+from fraction_ui import profiling
+from fraction_ui.profiling import FrameProfiler, percentile
+
+
+@pytest.fixture(autouse=True)
+def own_profilers(monkeypatch):
+    """Профайлери тестів не потрапляють у підсумок процесу під час виходу."""
+    monkeypatch.setattr(profiling, "_profilers", [])
+
+
+@pytest.mark.parametrize("q, expected", [(0, 1), (50, 50), (95, 95), (99, 99), (100, 100)])
+def test_percentile_nearest_rank(q, expected):
+    assert percentile(list(range(1, 101)), q) == expected
+
+
+def test_percentile_of_few_values():
+    assert percentile([], 95) is None
+    assert percentile([7.0], 50) == 7.0
+    assert percentile([1, 2, 3, 4], 50) == 2
+
+
+def test_stats():
+    profiler = FrameProfiler("test", enabled=True)
+    for ms in range(1, 101):
+        profiler.add("layout", ms / 1000)
+    stats = profiler.stats()
+    assert list(stats) == ["layout"]
+    assert stats["layout"]["count"] == 100
+    assert stats["layout"]["p50"] == pytest.approx(50) and stats["layout"]["p95"] == pytest.approx(95)
+    assert stats["layout"]["mean"] == pytest.approx(50.5) and stats["layout"]["max"] == pytest.approx(100)
+    assert "компонування" in profiler.summary()
+
+
+def test_window_keeps_recent_samples_and_total_count():
+    profiler = FrameProfiler("test", enabled=True)
+    for _ in range(profiling.WINDOW + 10):
+        profiler.add("event", 0.001)
+    assert len(profiler.samples["event"]) == profiling.WINDOW
+    assert profiler.stats()["event"]["count"] == profiling.WINDOW + 10
+
+
+def test_frame_phases_add_up():
+    profiler = FrameProfiler("test", enabled=True)
+    requested_at = time.perf_counter()
+    profiler.begin_frame(requested_at)
+    with profiler.phase("layout"):
+        time.sleep(0.002)
+    with profiler.phase("raster"):
+        time.sleep(0.002)
+    profiler.end_frame()
+    (queue,), (layout,), (raster,), (logic,), (frame,) = (
+        profiler.samples[phase] for phase in ("queue", "layout", "raster", "logic", "frame"))
+    assert layout >= 2 and raster >= 2
+    assert frame == pytest.approx(queue + layout + raster + logic, abs=0.01)
+    assert profiler.fps() == 1
+
+
+def test_timed_records_event():
+    profiler = FrameProfiler("test", enabled=True)
+    handler = profiler.timed("event", lambda value: value * 2)
+    assert handler(21) == 42
+    assert profiler.counts["event"] == 1
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler("test", enabled=False)
+    profiler.begin_frame(time.perf_counter())
+    with profiler.phase("layout"):
+        pass
+    profiler.end_frame()
+    assert profiler.stats() == {} and not profiling._profilers
+
+
+def test_report_writes_json(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "profile.json"
+    monkeypatch.setenv("FRACTIONS_PROFILE", str(path))
+    profiler = FrameProfiler("main.py")
+    assert profiler.enabled
+    profiler.add("frame", 0.016)
+    profiling._report()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["units"] == "ms" and data["trainers"]["main.py"]["frame"]["p95"] == pytest.approx(16)
+    assert "main.py" in capsys.readouterr().err
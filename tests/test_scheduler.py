@@ -0,0 +1,57 @@
+import time
+
+from fraction_ui.scheduler import RenderScheduler
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+
+
+def test_burst_of_requests_renders_once(tcl):
+    render = Counter()
+    scheduler = RenderScheduler(tcl, render)
+    for _ in range(50):
+        scheduler.request()
+    assert render.calls == 0
+    tcl.update()
+    assert render.calls == 1
+    assert (scheduler.requests, scheduler.renders) == (50, 1)
+
+
+def test_requests_right_after_render_wait_for_interval(tcl):
+    render = Counter()
+    scheduler = RenderScheduler(tcl, render, interval_ms=50)
+    scheduler.request()
+    tcl.update()
+    scheduler.request()
+    scheduler.request()
+    tcl.update()
+    assert render.calls == 1
+    time.sleep(0.06)
+    tcl.update()
+    assert render.calls == 2
+
+
+def test_flush_renders_pending_changes_now(tcl):
+    render = Counter()
+    scheduler = RenderScheduler(tcl, render)
+    scheduler.flush()
+    assert render.calls == 0
+    scheduler.request()
+    scheduler.flush()
+    assert render.calls == 1
+    tcl.update()
+    assert render.calls == 1
+
+
+def test_cancel_drops_pending_render(tcl):
+    render = Counter()
+    scheduler = RenderScheduler(tcl, render)
+    scheduler.request()
+    scheduler.cancel()
+    tcl.update()
+    assert render.calls == 0
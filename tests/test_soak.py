@@ -0,0 +1,58 @@
+import importlib.util
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+SOAK_PATH = Path(__file__).resolve().parent.parent / "benchmarks" / "soak.py"
+
+
+@pytest.fixture(scope="module")
+def soak():
+    spec = importlib.util.spec_from_file_location("soak", SOAK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def record(event, rss, objects, traced):
+    return {"event": event, "rss_mb": rss, "objects": objects, "traced_mb": traced}
+
+
+def test_growth_is_measured_after_warmup(soak):
+    samples = [record(1000, 300.0, 90_000, 10.0), record(2000, 120.0, 50_000, 4.0),
+               record(3000, 121.0, 50_100, 4.1), record(4000, 122.5, 50_300, 4.5)]
+    assert soak.growth(samples, warmup=2000) == pytest.approx({"rss_mb": 2.5, "objects": 300, "traced_mb": 0.5})
+
+
+def test_growth_needs_two_samples_after_warmup(soak):
+    assert soak.growth([record(1000, 1, 1, 1), record(2000, 2, 2, 2)], warmup=2000) is None
+
+
+def test_sample_and_top_allocators(soak):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        kept = [bytearray(64 * 1024) for _ in range(4)]
+        entry = soak.sample(5)
+        top = soak.top_allocators(before, tracemalloc.take_snapshot())
+    finally:
+        tracemalloc.stop()
+    assert set(entry) == {"event", "rss_mb", "objects", "traced_mb"} and entry["event"] == 5
+    assert kept and "test_soak.py" in top[0]["where"] and top[0]["size_kb"] >= 256
+    assert len(top) <= soak.TOP_ALLOCATORS
+
+
+def test_existing_display_is_used(soak, monkeypatch):
+    monkeypatch.setattr(soak.sys, "platform", "linux")
+    monkeypatch.setenv("DISPLAY", ":0")
+    assert soak.start_display() is None
+
+
+def test_no_display_and_no_xvfb_exits_with_2(soak, monkeypatch):
+    monkeypatch.setattr(soak.sys, "platform", "linux")
+    monkeypatch.delenv("DISPLAY", raising=False)
+    monkeypatch.setattr(soak.shutil, "which", lambda name: None)
+    with pytest.raises(SystemExit) as exit_info:
+        soak.start_display()
+    assert exit_info.value.code == 2
@@ -0,0 +1,81 @@
+import pytest
+
+from fraction_ui import solution_layout
+from fraction_ui.solution_layout import (Box, Gap, Line, Run, Stacked, Text, TextMetrics, fraction_items,
+                                         layout_items, layout_step, to_png, to_svg)
+
+
+class Font:
+    """Моноширинний шрифт без Tk: 10 px на символ, розмір у пікселях."""
+
+    def __init__(self, name, weight="normal"):
+        self.name, self.weight = name, weight
+
+    def __str__(self):
+        return self.name
+
+    def measure(self, text):
+        return 10 * len(text)
+
+    def metrics(self, name):
+        return {"linespace": 20, "ascent": 15}[name]
+
+    def actual(self):
+        return {"family": "DejaVu Sans", "size": -16, "weight": self.weight}
+
+
+BODY, TITLE = Font("body"), Font("title", "bold")
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch):
+    monkeypatch.setattr(solution_layout, "metrics", TextMetrics())
+
+
+def test_text_metrics_lru():
+    metrics = TextMetrics(maxsize=2)
+    for text in ("1/2", "3/4", "1/2", "5/6"):
+        metrics.width(BODY, text)
+    assert (metrics.hits, metrics.misses) == (1, 3)
+    assert list(metrics.widths) == [("body", "1/2"), ("body", "5/6")]
+
+
+def test_wrap_by_words():
+    assert TextMetrics().wrap(BODY, "ділимо на спільний множник", 120) == ["ділимо на", "спільний", "множник"]
+
+
+@pytest.mark.parametrize("token, items", [
+    ("3/4", [Stacked("3", "4", BODY)]),
+    (" (3/4) ", [Stacked("3", "4", BODY)]),
+    ("2 1/3", [Run("2", TITLE), Gap(5), Stacked("1", "3", BODY)]),
+    ("= 5", [Run("= 5", BODY)]),
+])
+def test_fraction_items(token, items):
+    assert fraction_items(token, BODY, TITLE) == items
+
+
+def test_stacked_fraction_is_as_wide_as_longer_part():
+    primitives = []
+    end = layout_items([Run("x", BODY), Stacked("12", "345", BODY)], 0, 0, primitives)
+    assert end == 10 + 30 + 10
+    assert primitives == [Text(0, 30, "x", BODY, "w"), Text(30, 15, "12", BODY, "center"),
+                          Line(12, 30, 48, 30, 3), Text(30, 45, "345", BODY, "center")]
+
+
+def test_step_frame_encloses_its_content():
+    height, primitives = layout_step("Крок 1", ["ділимо на спільний множник", "6/8 -> 3/4"], 200, TITLE, BODY,
+                                     lambda parts: [Stacked("6", "8", BODY), Run("->", BODY)])
+    box = primitives[0]
+    assert box == Box(0, 0, 200, height)
+    assert all(0 < p.y < height for p in primitives[1:] if isinstance(p, Text))
+    assert sum(isinstance(p, Line) for p in primitives) == 1
+
+
+def test_export(tmp_path):
+    steps = [(10, 10, layout_step("Крок <1>", ["3/4 -> 6/8"], 300, TITLE, BODY,
+                                  lambda parts: [fraction_items(p, BODY)[0] for p in parts])[1])]
+    to_svg(steps, 320, 200, tmp_path / "s.svg")
+    svg = (tmp_path / "s.svg").read_text(encoding="utf-8")
+    assert svg.startswith("<svg") and "Крок &lt;1&gt;" in svg and 'font-weight="bold"' in svg
+    to_png(steps, 320, 200, tmp_path / "s.png")
+    assert (tmp_path / "s.png").read_bytes().startswith(b"\x89PNG")
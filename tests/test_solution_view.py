@@ -0,0 +1,67 @@
+import pytest
+
+from fraction_ui.solution_view import STEP_PADY, VirtualSolutionWindow
+
+STEPS = [("bold" if i % 5 == 0 else "normal",
+          f"Крок {i + 1}\nЗводимо дроби до спільного знаменника.\n{i + 1}/4 + 1/6 -> {3 * (i + 1)}/12 + 2/12")
+         for i in range(200)]
+
+
+class Canvas:
+    """Видима область полотна без Tk: зсув прокрутки й висота."""
+
+    def __init__(self, top, height):
+        self.top, self.height = top, height
+
+    def canvasy(self, y):
+        return self.top + y
+
+    def winfo_height(self):
+        return self.height
+
+
+@pytest.mark.parametrize("top, expected", [(0, (0, 4)), (950, (2, 9)), (10_000, (47, 50))])
+def test_visible_range_with_overscan(top, expected):
+    window = VirtualSolutionWindow.__new__(VirtualSolutionWindow)
+    window.offsets = [STEP_PADY + 200 * i for i in range(50)]
+    window.canvas = Canvas(top, 300)
+    assert window.visible_range() == expected
+
+
+@pytest.fixture
+def solution(tk_root):
+    from fraction_ui.host import shared_font
+    window = VirtualSolutionWindow(tk_root, STEPS, shared_font(14), shared_font(16, "bold"), shared_font(18))
+    window.update()
+    yield window
+    window.destroy()
+
+
+def test_only_visible_steps_are_drawn(solution):
+    assert len(solution.layouts) == len(STEPS)
+    first, last = solution.visible_range()
+    assert solution.built == set(range(first, last))
+    assert len(solution.built) < len(STEPS) // 4
+
+
+def test_scrolling_draws_new_steps_and_drops_old(solution):
+    solution.canvas.yview_moveto(1.0)
+    solution.update()
+    assert len(STEPS) - 1 in solution.built and 0 not in solution.built
+    assert len(solution.built) < len(STEPS) // 4
+
+
+def test_resize_reflows_after_delay(solution):
+    offsets = list(solution.offsets)
+    solution.geometry("500x600")
+    solution.update()
+    # Компонування — не на кожну подію <Configure>, а через REFLOW_DELAY_MS після останньої
+    assert solution._reflow_pending is not None and solution.offsets == offsets
+    solution.reflow()
+    assert solution.step_width < 780 and solution.offsets != offsets
+
+
+def test_export_svg(solution, tmp_path):
+    path = tmp_path / "рішення.svg"
+    solution.export(str(path))
+    assert "Крок 200" in path.read_text(encoding="utf-8")
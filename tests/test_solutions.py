@@ -0,0 +1,68 @@
+import pytest
+
+from fraction_core import solutions
+from fraction_core.task_index import IMPROPER_TO_MIXED, MIXED_TO_IMPROPER
+
+
+def final_answer(steps):
+    style, text = steps[-1]
+    assert style == "bold"
+    return text
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    for build in (solutions.lcm_explanation, solutions.addition_solution, solutions.common_denominator_solution,
+                  solutions.mixed_addition_solution, solutions.mixed_subtraction_solution,
+                  solutions.reduction_solution, solutions.conversion_solution):
+        build.cache_clear()
+
+
+def test_steps_are_style_text_pairs():
+    steps = solutions.addition_solution(1, 4, 1, 6)
+    assert isinstance(steps, tuple)
+    assert all(style in ("bold", "normal") and isinstance(text, str) for style, text in steps)
+
+
+def test_lcm_explanation():
+    detailed = solutions.lcm_explanation(4, 6)
+    assert detailed[0][1].startswith("--- КРОК 1")
+    assert "НСК = (2 * 2) * 3 = 12" in detailed[5][1]
+    short = solutions.lcm_explanation(4, 6, detailed=False)
+    assert short[0][1].startswith("--- КРОК 2")
+    assert short[-1][1] == "   - Для другого дробу: 12 ÷ 6 = 2"
+
+
+def test_addition_solution_reduces_result():
+    assert final_answer(solutions.addition_solution(1, 4, 1, 12)) == "Кінцева відповідь: 1/3"
+    assert "КРОК 4" not in "".join(text for _, text in solutions.addition_solution(1, 4, 1, 6))
+
+
+def test_common_denominator_solution():
+    assert final_answer(solutions.common_denominator_solution(2, 4, 2, 6)) == "Кінцева відповідь: 5/6"
+    assert final_answer(solutions.common_denominator_solution(3, 4, 1, 6, subtract=True)) == "Кінцева відповідь: 7/12"
+
+
+def test_mixed_solutions():
+    assert final_answer(solutions.mixed_addition_solution(7, 4, 5, 6)) == "Кінцева відповідь: 2 7/12"
+    assert final_answer(solutions.mixed_subtraction_solution(9, 4, 5, 6)) == "Кінцева відповідь: 1 5/12"
+
+
+def test_reduction_and_conversion():
+    assert solutions.reduction_solution(6, 8)[-1] == ("normal", "Скорочений дріб: 3/4")
+    assert solutions.conversion_solution((MIXED_TO_IMPROPER, 2, 1, 3, 7))[-1][1].endswith("неправильний дріб: 7/3")
+    assert solutions.conversion_solution((IMPROPER_TO_MIXED, 2, 1, 3, 7))[-1][1].endswith("мішане число: 2 1/3")
+
+
+def test_solutions_are_cached():
+    first = solutions.reduction_solution(6, 8)
+    assert solutions.reduction_solution(6, 8) is first
+    assert solutions.reduction_solution.cache_info().hits == 1
+    assert solutions.reduction_solution.cache_info().maxsize == solutions.SOLUTION_CACHE_SIZE
+
+
+def test_prefetch_fills_cache():
+    solutions.prefetch(solutions.reduction_solution, 10, 15).result()
+    assert solutions.reduction_solution.cache_info().currsize == 1
+    solutions.reduction_solution(10, 15)
+    assert solutions.reduction_solution.cache_info().hits == 1
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from fraction_core.streams import CounterRandom, TaskStream, session_stream, task_key
+from fraction_core.tasks import addition_task, mixed_addition_task
+
+
+def test_counter_random_is_reproducible():
+    a, b = CounterRandom(42), CounterRandom(42)
+    assert [a.random() for _ in range(5)] == [b.random() for _ in range(5)]
+    assert a.getrandbits(130) == b.getrandbits(130)
+    assert CounterRandom(42).random() != CounterRandom(43).random()
+
+
+def test_counter_random_state_round_trip():
+    rng = CounterRandom(7)
+    rng.gauss()
+    state = rng.getstate()
+    expected = [rng.gauss() for _ in range(3)]
+    rng.setstate(state)
+    assert [rng.gauss() for _ in range(3)] == expected
+
+
+def test_counter_random_seed_resets_gauss():
+    rng = CounterRandom(1)
+    rng.gauss()
+    rng.seed(1)
+    assert rng.gauss() == CounterRandom(1).gauss()
+
+
+def test_counter_random_seed_types():
+    assert CounterRandom(None).random() != CounterRandom(None).random()
+    assert CounterRandom(-1).random() == CounterRandom((1 << 64) - 1).random()
+    with pytest.raises(TypeError):
+        CounterRandom("42")
+
+
+def test_task_key_depends_on_seed_and_position():
+    assert task_key(1, 0) != task_key(1, 1)
+    assert task_key(1, 0) != task_key(2, 0)
+
+
+def test_task_stream_random_access():
+    stream = TaskStream(addition_task, 100, seed=5)
+    sequence = [next(stream) for _ in range(10)]
+    assert [stream.task(k) for k in range(10)] == sequence
+    stream.seek(3)
+    assert next(stream) == sequence[3] and stream.position == 4
+    assert TaskStream(addition_task, 100, seed=5, position=7).task(7) == sequence[7]
+    assert [TaskStream(addition_task, 100, seed=6).task(k) for k in range(10)] != sequence
+
+
+def test_task_stream_does_not_touch_global_random():
+    random.seed(0)
+    expected = random.random()
+    random.seed(0)
+    TaskStream(mixed_addition_task, seed=1).task(0)
+    assert random.random() == expected
+
+
+def test_session_stream_environment(monkeypatch, capsys):
+    monkeypatch.setenv("FRACTIONS_SEED_LOG", "1")
+    monkeypatch.setenv("FRACTIONS_SEED", "11")
+    monkeypatch.setenv("FRACTIONS_TASK", "4")
+    stream = session_stream(addition_task, 100)
+    assert (stream.seed, stream.position) == (11, 4)
+    assert next(stream) == TaskStream(addition_task, 100, seed=11).task(4)
+    assert capsys.readouterr().err == ""
+
+
+def test_session_seed_is_logged_only_on_request(monkeypatch, capsys):
+    monkeypatch.delenv("FRACTIONS_SEED", raising=False)
+    monkeypatch.delenv("FRACTIONS_SEED_LOG", raising=False)
+    stream = session_stream(addition_task, 100)
+    assert stream.position == 0
+    assert capsys.readouterr().err == ""
+
+    monkeypatch.setenv("FRACTIONS_SEED_LOG", "1")
+    stream = session_stream(addition_task, 100)
+    assert f"FRACTIONS_SEED={stream.seed}" in capsys.readouterr().err
@@ -0,0 +1,54 @@
+import pytest
+
+from fraction_ui.solution_layout import Gap, Run, Stacked
+from fraction_ui.task_header import TaskHeader, mixed_items
+
+WHOLE, FRAC = "whole-font", "frac-font"
+
+
+@pytest.mark.parametrize("n, d, items", [
+    (7, 3, [Run("2", WHOLE), Gap(5), Stacked("1", "3", FRAC)]),
+    (6, 3, [Run("2", WHOLE), Gap(5)]),
+    (2, 3, [Stacked("2", "3", FRAC)]),
+    (0, 3, [Stacked("0", "3", FRAC)]),
+    (5, 0, []),
+])
+def test_mixed_items(n, d, items):
+    assert mixed_items(n, d, WHOLE, FRAC) == items
+
+
+@pytest.fixture
+def header(tk_root):
+    import tkinter
+    from fraction_ui.host import shared_font
+    window = tkinter.Toplevel(tk_root)
+    header = TaskHeader(window, shared_font(16), height=80, width=400)
+    header.pack()
+    window.update()
+    yield header
+    window.destroy()
+
+
+def test_many_tasks_keep_one_configure_binding(header):
+    from fraction_ui.host import shared_font
+    font = shared_font(16)
+    for n in range(1, 101):
+        header.show(mixed_items(n, 7, font, font))
+    header.update()
+    assert len(header.bind("<Configure>").strip().splitlines()) == 1
+
+    draws = header.draws
+    header.configure(height=120)
+    header.update()
+    assert header.draws == draws + 1
+
+
+def test_resize_without_height_change_does_not_redraw(header):
+    from fraction_ui.host import shared_font
+    font = shared_font(16)
+    header.show(mixed_items(7, 3, font, font))
+    header.update()
+    draws = header.draws
+    header.configure(width=500)
+    header.update()
+    assert header.draws == draws
@@ -0,0 +1,84 @@
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from fraction_core import task_index, tasks
+from fraction_core.arithmetic import lcm
+
+
+def test_addition_index():
+    index = task_index.addition_index(30)
+    assert len(index) > 0
+    for n1, d1, n2, d2 in index.tasks:
+        assert d1 != d2 and d1 in task_index.ADDITION_DENOMINATORS and d2 in task_index.ADDITION_DENOMINATORS
+        assert 0 < n1 < d1 and 0 < n2 < d2 and lcm(d1, d2) <= 30
+    assert max(index.counts) <= 30
+    assert sum(index.counts.values()) == len(index)
+
+
+def test_subtraction_index_is_addition_without_negative_results():
+    tasks_ = task_index.subtraction_index(60).tasks
+    assert set(tasks_) <= set(task_index.addition_index(60).tasks)
+    assert all(Fraction(n1, d1) >= Fraction(n2, d2) for n1, d1, n2, d2 in tasks_)
+
+
+def test_mixed_subtraction_needs_borrowing():
+    for n1, d1, n2, d2 in task_index.mixed_subtraction_index().tasks:
+        assert Fraction(n1, d1) > Fraction(n2, d2)
+        common = lcm(d1, d2)
+        assert (n1 * common // d1) % common < (n2 * common // d2) % common or n1 // d1 < n2 // d2
+
+
+def test_reduction_index():
+    index = task_index.reduction_index(100)
+    for n_task, d_task, n_corr, d_corr in index.tasks:
+        assert math.gcd(n_corr, d_corr) == 1 and d_task <= 100
+        assert n_task * d_corr == n_corr * d_task
+    assert set(index.counts) == set(task_index.REDUCTION_MULTIPLIERS)
+
+
+def test_conversion_index():
+    index = task_index.conversion_index(10, 5, 59)
+    assert set(index.counts) == {task_index.MIXED_TO_IMPROPER, task_index.IMPROPER_TO_MIXED}
+    for task_type, whole, num, den, improper_num in index.tasks:
+        assert 0 < num < den <= 10 and whole * den + num == improper_num
+
+
+def test_draw_by_difficulty():
+    index = task_index.reduction_index(100)
+    rng = random.Random(3)
+    assert all(task_index.reduction_gcd(index.draw(rng, difficulty=4)) == 4 for _ in range(50))
+
+
+def test_draw_by_weights():
+    index = task_index.reduction_index(100)
+    rng = random.Random(3)
+    assert {task_index.reduction_gcd(index.draw(rng, weights={2: 1, 7: 1})) for _ in range(200)} == {2, 7}
+
+
+@pytest.mark.parametrize("weights", [{}, {2: 0}, {99: 1}])
+def test_draw_without_positive_weight_raises(weights):
+    with pytest.raises(ValueError, match="додатної ваги"):
+        task_index.reduction_index(100).draw(random.Random(0), weights=weights)
+
+
+def test_stream_yields_every_task_once():
+    index = task_index.mixed_addition_index()
+    streamed = list(index.stream(random.Random(0)))
+    assert sorted(streamed) == sorted(index.tasks)
+
+
+@pytest.mark.parametrize("generate, args, index", [
+    (tasks.addition_task, (100,), task_index.addition_index(100)),
+    (tasks.subtraction_task, (100,), task_index.subtraction_index(100)),
+    (tasks.mixed_addition_task, (), task_index.mixed_addition_index()),
+    (tasks.mixed_subtraction_task, (), task_index.mixed_subtraction_index()),
+    (tasks.reduction_task, (100,), task_index.reduction_index(100)),
+    (tasks.conversion_task, (10, 5, 59), task_index.conversion_index(10, 5, 59)),
+])
+def test_generators_draw_from_index(generate, args, index):
+    rng = random.Random(0)
+    allowed = set(index.tasks)
+    assert all(generate(*args, rng=rng) in allowed for _ in range(100))
@@ -0,0 +1,58 @@
+import csv
+import json
+import random
+from fractions import Fraction
+
+import pytest
+
+from fraction_core import worksheet
+
+SHEET = """n,family,task,answer
+1,addition,6/10 + 3/14,57/70
+2,addition,7/8 + 3/11,1 13/88
+3,reduction,16/36,4/9
+4,addition,1/5 + 1/11,16/55
+"""
+
+
+def test_csv_for_fixed_seed(capsys):
+    worksheet.main(["-n", "4", "--seed", "7", "--family", "addition", "--family", "reduction"])
+    assert capsys.readouterr().out == SHEET
+
+
+def test_output_file_format_from_extension(tmp_path):
+    path = tmp_path / "5a.jsonl"
+    worksheet.main(["-n", "5", "-o", str(path)])
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [row["n"] for row in rows] == [1, 2, 3, 4, 5]
+    assert all(row["family"] in worksheet.FAMILIES for row in rows)
+
+
+def test_repeated_family_does_not_change_weights():
+    lines = list(worksheet.worksheet_lines(["addition", "reduction"], 50, seed=3))
+    assert list(worksheet.worksheet_lines(["addition", "addition", "reduction"], 50, seed=3)) == lines
+
+
+def test_pdf_tasks_match_csv_sheet():
+    families = list(worksheet.FAMILIES)
+    rows = csv.DictReader(worksheet.worksheet_lines(families, 40, seed=5))
+    tasks = worksheet.sheet_tasks(families, 40, random.Random(5))
+    assert [(row["family"], row["task"], row["answer"]) for row in rows] == [
+        (family, text, answer) for family, task, text, answer in tasks]
+
+
+def mixed_value(text):
+    return sum(map(Fraction, text.split()))
+
+
+def test_answers_are_correct():
+    for family, task, text, answer in worksheet.sheet_tasks(["addition", "subtraction"], 200, random.Random(0)):
+        left, sign, right = text.split()
+        expected = Fraction(left) + Fraction(right) if sign == "+" else Fraction(left) - Fraction(right)
+        assert mixed_value(answer) == expected
+
+
+@pytest.mark.parametrize("text", ["-1", "три"])
+def test_count_must_be_non_negative_int(text):
+    with pytest.raises(SystemExit):
+        worksheet.main(["-n", text])
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from fraction_core.worksheet import FAMILIES, sheet_tasks
+from fraction_ui import worksheet_pdf
+
+
+def test_student_files_are_named_after_students(tmp_path):
+    jobs = worksheet_pdf.student_jobs(["Олена Іваненко", "Петро/Коваль", "Олена Іваненко"], ["addition"], 3, tmp_path)
+    assert [job[-1] for job in jobs] == [str(tmp_path / name) for name in (
+        "01 Олена Іваненко.pdf", "02 Петро_Коваль.pdf", "03 Олена Іваненко.pdf")]
+
+
+def test_neighbouring_seeds_do_not_share_students():
+    names = [f"Учень {i + 1}" for i in range(5)]
+    seeds = {job[1] for seed in (0, 1) for job in worksheet_pdf.student_jobs(names, ["addition"], 1, ".", seed)}
+    assert len(seeds) == 10
+
+
+def test_students_get_different_tasks():
+    first, second = (sheet_tasks(["addition"], 12, random.Random(job[1]))
+                     for job in worksheet_pdf.student_jobs(["А", "Б"], ["addition"], 12, "."))
+    assert first != second
+
+
+def test_main_writes_one_pdf_per_student(tmp_path, capsys):
+    names = tmp_path / "names.txt"
+    names.write_text("Олена\n\nПетро\n", encoding="utf-8")
+    out = tmp_path / "pdf"
+    worksheet_pdf.main(["--names", str(names), "-n", "13", "--family", "reduction", "--workers", "1",
+                        "-o", str(out)])
+    assert sorted(path.name for path in out.iterdir()) == ["01 Олена.pdf", "02 Петро.pdf"]
+    assert all(path.read_bytes().startswith(b"%PDF") for path in out.iterdir())
+    # 13 завдань — дві сторінки завдань і дві сторінки відповідей
+    assert capsys.readouterr().out == f"2 PDF, 8 сторінок у {out}\n"
+
+
+@pytest.mark.parametrize("count", ["0", "-3"])
+def test_main_rejects_empty_sheets(tmp_path, count):
+    with pytest.raises(SystemExit):
+        worksheet_pdf.main(["--students", "1", "-n", count, "-o", str(tmp_path)])
+    assert not list(tmp_path.iterdir())
+
+
+def test_every_family_draws(tmp_path):
+    path = tmp_path / "all.pdf"
+    pages = worksheet_pdf.render_student(("Учень", 0, list(FAMILIES), worksheet_pdf.TASKS_PER_PAGE + 1, path))
+    assert pages == 4 and path.stat().st_size > 0
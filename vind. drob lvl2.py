@@ -1,96 +1,43 @@
 import tkinter as tk
-from tkinter import ttk, font
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.gridspec as gridspec
-import numpy as np
-import math
-import random
-from collections import Counter
+from tkinter import ttk
 import re
-
-
-class SolutionWindow(tk.Toplevel):
+from fraction_core.checking import check_mixed_subtraction, mixed_result
+from fraction_core.solutions import mixed_subtraction_solution, prefetch
+from fraction_core.streams import session_stream
+from fraction_core.tasks import mixed_subtraction_task
+from fraction_ui.host import TrainerWindow, install_styles, shared_font
+from fraction_ui.scheduler import RenderScheduler
+from fraction_ui.solution_layout import Gap, Run, fraction_items
+from fraction_ui.solution_view import VirtualSolutionWindow
+from fraction_ui.task_header import TaskHeader, mixed_items
+
+
+class SolutionWindow(VirtualSolutionWindow):
     """Окреме, повністю функціональне вікно для показу рішення"""
 
     def __init__(self, parent, solution_steps):
-        super().__init__(parent)
-        self.title("Рішення завдання")
-        self.geometry("800x600")
-
-        self.font_explanation = font.Font(family="Helvetica", size=18)
-        self.font_title = font.Font(family="Helvetica", size=20, weight="bold")
-        self.font_frac = font.Font(family="Helvetica", size=22, weight="bold")
-
-        main_canvas = tk.Canvas(self)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=main_canvas.yview)
-        scrollable_frame = ttk.Frame(main_canvas)
-
-        scrollable_frame.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
-        main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
-
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        row_counter = 0
-        for style, text in solution_steps:
-            frame = ttk.LabelFrame(scrollable_frame, padding=15)
-            frame.grid(row=row_counter, column=0, sticky="ew", pady=10, padx=10)
-            scrollable_frame.columnconfigure(0, weight=1)
-            row_counter += 1
-
-            lines = text.split('\n')
-            title_label = ttk.Label(frame, text=lines[0],
-                                    font=self.font_title if style == "bold" else self.font_explanation)
-            title_label.pack(anchor="w")
-
-            for line in lines[1:]:
-                if "->" in line:
-                    parts = line.split("->")
-                    frac_frame = ttk.Frame(frame)
-                    frac_frame.pack(anchor="w", pady=10)
-                    for i, part in enumerate(parts):
-                        if i > 0:
-                            ttk.Label(frac_frame, text="  ->  ", font=self.font_frac).pack(side=tk.LEFT, padx=10)
-                        self.draw_fraction_expression(frac_frame, part.strip())
-                else:
-                    line_label = ttk.Label(frame, text=line, font=self.font_explanation, wraplength=700)
-                    line_label.pack(anchor="w", pady=2)
-                    frame.bind("<Configure>", lambda e, lbl=line_label: lbl.config(wraplength=e.width - 40))
-
-    def draw_fraction_expression(self, parent, expression):
-        tokens = re.split(r'(\s[+-]\s|=)', expression)
-        for token in tokens:
+        super().__init__(parent, solution_steps, shared_font(18), shared_font(20, "bold"),
+                         shared_font(22, "bold"))
+
+    def expression_items(self, expression):
+        # Використовуємо регулярний вираз для коректного розділення дробів та операторів
+        items = []
+        for token in re.split(r'(\s[+-]\s|=)', expression):
             token = token.strip()
-            if not token: continue
+            if not token:
+                continue
             if "/" in token:
-                try:
-                    if ' ' in token:
-                        whole_part, frac_part = token.split(' ')
-                        n_str, d_str = frac_part.split('/')
-                        whole_label = ttk.Label(parent, text=f"{whole_part}", font=self.font_frac)
-                        whole_label.pack(side=tk.LEFT, padx=(0, 5))
-                    else:
-                        n_str, d_str = token.replace('(', '').replace(')', '').split('/')
-                except ValueError:
-                    ttk.Label(parent, text=token, font=self.font_frac).pack(side=tk.LEFT)
-                    continue
-                canvas = tk.Canvas(parent, height=60, bg=self.cget('bg'), highlightthickness=0)
-                canvas.pack(side=tk.LEFT)
-                n_w, d_w = self.font_frac.measure(n_str), self.font_frac.measure(str(d_str))
-                max_w = max(n_w, d_w) + 10
-                canvas.config(width=max_w)
-                canvas.create_text(max_w / 2, 15, text=n_str, font=self.font_frac, anchor="center")
-                canvas.create_line(2, 30, max_w - 2, 30, width=3)
-                canvas.create_text(max_w / 2, 45, text=d_str, font=self.font_frac, anchor="center")
+                # Дріб або мішане число "w n/d"
+                items += fraction_items(token, self.font_frac)
             else:
-                ttk.Label(parent, text=f" {token} ", font=self.font_frac).pack(side=tk.LEFT)
+                # Це оператор
+                items.append(Run(f" {token} ", self.font_frac))
+        return items
 
 
-class FractionVisualizerApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
+class FractionVisualizerApp(TrainerWindow):
+    def __init__(self, master=None):
+        super().__init__(master)
         self.title("Інтерактивний тренажер: Віднімання (Ручне перетворення)")
         try:
             self.state('zoomed')
@@ -98,23 +45,19 @@ class FractionVisualizerApp(tk.Tk):
             self.attributes('-zoomed', True)
 
         self.MAX_CIRCLES = 4
+        # Відтворювана послідовність завдань (FRACTIONS_SEED, FRACTIONS_TASK)
+        self.task_stream = session_stream(mixed_subtraction_task)
         self.MAX_SLIDER_VAL = 100
         self.color1, self.color2, self.empty_color = 'deepskyblue', 'salmon', '#E0E0E0'
         self.task_n1, self.task_d1, self.task_n2, self.task_d2 = 0, 1, 0, 1  # Numerators and Denominators for the task
         self.correct_result_n, self.correct_result_d = 0, 1  # Final correct result
 
-        self.font_body = font.Font(family="Helvetica", size=16)
-        self.font_title = font.Font(family="Helvetica", size=18, weight="bold")
-        self.font_slider_value = font.Font(family="Helvetica", size=17, weight="bold")
-        self.font_success = font.Font(family="Helvetica", size=18, weight="bold")
+        self.font_body = shared_font(16)
+        self.font_title = shared_font(18, "bold")
+        self.font_slider_value = shared_font(17, "bold")
+        self.font_success = shared_font(18, "bold")
 
-        self.style = ttk.Style(self)
-        self.style.configure("TLabel", font=self.font_body)
-        self.style.configure("TButton", font=self.font_body, padding=10)
-        self.style.configure("TScale", length=300)
-        self.style.configure("Title.TLabel", font=self.font_title)
-        self.style.configure("Success.TLabel", font=self.font_success, foreground="green")
-        self.style.configure("Error.TLabel", font=self.font_success, foreground="red")
+        self.style = install_styles(self)
 
         self.whole1_var = tk.IntVar()
         self.num1_var = tk.IntVar()
@@ -135,8 +78,9 @@ class FractionVisualizerApp(tk.Tk):
 
         task_frame = ttk.Frame(top_pane_frame)
         task_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
-        self.task_canvas = tk.Canvas(task_frame, height=70)
-        self.task_canvas.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.task_header = TaskHeader(task_frame, self.font_body, prefix_gap=20, offset=12, line_width=2.5,
+                                      height=70)
+        self.task_header.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         toolbar_frame = ttk.Frame(task_frame)
         toolbar_frame.pack(side=tk.LEFT, padx=20)
@@ -158,11 +102,24 @@ class FractionVisualizerApp(tk.Tk):
 
         plot_frame = ttk.Frame(main_pane)
         main_pane.add(plot_frame, weight=7)
-        self.figure = plt.figure(figsize=(12, 6), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.figure, plot_frame)
-        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Фігура з'явиться в _create_figure, коли matplotlib завантажиться у фоні
+        self.plot_frame, self.figure = plot_frame, None
+        self.plot_axes, self.circle_views = None, {}
+        self.render_scheduler = RenderScheduler(self, self._render, profiler=self.profiler)
 
         self._generate_new_task()
+        self.load_plotting()
+
+    def _create_figure(self):
+        self.figure = self.plot.Figure(figsize=(12, 6), dpi=100)
+        self.canvas = self.plot.FigureCanvasTkAgg(self.figure, self.plot_frame)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.blitter = self.plot.BlitManager(self.canvas)
+        self.title_cache = self.plot.title_cache
+        self.layout_cache = self.plot.LayoutCache(self.figure, pad=2.0)
+        self.frames = self.plot.FrameManager(self.blitter, self.layout_cache, profiler=self.profiler)
+        self.layout_cache.bind_configure(self.canvas.get_tk_widget())
+        self.render_scheduler.request()
 
     def _create_fraction_controls(self, parent, title, whole_var, num_var, den_var, col):
         frame = ttk.Frame(parent)
@@ -231,63 +188,22 @@ class FractionVisualizerApp(tk.Tk):
         if self.whole1_var.get() < 0: self.whole1_var.set(0)
         if self.whole2_var.get() < 0: self.whole2_var.set(0)
 
-        self.visualize()
-        self._check_user_answer()  # Check the answer on every change
+        self.render_scheduler.request()  # Coalesced: visualize + check the answer once per idle cycle
+
+    def _render(self):
+        if self.figure is None:  # графіка ще завантажується
+            return
+        # Візуалізація й перевірка відповіді — один кадр з одним малюванням
+        with self.frames.frame("render"):
+            self.visualize()
+            self._check_user_answer()  # Check the answer on every change
 
     def _generate_new_task(self):
-        # Generate d1, d2 that are different for a real challenge
-        while True:
-            d1 = random.randint(3, 8)
-            d2 = random.randint(3, 8)
-            if d1 != d2:  # We want different denominators for this task type
-                break
-
-        # Generate whole1 and frac_n1
-        whole1 = random.randint(1, 3)
-        frac_n1 = random.randint(1, d1 - 1)
-        n1 = whole1 * d1 + frac_n1  # Store as improper fraction for internal calculation
-
-        # Generate whole2 and frac_n2 such that n1/d1 > n2/d2
-        while True:
-            whole2 = random.randint(0, whole1)
-            frac_n2 = random.randint(1, d2 - 1)  # Ensure frac_n2 is positive
-            n2 = whole2 * d2 + frac_n2  # Store as improper fraction
-
-            # Check if n1/d1 is greater than n2/d2
-            if (n1 * d2) > (n2 * d1):
-                # We need to make sure that the subtraction will require borrowing or common denominator
-                # For this exercise, we enforce d1 != d2 (already done)
-                # And we need to ensure either initial n1 < n2 after common denominator OR w1 < w2 for user action
-                # Let's calculate the target values for borrowing check
-                lcm = (d1 * d2) // math.gcd(d1, d2)
-                temp_n1_lcm = (whole1 * d1 + frac_n1) * (lcm // d1)
-                temp_n2_lcm = (whole2 * d2 + frac_n2) * (lcm // d2)
-
-                temp_w1, temp_f_n1 = divmod(temp_n1_lcm, lcm)
-                temp_w2, temp_f_n2 = divmod(temp_n2_lcm, lcm)
-
-                if temp_w1 < temp_w2 or temp_f_n1 < temp_f_n2:  # Task requires borrowing or common denominator
-                    break
-
-        self._load_state((n1, d1, n2, d2))
-        self._calculate_correct_result(n1, d1, n2, d2)
-
-    def _calculate_correct_result(self, n1_orig, d1_orig, n2_orig, d2_orig):
-        """Calculates the final correct simplified result of the task."""
-        lcm = (d1_orig * d2_orig) // math.gcd(d1_orig, d2_orig)
-
-        # Convert to improper fractions with common denominator
-        common_n1 = n1_orig * (lcm // d1_orig)
-        common_n2 = n2_orig * (lcm // d2_orig)
-
-        # Perform subtraction
-        result_n_improper = common_n1 - common_n2
-        result_d = lcm
-
-        # Simplify the result
-        common_divisor = math.gcd(result_n_improper, result_d)
-        self.correct_result_n = result_n_improper // common_divisor
-        self.correct_result_d = result_d // common_divisor
+        state = next(self.task_stream)
+        # Кроки рішення будуються у фоні, поки учень розв'язує
+        prefetch(mixed_subtraction_solution, *state)
+        self._load_state(state)
+        self.correct_result_n, self.correct_result_d = mixed_result(*state, subtract=True)
 
     def _load_state(self, state):
         self._set_controls_state(tk.NORMAL)
@@ -311,53 +227,9 @@ class FractionVisualizerApp(tk.Tk):
         self._on_slider_change()  # This will trigger visualize and check_user_answer
 
     def _update_task_display(self, n1, d1, n2, d2):
-        self.task_canvas.delete("all")
-        self.task_canvas.bind("<Configure>", lambda e: self._draw_task_fractions(n1, d1, n2, d2), add="+")
-        self.update_idletasks()
-        self._draw_task_fractions(n1, d1, n2, d2)
-
-    def _draw_task_fractions(self, n1, d1, n2, d2):
-        self.task_canvas.delete("all")
-        canvas_w, canvas_h = self.task_canvas.winfo_width(), self.task_canvas.winfo_height()
-        if canvas_w < 50: return
-
-        font_whole = font.Font(family="Helvetica", size=30, weight="bold")
-        font_frac = font.Font(family="Helvetica", size=18, weight="bold")
-
-        prefix_text = "Завдання: "
-        prefix_len = font.Font(font=self.font_body).measure(prefix_text)
-        self.task_canvas.create_text(10, canvas_h / 2, text=prefix_text, font=self.font_body, anchor="w", fill="navy")
-        x_pos = prefix_len + 20
-
-        def draw_frac(n, d, x):
-            if d == 0: return x
-            whole, frac_n = divmod(n, d)
-
-            if whole > 0:
-                whole_str = str(whole)
-                whole_w = font_whole.measure(whole_str)
-                self.task_canvas.create_text(x + whole_w / 2, canvas_h / 2, text=whole_str, font=font_whole,
-                                             anchor="center")
-                x += whole_w + 5
-
-            if frac_n > 0 or (whole == 0 and n >= 0 and d != 0):  # Display 0/d if whole is 0 and frac_n is 0
-                n_str, d_str = str(frac_n), str(d)
-                n_w, d_w = font_frac.measure(n_str), font_frac.measure(d_str)
-                max_w = max(n_w, d_w) + 10
-
-                self.task_canvas.create_text(x + max_w / 2, canvas_h / 2 - 12, text=n_str, font=font_frac,
-                                             anchor="center")
-                self.task_canvas.create_line(x, canvas_h / 2, x + max_w, canvas_h / 2, width=2.5)
-                self.task_canvas.create_text(x + max_w / 2, canvas_h / 2 + 12, text=d_str, font=font_frac,
-                                             anchor="center")
-                x += max_w
-
-            return x + 30
-
-        x_pos = draw_frac(n1, d1, x_pos)
-        self.task_canvas.create_text(x_pos, canvas_h / 2, text="-", font=font_whole, anchor="center")
-        x_pos += 30
-        x_pos = draw_frac(n2, d2, x_pos)
+        font_whole, font_frac = shared_font(30, "bold"), shared_font(18, "bold")
+        self.task_header.show(mixed_items(n1, d1, font_whole, font_frac) + [Gap(20), Run("-", font_whole), Gap(20)]
+                              + mixed_items(n2, d2, font_whole, font_frac))
 
     def _set_controls_state(self, state):
         for ctrl_group in [self.controls1, self.controls2]:
@@ -369,7 +241,6 @@ class FractionVisualizerApp(tk.Tk):
                     widgets['scale'].config(state=state)
 
     def visualize(self):
-        self.figure.clear()
         w1, n1, d1 = self.whole1_var.get(), self.num1_var.get(), self.den1_var.get()
         w2, n2, d2 = self.whole2_var.get(), self.num2_var.get(), self.den2_var.get()
 
@@ -377,125 +248,60 @@ class FractionVisualizerApp(tk.Tk):
         total_n1 = w1 * d1 + n1 if d1 != 0 else n1
         total_n2 = w2 * d2 + n2 if d2 != 0 else n2
 
-        gs_main = gridspec.GridSpec(2, 3, figure=self.figure, height_ratios=[1, 9], hspace=0.1)
-        ax_title1, ax_title2, ax_title3 = (self.figure.add_subplot(gs_main[0, i], facecolor='none') for i in range(3))
-        for ax in [ax_title1, ax_title2, ax_title3]: ax.axis('off')
+        ax_title1, ax_title2, ax_title3, ax1, ax2, ax3 = self._get_plot_axes()
 
-        ax_title1.set_title(self.format_user_input_title("Зменшуване", w1, n1, d1), fontsize=18)
-        ax_title2.set_title(self.format_user_input_title("Від'ємник", w2, n2, d2), fontsize=18)
-        ax_title3.set_title("Різниця", fontsize=18)  # Default title
+        self.title_cache.set(ax_title1.title, self.format_user_input_title("Зменшуване", w1, n1, d1))
+        self.title_cache.set(ax_title2.title, self.format_user_input_title("Від'ємник", w2, n2, d2))
+        self.title_cache.set(ax_title3.title, "Різниця")  # Default title
 
-        ax1, ax2, ax3 = (self.figure.add_subplot(gs_main[1, i]) for i in range(3))
         self._draw_overlapping_circles(ax1, total_n1, d1, self.color1)
         self._draw_overlapping_circles(ax2, total_n2, d2, self.color2)
 
         # Draw placeholder for the result initially
         self.draw_placeholder(ax3, "Введіть розв'язок")
-
-        self.figure.tight_layout(pad=2.0)
-        self.canvas.draw()
+        self._hide_circles(ax3)
+
+        self.frames.present()
+
+    def _get_plot_axes(self):
+        """Осі заголовків і кіл створюються один раз, далі змінюються лише художники на них."""
+        if self.plot_axes is None:
+            gs_main = self.plot.gridspec.GridSpec(2, 3, figure=self.figure, height_ratios=[1, 9], hspace=0.1)
+            title_axes = [self.figure.add_subplot(gs_main[0, i], facecolor='none') for i in range(3)]
+            for ax in title_axes:
+                ax.axis('off')
+                ax.set_title("", fontsize=18)
+            circle_axes = [self.figure.add_subplot(gs_main[1, i]) for i in range(3)]
+            for ax in circle_axes:
+                ax.axis('off')
+                ax.set_aspect('equal', adjustable='box')
+                self.circle_views[ax] = {
+                    'pies': self.plot.PiePool(ax, factory=self.plot.make_pie, empty_color=self.empty_color,
+                                              max_wedges=2, wedgeprops={'linewidth': 0.8}),
+                    'value': ax.text(0, 0, "", ha='center', va='top', fontsize=16, color='gray', visible=False),
+                    'placeholder': None,
+                }
+            self.plot_axes = (*title_axes, *circle_axes)
+            for ax in self.plot_axes:
+                self.blitter.register(ax)
+        return self.plot_axes
 
     def _check_user_answer(self):
-        self.result_status_var.set("")  # Clear previous status
-        self.result_status_label.config(style="Success.TLabel")  # Reset style
-
-        w1_user, n1_user, d1_user = self.whole1_var.get(), self.num1_var.get(), self.den1_var.get()
-        w2_user, n2_user, d2_user = self.whole2_var.get(), self.num2_var.get(), self.den2_var.get()
-
-        # Handle division by zero for user input
-        if d1_user == 0 or d2_user == 0:
-            self.result_status_var.set("Знаменник не може бути нулем!")
-            self.result_status_label.config(style="Error.TLabel")
-            return
-
-        # Step 1: Check if denominators are equal
-        if d1_user != d2_user:
-            self.result_status_var.set("Зведіть до спільного знаменника!")
-            self.result_status_label.config(style="Error.TLabel")
+        user_input = (self.whole1_var.get(), self.num1_var.get(), self.den1_var.get(),
+                      self.whole2_var.get(), self.num2_var.get(), self.den2_var.get())
+        correct = (self.correct_result_n, self.correct_result_d)
+        is_correct, message = check_mixed_subtraction(correct, *user_input)
+        self.result_status_var.set(message)
+        self.result_status_label.config(style="Success.TLabel" if is_correct else "Error.TLabel")
+        if not is_correct:
             return
 
-        # Now, d1_user == d2_user. Let's call it common_d
-        common_d = d1_user
-
-        # Create temporary working copies for subtraction logic
-        temp_w1 = w1_user
-        temp_n1 = n1_user
-        temp_w2 = w2_user
-        temp_n2 = n2_user
-
-        # Step 2: Check if whole part of minuend is sufficient
-        if temp_w1 < temp_w2:
-            self.result_status_var.set("Ціла частина зменшуваного менша!")
-            self.result_status_label.config(style="Error.TLabel")
-            return
-
-        # Step 3: Check if fractional part of minuend is sufficient, and "borrow" if needed
-        if temp_n1 < temp_n2:
-            # We want to guide the user to manually perform the borrow.
-            # If temp_w1 > 0, they *can* borrow.
-            # We assume user will perform: temp_w1 -= 1 and temp_n1 += common_d.
-            # If their current slider values reflect this (or are one step towards it),
-            # then we allow. Otherwise, we prompt them.
-
-            # Condition to check if borrowing *is necessary* and *possible*
-            if w1_user > 0:
-                # Calculate what w1 and n1 *should be* after one borrow
-                expected_w1_after_borrow = w1_user - 1
-                expected_n1_after_borrow = n1_user + common_d
-
-                # If the user has NOT adjusted their sliders to reflect this specific borrow,
-                # then we tell them to perform the borrow.
-                # This makes the validation step-by-step.
-                if not (self.whole1_var.get() == expected_w1_after_borrow and \
-                        self.num1_var.get() == expected_n1_after_borrow):
-                    self.result_status_var.set("Дріб менший. 'Позичте' одиницю від цілої частини!")
-                    self.result_status_label.config(style="Error.TLabel")
-                    return
-                # If they *have* adjusted, then temp_w1 and temp_n1 already reflect the borrow,
-                # and the check `temp_n1 < temp_n2` should no longer be true (if they borrowed correctly).
-                # If it's still true, it means even after borrowing, the fractional part is insufficient
-                # (which shouldn't happen in correctly generated tasks, but good to have a fallback).
-                else:
-                    self.result_status_var.set("Позичте достатньо одиниць або перевірте розрахунки!")
-                    self.result_status_label.config(style="Error.TLabel")
-                    return
-            else:  # Cannot borrow (whole part is 0) and n1 < n2
-                self.result_status_var.set("Дробова частина зменшуваного менша, немає цілих для позичання!")
-                self.result_status_label.config(style="Error.TLabel")
-                return
-
-        # If we reached here, subtraction is possible based on user's current values
-        # Calculate the user's intended result
-        user_result_w = temp_w1 - temp_w2
-        user_result_n = temp_n1 - temp_n2
-        user_result_d = common_d
-
-        # Convert user's result to an improper fraction and simplify
-        user_total_n_improper = user_result_w * user_result_d + user_result_n
-        common_divisor_user = math.gcd(user_total_n_improper, user_result_d)
-        simplified_user_n = user_total_n_improper // common_divisor_user
-        simplified_user_d = user_result_d // common_divisor_user
-
-        # Compare with the pre-calculated correct result
-        if simplified_user_n == self.correct_result_n and simplified_user_d == self.correct_result_d:
-            self.result_status_var.set("✔ ВІДМІННО! Рішення правильне.")
-            self.result_status_label.config(style="Success.TLabel")
-            self._set_controls_state(tk.DISABLED)
-
-            # Now, visualize the correct result in the third plot
-            gs_main = gridspec.GridSpec(2, 3, figure=self.figure, height_ratios=[1, 9], hspace=0.1)
-            ax_title3 = self.figure.add_subplot(gs_main[0, 2], facecolor='none')
-            ax_title3.axis('off')
-
-            ax3 = self.figure.add_subplot(gs_main[1, 2])
-            # It's important to draw the simplified fraction (self.correct_result_n, self.correct_result_d)
-            # for the visual representation to be accurate.
-            self._draw_overlapping_circles(ax3, self.correct_result_n, self.correct_result_d, self.color1)
-            self.canvas.draw()  # Redraw the result plot specifically
-        else:
-            # If denominators are equal, and borrowing conditions met, but the final answer is wrong
-            self.result_status_var.set("Рішення невірне. Перевірте обчислення!")
-            self.result_status_label.config(style="Error.TLabel")
+        self._set_controls_state(tk.DISABLED)
+        # Правильний результат остаточно показуємо на третьому графіку
+        ax_title3, ax3 = self.plot_axes[2], self.plot_axes[5]
+        self.plot.set_artists_visible([self.circle_views[ax3]['placeholder']], False)
+        self._draw_overlapping_circles(ax3, self.correct_result_n, self.correct_result_d, self.color1)
+        self.frames.present()
 
     def format_user_input_title(self, base_title, w, n, d):
         if d == 0: return base_title  # Avoid division by zero in title rendering
@@ -517,89 +323,48 @@ class FractionVisualizerApp(tk.Tk):
         return f"{base_title}\n{whole_str}{frac_str}"
 
     def _draw_overlapping_circles(self, ax, n, d, color):
-        ax.axis('off');
-        ax.set_aspect('equal', adjustable='box')
-        if d == 0: return
+        view = self.circle_views[ax]
+        if d == 0:
+            self._hide_circles(ax)
+            return
         whole, frac_n = divmod(n, d)
         total_circles = whole + (1 if frac_n > 0 else 0)
-        if total_circles == 0 and n == 0: self.draw_fraction_pie(ax, [0], [color], d, center=(0, 0)); return
+        if total_circles == 0 and n == 0:
+            # Одне пусте коло без підпису і з межами, які лишав ax.pie
+            view['pies'].show([([0], [color], d, (0, 0), 2.2)])
+            self.plot.set_artists_visible([view['value']], False)
+            ax.set_xlim(-1.25, 1.25)
+            ax.set_ylim(-1.25, 1.25)
+            return
 
         radius = 1.0;
         overlap = 0.65;
-        step = 2 * radius * overlap
-        actual_width = (total_circles - 1) * step + 2 * radius if total_circles > 0 else 0
-        max_width = (self.MAX_CIRCLES - 1) * step + 2 * radius
-
-        start_x = -actual_width / 2 + radius
-        for i in range(whole):
-            self.draw_fraction_pie(ax, [d], [color], d, center=(start_x + i * step, 0), radius=radius)
-        if frac_n > 0:
-            self.draw_fraction_pie(ax, [frac_n], [color], d, center=(start_x + whole * step, 0), radius=radius)
+        max_width = self.plot.overlapping_width(self.MAX_CIRCLES, radius, overlap)
+        view['pies'].show(self.plot.overlapping_pies(n, d, color, radius, overlap))
 
-        if d > 0:
-            val = round(n / d, 3)
-            ax.text(0, -radius - 1.0, f"≈ {val}", ha='center', va='top', fontsize=16, color='gray')
+        val = round(n / d, 3)
+        view['value'].set_text(f"≈ {val}")
+        view['value'].set_position((0, -radius - 1.0))
+        self.plot.set_artists_visible([view['value']], True)
 
         ax.set_xlim(-max_width / 2 - 0.2, max_width / 2 + 0.2);
         ax.set_ylim(-radius - 1.4, radius + 0.2)
 
-    def _build_solution_for_task(self):
-        n1, d1, n2, d2 = self.task_n1, self.task_d1, self.task_n2, self.task_d2
-        self.solution_steps = []
-        w1, f_n1 = divmod(n1, d1);
-        w2, f_n2 = divmod(n2, d2)
+    def _hide_circles(self, ax):
+        view = self.circle_views[ax]
+        view['pies'].show([])
+        self.plot.set_artists_visible([view['value']], False)
 
-        self.solution_steps.append(("bold", "--- КРОК 1: ЗВЕДЕННЯ ДО СПІЛЬНОГО ЗНАМЕННИКА ---"))
-        lcm = (d1 * d2) // math.gcd(d1, d2)
-        new_f_n1, new_f_n2 = f_n1 * (lcm // d1), f_n2 * (lcm // d2)
-        self.solution_steps.append(("normal",
-                                    f"НСК для {d1} і {d2} є {lcm}.\n{w1} {f_n1}/{d1} - {w2} {f_n2}/{d2} -> {w1} {new_f_n1}/{lcm} - {w2} {new_f_n2}/{lcm}"))
-
-        if new_f_n1 < new_f_n2:
-            self.solution_steps.append(("bold", "--- КРОК 2: 'ПОЗИЧАННЯ' ОДИНИЦІ ---"))
-            self.solution_steps.append(("normal",
-                                        f"Оскільки {new_f_n1} < {new_f_n2}, позичаємо 1 від цілої частини ({w1}).\n1 = {lcm}/{lcm}."))
-            w1 -= 1;
-            new_f_n1 += lcm
-            self.solution_steps.append(("normal", f"Отримуємо: {w1} і ({new_f_n1}/{lcm})"))
-
-        final_w, final_f_n = w1 - w2, new_f_n1 - new_f_n2
-        self.solution_steps.append(("bold", "--- КРОК 3: ВІДНІМАННЯ ---"))
-        self.solution_steps.append(("normal",
-                                    f"1. Цілі частини: {w1} - {w2} = {final_w}\n2. Дробові частини: ({new_f_n1}/{lcm}) - ({new_f_n2}/{lcm}) = ({final_f_n}/{lcm})"))
-
-        final_n = final_w * lcm + final_f_n
-        final_d = lcm
-        common_divisor = math.gcd(final_n, final_d)
-        if common_divisor > 1 and final_n != 0:
-            self.solution_steps.append(("bold", "--- КРОК 4: СКОРОЧЕННЯ ---"))
-            reduced_n, reduced_d = final_n // common_divisor, final_d // common_divisor
-            self.solution_steps.append(("normal",
-                                        f"Перетворимо результат {final_w} {final_f_n}/{lcm} на неправильний дріб {final_n}/{lcm} і скоротимо його:\n({final_n}/{lcm}) -> ({reduced_n}/{reduced_d})"))
-            final_n, final_d = reduced_n, reduced_d
-
-        if final_n >= final_d and final_d != 0:
-            rw, rn = divmod(final_n, final_d)
-            self.solution_steps.append(("bold", f"Кінцева відповідь: {rw} {rn}/{final_d}" if rn > 0 else str(rw)))
-        else:
-            self.solution_steps.append(("bold", f"Кінцева відповідь: {final_n}/{final_d}"))
-
-    def draw_fraction_pie(self, ax, numerators, colors, denominator, center=(0, 0), radius=1.0):
-        sizes, final_colors = [], []
-        total_num = sum(numerators)
-        if total_num > 0:
-            sizes.extend([n for n in numerators if n > 0]);
-            final_colors.extend(colors[:len(sizes)])
-        if denominator - total_num > 0:
-            sizes.append(denominator - total_num);
-            final_colors.append(self.empty_color)
-        if not sizes: sizes, final_colors = [1], [self.empty_color]
-        ax.pie(sizes, radius=radius * 2.2, center=center, colors=final_colors, startangle=90, counterclock=False,
-               wedgeprops={'edgecolor': 'black', 'linewidth': 0.8})
+    def _build_solution_for_task(self):
+        self.solution_steps = mixed_subtraction_solution(self.task_n1, self.task_d1, self.task_n2, self.task_d2)
 
     def draw_placeholder(self, ax, text):
-        ax.axis('off')
-        ax.text(0.5, 0.5, text, ha='center', va='center', fontsize=20, color='grey', transform=ax.transAxes, wrap=True)
+        view = self.circle_views[ax]
+        if view['placeholder'] is None:
+            view['placeholder'] = ax.text(0.5, 0.5, text, ha='center', va='center', fontsize=20, color='grey',
+                                          transform=ax.transAxes, wrap=True)
+        view['placeholder'].set_text(text)
+        self.plot.set_artists_visible([view['placeholder']], True)
 
     def _open_solution_window(self):
         self._build_solution_for_task()